@@ -0,0 +1,140 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Packs the bundled models into one file of ready-to-use arrays.
+
+Layout of a pack file:
+    8 bytes     magic (b"CSRPACK1")
+    4 bytes     little endian uint32 length of the JSON header
+    N bytes     JSON header: {"format": 1, "entries": {filename: {"vertices": [offset, count], ...}}}
+    data        16 byte aligned blocks of float32 vertices (count x 3), int32 faces (count x 3)
+                and float32 unit face normals (count x 3), at the offsets given in the header.
+
+Vertices are already deduplicated and everything is in the model's own coordinates,
+so loading an entry is just slicing a memory map.
+
+This module only needs numpy at runtime. Building a pack also needs trimesh.
+"""
+
+import json
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+
+PACK_MAGIC = b"CSRPACK1"
+PACK_FORMAT = 1
+PACK_FILENAME = "calibration_shapes.pack"
+# Subdirectory of models/ with the reduced detail versions made by tools/decimate_models.py
+REDUCED_MODELS_DIR = "reduced"
+
+_ALIGNMENT = 16
+_ARRAY_TYPES = {
+    "vertices": numpy.float32,
+    "faces": numpy.int32,
+    "normals": numpy.float32,
+}
+
+
+class AssetPack:
+    """Read-only access to a pack file. The file is opened on first use."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._entries = None  # type: Optional[Dict[str, Dict[str, list]]]
+        self._data = None  # type: Optional[numpy.memmap]
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        with self._lock:
+            if self._entries is None:
+                self._read_header()
+
+    def _read_header(self) -> None:
+        self._entries = {}
+        if not os.path.isfile(self._path):
+            return
+        with open(self._path, "rb") as pack_file:
+            if pack_file.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                raise ValueError(f"{self._path} is not a model pack")
+            header_length, = struct.unpack("<I", pack_file.read(4))
+            header = json.loads(pack_file.read(header_length).decode("utf-8"))
+        if header.get("format") != PACK_FORMAT:
+            raise ValueError(f"{self._path} has unsupported pack format {header.get('format')}")
+        self._data = numpy.memmap(self._path, dtype=numpy.uint8, mode="r")
+        self._entries = header["entries"]
+
+    def __contains__(self, filename: str) -> bool:
+        self._open()
+        return filename in self._entries
+
+    def get(self, filename: str) -> Optional[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+        """Returns read-only (vertices, faces, face_normals) views for filename, or None if it isn't packed."""
+        self._open()
+        entry = self._entries.get(filename)
+        if entry is None:
+            return None
+        return tuple(self._view(entry[name], dtype) for name, dtype in _ARRAY_TYPES.items())
+
+    def _view(self, location: list, dtype) -> numpy.ndarray:
+        offset, count = location
+        size = count * 3 * numpy.dtype(dtype).itemsize
+        return self._data[offset:offset + size].view(dtype).reshape(-1, 3)
+
+
+def build_pack(models_dir: str, output_path: str) -> Dict[str, int]:
+    """Loads every STL in models_dir and writes them all to a pack at output_path.
+    Returns the triangle count of each packed file."""
+    import trimesh
+
+    arrays = {}
+    for filename in _model_filenames(models_dir):
+        mesh = trimesh.load(os.path.join(models_dir, *filename.split("/")))
+        arrays[filename] = {
+            "vertices": numpy.ascontiguousarray(mesh.vertices, dtype=numpy.float32),
+            "faces": numpy.ascontiguousarray(mesh.faces, dtype=numpy.int32),
+            "normals": numpy.ascontiguousarray(mesh.face_normals, dtype=numpy.float32),
+        }
+
+    # The header holds absolute offsets, which depend on the header's own length.
+    # Lay everything out against a guessed header length until it settles.
+    header_length = 0
+    while True:
+        offset = _align(len(PACK_MAGIC) + 4 + header_length)
+        entries = {}
+        for filename, entry_arrays in arrays.items():
+            entries[filename] = {}
+            for name, array in entry_arrays.items():
+                entries[filename][name] = [offset, len(array)]
+                offset = _align(offset + array.nbytes)
+        header = json.dumps({"format": PACK_FORMAT, "entries": entries}, separators=(",", ":")).encode("utf-8")
+        if len(header) == header_length:
+            break
+        header_length = len(header)
+
+    with open(output_path, "wb") as pack_file:
+        pack_file.write(PACK_MAGIC)
+        pack_file.write(struct.pack("<I", len(header)))
+        pack_file.write(header)
+        for filename, entry_arrays in arrays.items():
+            for name, array in entry_arrays.items():
+                pack_file.write(b"\0" * (entries[filename][name][0] - pack_file.tell()))
+                pack_file.write(array.tobytes())
+
+    return {filename: len(entry_arrays["faces"]) for filename, entry_arrays in arrays.items()}
+
+
+def _model_filenames(models_dir: str) -> List[str]:
+    """Every STL in models_dir, then the reduced versions in its REDUCED_MODELS_DIR as "reduced/name.stl"."""
+    filenames = [filename for filename in sorted(os.listdir(models_dir)) if filename.lower().endswith(".stl")]
+    reduced_dir = os.path.join(models_dir, REDUCED_MODELS_DIR)
+    if os.path.isdir(reduced_dir):
+        filenames += [f"{REDUCED_MODELS_DIR}/{filename}" for filename in sorted(os.listdir(reduced_dir))
+                      if filename.lower().endswith(".stl")]
+    return filenames
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
@@ -24,13 +24,30 @@
 #       - Added custom sized box, cylinder and tube for those who'd rather not unevenly scale manually (or want to customise their tube's inner diameter).
 #       - Added generating a simple cone.
 #       - Put "..." at the end of menu options that open a dialog. Is that even worth mentioning?
+# 1.3.0:
+#       - Shapes are made in the background, and ones you've made before come straight from a cache (on disk between sessions).
+#       - Round shapes get as many sides as their size needs, and can be shaded smoothly with shared vertices to save memory.
+#       - Bundled models load from a prebuilt asset pack, with reduced detail versions to choose from.
+#       - The hole test is generated to any sizes you like, as one closed part.
+#       - Live previews in the custom dialogs, adding several copies at once, and a parameter sweep of any custom or bridging shape.
+#       - tools/ has a benchmark, a command line shape generator and the scripts that build the asset pack and reduced models.
 
 
+import time
+
+# Start the clock before anything else is imported so the startup hook can report the whole cost of the plugin.
+_module_load_start = time.perf_counter()
+
+import json
 import math
 import os
+import threading
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import numpy
-import trimesh
 from UM.Application import Application
 from cura.CuraApplication import CuraApplication
 from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
@@ -38,11 +55,14 @@ from cura.Scene.CuraSceneNode import CuraSceneNode
 from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
 from UM.Extension import Extension
 from UM.i18n import i18nCatalog
+from UM.Job import Job
+from UM.JobQueue import JobQueue
 from UM.Logger import Logger
 from UM.Math.Vector import Vector
 from UM.Mesh.MeshData import MeshData, calculateNormalsFromIndexedVertices
 from UM.Message import Message
 from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
+from UM.Operations.GroupedOperation import GroupedOperation
 from UM.Operations.RemoveSceneNodeOperation import RemoveSceneNodeOperation
 from UM.Operations.SetTransformOperation import SetTransformOperation
 from UM.Resources import Resources
@@ -50,15 +70,135 @@ from UM.Scene.SceneNode import SceneNode
 from UM.Scene.SceneNodeSettings import SceneNodeSettings
 from UM.Scene.Selection import Selection
 from UM.Settings.SettingInstance import SettingInstance
-from UM.Mesh.MeshBuilder import MeshBuilder
 from UM.Mesh.MeshData import MeshData, calculateNormalsFromIndexedVertices
 
-from PyQt6.QtCore import QObject, pyqtProperty, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QTimer, pyqtProperty, pyqtSignal, pyqtSlot
 
-import trimesh.creation
+from . import ShapeGenerators
+from .AssetPack import PACK_FILENAME, REDUCED_MODELS_DIR, AssetPack
+from .MeshCache import MeshDiskCache, cache_key
+from .MeshWelder import weld_corners, weld_triangles
+from .StlReader import read_binary_stl
+
+if TYPE_CHECKING:
+    import trimesh
 
 DEBUG_MODE: bool = False
 
+# Rotates a part from Z-up model coordinates to Cura's Y-up scene so it lays down on the build plate.
+LAY_DOWN_ROTATION = numpy.array([[1, 0, 0], [0, 0, 1], [0, -1, 0]], dtype=numpy.float32)
+
+# How far the facets of round shapes can stray from the true surface, as a fraction of the nozzle size,
+# for each curve quality setting. None is the fixed number of sections older versions always used.
+CURVE_QUALITY_TOLERANCES = (None, 1 / 10, 1 / 40, 1 / 160)
+FIXED_SECTIONS = 90
+FIXED_SPHERE_SUBDIVISIONS = 4
+DEFAULT_NOZZLE_SIZE = 0.4
+# With indexed meshes and smooth normals turned on, faces meeting at less than this many degrees are shaded smoothly
+SMOOTH_NORMAL_ANGLE = 30.0
+
+# Everything the shape dialogs ask for: name -> (type, default). Each one is stored in the
+# calibrationshapesreborn/<name> preference and has a Qt property of the same name on the plugin.
+DIALOG_SETTINGS = {
+    "custom_box_width": (float, 40),
+    "custom_box_depth": (float, 30),
+    "custom_box_height": (float, 20),
+
+    "custom_cylinder_diameter": (float, 15),
+    "custom_cylinder_height": (float, 50),
+
+    "custom_tube_outer_diameter": (float, 30),
+    "custom_tube_inner_diameter": (float, 25),
+    "custom_tube_height": (float, 20),
+
+    "bridging_box_width": (int, 50),
+    "bridging_box_depth": (int, 40),
+    "bridging_box_height": (int, 10),
+    "bridging_box_wall_width": (float, 3),
+    "bridging_box_roof_height": (float, 3),
+
+    "bridging_tube_outer_diameter": (float, 30),
+    "bridging_tube_inner_diameter": (float, 26),
+    "bridging_tube_height": (int, 10),
+    "bridging_tube_roof_height": (float, 2),
+
+    "bridging_triangle_base_width": (int, 50),
+    "bridging_triangle_base_depth": (int, 50),
+    "bridging_triangle_height": (int, 10),
+    "bridging_triangle_wall_width": (float, 3),
+    "bridging_triangle_roof_height": (float, 1),
+
+    "hole_test_min_diameter": (float, 1),
+    "hole_test_max_diameter": (float, 15),
+    "hole_test_step": (float, 1),
+    "hole_test_wall_width": (float, 1.3),
+    "hole_test_height": (float, 5),
+
+    "batch_shape_index": (int, 0),
+    "batch_count": (int, 10),
+    "batch_spacing": (float, 5),
+
+    "sweep_shape_index": (int, 3),
+    "sweep_parameter_index": (int, 0),
+    "sweep_start": (float, 20),
+    "sweep_end": (float, 100),
+    "sweep_step": (float, 10),
+}
+
+def dialog_setting(name: str, notify: pyqtSignal) -> pyqtProperty:
+    """Qt property for one of DIALOG_SETTINGS. It's read from the plugin's copy of the settings
+    and written with _setSetting, which leaves saving it to the preferences until later."""
+    value_type = DIALOG_SETTINGS[name][0]
+
+    def get_setting(self):
+        return self._settings[name]
+
+    def set_setting(self, value) -> None:
+        self._setSetting(name, value)
+
+    return pyqtProperty(value_type, fget=get_setting, fset=set_setting, notify=notify)
+
+def lay_down_matrix(transform: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """4x4 matrix which applies transform (in model coordinates) and then lays the part down,
+    so moving, scaling and laying down a part only has to go over its vertices once."""
+    matrix = numpy.eye(4)
+    matrix[:3, :3] = LAY_DOWN_ROTATION
+    if transform is not None:
+        matrix = matrix @ transform
+    return matrix
+
+def transform_normals(normals: numpy.ndarray, matrix: numpy.ndarray) -> numpy.ndarray:
+    """Transforms normals by matrix, which takes the inverse transpose if it scales unevenly.
+
+    Rotations (like laying a part down) move normals just as they move points. Otherwise the cofactor
+    matrix is used, which is the inverse transpose times the determinant, so it's still there when
+    a scale of 0 flattens the part. Faces flattened edge-on are left with zero normals."""
+    linear = matrix[:3, :3]
+    if numpy.allclose(linear @ linear.T, numpy.eye(3)):
+        return numpy.matmul(normals, linear.T, dtype=numpy.float32)
+    normal_matrix = numpy.column_stack((numpy.cross(linear[:, 1], linear[:, 2]), numpy.cross(linear[:, 2], linear[:, 0]),
+                                        numpy.cross(linear[:, 0], linear[:, 1])))
+    if numpy.linalg.det(linear) < 0:
+        normal_matrix = -normal_matrix  # Mirrored, which the determinant would have undone
+    normals = numpy.matmul(normals, normal_matrix.T, dtype=numpy.float32)
+    lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+    normals /= numpy.where(lengths > 0, lengths, 1)
+    return normals
+
+# trimesh takes a while to import and most sessions never add a shape, so it's only imported on first use.
+_trimesh = None
+
+def import_trimesh():
+    """Returns the trimesh module, importing it the first time it's needed."""
+    global _trimesh
+    if _trimesh is None:
+        start = time.perf_counter()
+        import trimesh
+        import trimesh.creation
+        _trimesh = trimesh
+        log("d", f"Imported trimesh in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return _trimesh
+
 def log(level: str, message: str) -> None:
     """Wrapper function for logging messages using Cura's Logger, but with debug mode so as not to spam you."""
     if level == "d" and DEBUG_MODE:
@@ -86,95 +226,226 @@ catalog = i18nCatalog("calibrationshapesreborn")
 if catalog.hasTranslationLoaded():
     Logger.log("i", "Calibration Shapes Reborn Plugin translation loaded")
 
+_module_load_time = time.perf_counter() - _module_load_start
+
+class ShapeTimings:
+    """Rolling record of how long each stage of adding a shape took, for working out what's slow.
+
+    Time is split into stages: load (reading models), convert (turning meshes into MeshData),
+    normals, scene (adding nodes) and build (everything else in making the mesh).
+    A stage inside another only counts towards the inner one, so the stages of one shape add up to its total.
+    Set triangles on a record to have that stored too. Only the last max_samples shapes are kept."""
+
+    STAGES = ("load", "build", "convert", "normals", "scene")
+
+    class _Record:
+        def __init__(self, shape: str) -> None:
+            self.shape = shape
+            self.stages = defaultdict(float)  # stage -> seconds
+            self.triangles = 0
+
+    def __init__(self, max_samples: int = 500) -> None:
+        self._samples = deque(maxlen=max_samples)  # (shape, {stage: ms}, triangles)
+        self._lock = threading.Lock()  # Shapes are built on worker threads
+        self._local = threading.local()  # Record and stack of running stages for this thread
+
+    def begin(self, name: str) -> "ShapeTimings._Record":
+        """Starts a sample for shape name. Time stages against it with recording() and store it with finish()."""
+        return self._Record(name)
+
+    @contextmanager
+    def recording(self, record: "ShapeTimings._Record") -> Iterator["ShapeTimings._Record"]:
+        """Times stages run on this thread inside this block against record."""
+        outer_record = getattr(self._local, "record", None)
+        outer_stages = getattr(self._local, "stages", None)
+        self._local.record = record
+        self._local.stages = []
+        try:
+            yield record
+        finally:
+            self._local.record = outer_record
+            self._local.stages = outer_stages
+
+    def finish(self, record: "ShapeTimings._Record") -> None:
+        """Adds record to the buffer, and to the log in debug mode."""
+        stages_ms = {stage: seconds * 1000 for stage, seconds in record.stages.items()}
+        with self._lock:
+            self._samples.append((record.shape, stages_ms, record.triangles))
+        if DEBUG_MODE:
+            breakdown = ", ".join(f"{stage} {stages_ms[stage]:.1f} ms" for stage in self.STAGES if stage in stages_ms)
+            log("d", f"Timings for {record.shape}: {breakdown}, {sum(stages_ms.values()):.1f} ms total, "
+                f"{record.triangles} triangles")
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Adds the time spent in this block to stage of the shape being timed on this thread, if there is one."""
+        record = getattr(self._local, "record", None)
+        if record is None:
+            yield
+            return
+        nested = self._local.stages
+        nested.append(0.0)  # Time spent in stages inside this one
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            record.stages[stage] += elapsed - nested.pop()
+            if nested:
+                nested[-1] += elapsed
+
+    def summary(self) -> List[Dict]:
+        """p50 and p95 in ms of each stage and the total for every shape in the buffer, slowest total first."""
+        with self._lock:
+            samples = list(self._samples)
+        by_shape = defaultdict(list)
+        for shape, stages_ms, triangles in samples:
+            by_shape[shape].append((stages_ms, triangles))
+        rows = []
+        for shape, shape_samples in by_shape.items():
+            row = {"shape": shape, "count": len(shape_samples), "triangles": max(t for _, t in shape_samples)}
+            for stage in self.STAGES + ("total",):
+                if stage == "total":
+                    values = [sum(stages_ms.values()) for stages_ms, _ in shape_samples]
+                else:
+                    values = [stages_ms.get(stage, 0.0) for stages_ms, _ in shape_samples]
+                row[f"{stage}_p50"] = self._percentile(values, 50)
+                row[f"{stage}_p95"] = self._percentile(values, 95)
+            rows.append(row)
+        rows.sort(key=lambda row: row["total_p50"], reverse=True)
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    @staticmethod
+    def _percentile(values: List[float], percent: float) -> float:
+        """Nearest rank percentile, so it's always one of the values."""
+        ordered = sorted(values)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return round(ordered[rank - 1], 3)
+
+# Shared by the worker threads that build shapes and the main thread that adds them
+shape_timings = ShapeTimings()
+
+class MeshOptions(NamedTuple):
+    """The settings that change how a shape's MeshData is laid out. They're read when a shape is queued
+    and passed to its build, so they're part of its ShapeJob.key and can't change under a running job."""
+    indexed: bool  # Share vertices between faces (indexed_meshes)
+    smooth: bool  # Smooth shading on round shapes (smooth_normals)
+
+class ShapeJob(Job):
+    """Builds the MeshData for a shape on one of Cura's worker threads.
+    The result is a MeshData, since scene nodes can only be added on the main thread."""
+
+    def __init__(self, mesh_name: str, build: Callable[..., MeshData], *build_args) -> None:
+        super().__init__()
+        self.mesh_name = mesh_name
+        self._build = build
+        self._build_args = build_args
+        # Identifies the geometry, so identical shapes can share one MeshData
+        self.key = (build.__name__, build_args)
+        self.timing = shape_timings.begin(mesh_name)
+        # (MeshDiskCache, key) if the result is worth keeping between sessions
+        self.disk_cache = None
+
+    def run(self) -> None:
+        with shape_timings.recording(self.timing):
+            result = self._loadFromDiskCache()
+            if result is None:
+                with shape_timings.stage("build"):
+                    result = self._build(*self._build_args)
+                if result is not None and self.disk_cache is not None:
+                    cache, key = self.disk_cache
+                    cache.put(key, result.getVertices(), result.getNormals(), result.getIndices())
+        if result is not None:
+            self.timing.triangles = result.getFaceCount()
+        self.setResult(result)
+
+    def _loadFromDiskCache(self) -> Optional[MeshData]:
+        if self.disk_cache is None:
+            return None
+        cache, key = self.disk_cache
+        with shape_timings.stage("load"):
+            cached = cache.get(key)
+        if cached is None:
+            return None
+        vertices, normals, indices = cached
+        return MeshData(vertices=vertices, normals=normals, indices=indices)
+
 class CalibrationShapesReborn(QObject, Extension):
+
+    # Shapes that take longer than this to build get a progress message
+    PROGRESS_MESSAGE_DELAY_MS = 300
+    # How long to wait after the last change in a dialog before updating its preview
+    PREVIEW_DELAY_MS = 150
+    # How long to wait after the last change to a dialog setting before saving it to the preferences
+    SETTINGS_SAVE_DELAY_MS = 1000
+    # Builders of the basic shapes whose MeshData is kept after the nodes using it are gone,
+    # since the same few sizes get added over and over.
+    PRIMITIVE_BUILDS = frozenset(("_build_box", "_build_cylinder", "_build_tube", "_build_sphere", "_build_cone"))
+    PRIMITIVE_CACHE_SIZE = 32
+    # Builders whose MeshData is also kept on disk between sessions. They have to depend on nothing
+    # but their arguments (which include the MeshOptions), the plugin version and MESH_CACHE_FORMAT.
+    # Bundled models that are only scaled, like the bed level calibration, are already quick to load
+    # from the asset pack, so they'd just be another big copy on disk.
+    DISK_CACHE_BUILDS = PRIMITIVE_BUILDS | frozenset(("_build_bridging_box", "_build_bridging_tube",
+        "_build_bridging_triangle", "_build_bridging_polygon", "_build_hole_test", "_build_sweep"))
+    DISK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+    # Part of every disk cache key. Bump it whenever what a builder makes changes (say ShapeGenerators
+    # or the welding is edited) so meshes cached by the old code aren't loaded in place of the new ones.
+    # 2: the hole test is one closed part.
+    MESH_CACHE_FORMAT = 2
+    # More than this and the hole test gets too big for most build plates
+    HOLE_TEST_MAX_HOLES = 40
+    # Parameter sweeps: how many variants at most, the gap between them and their labels' digits (mm)
+    SWEEP_MAX_VARIANTS = 20
+    SWEEP_SPACING = 5.0
+    SWEEP_LABEL_HEIGHT = 6.0
+    SWEEP_LABEL_STROKE = 1.2
+    SWEEP_LABEL_THICKNESS = 0.6
        
     def __init__(self, parent = None) -> None:
+        init_start = time.perf_counter()
         super().__init__()
         
         # set the preferences to store the default value
         self._preferences = CuraApplication.getInstance().getPreferences()
         self._preferences.addPreference("calibrationshapesreborn/shapesize", 20)
+        self._preferences.addPreference("calibrationshapesreborn/curve_quality", 2)
+        self._preferences.addPreference("calibrationshapesreborn/reduced_models", True)
+        self._preferences.addPreference("calibrationshapesreborn/indexed_meshes", False)
+        self._preferences.addPreference("calibrationshapesreborn/smooth_normals", True)
+        self._preferences.addPreference("calibrationshapesreborn/live_preview", False)
 
-        self._preferences.addPreference("calibrationshapesreborn/custom_box_width", 40)
-        self._preferences.addPreference("calibrationshapesreborn/custom_box_depth", 30)
-        self._preferences.addPreference("calibrationshapesreborn/custom_box_height", 20)
-        
-        self._preferences.addPreference("calibrationshapesreborn/custom_cylinder_diameter", 15)
-        self._preferences.addPreference("calibrationshapesreborn/custom_cylinder_height", 50)
-        
-        self._preferences.addPreference("calibrationshapesreborn/custom_tube_outer_diameter", 30)
-        self._preferences.addPreference("calibrationshapesreborn/custom_tube_inner_diameter", 25)
-        self._preferences.addPreference("calibrationshapesreborn/custom_tube_height", 20)
-        
-        self._preferences.addPreference("calibrationshapesreborn/bridging_box_width", 50)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_box_depth", 40)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_box_height", 10)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_box_wall_width", 3)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_box_roof_height", 3)
-        
-        self._preferences.addPreference("calibrationshapesreborn/bridging_tube_outer_diameter", 30)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_tube_inner_diameter", 26)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_tube_height", 10)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_tube_roof_height", 2)
-        
-        self._preferences.addPreference("calibrationshapesreborn/bridging_triangle_base_width", 50)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_triangle_base_depth", 50)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_triangle_height", 10)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_triangle_wall_width", 3)
-        self._preferences.addPreference("calibrationshapesreborn/bridging_triangle_roof_height", 1)
+        for name, (_, default) in DIALOG_SETTINGS.items():
+            self._preferences.addPreference(f"calibrationshapesreborn/{name}", default)
 
         self._shape_size = float(self._preferences.getValue \
             ("calibrationshapesreborn/shapesize"))
+        self._curve_quality = int(self._preferences.getValue \
+            ("calibrationshapesreborn/curve_quality"))
+        self._reduced_models = self._preferences.getValue("calibrationshapesreborn/reduced_models") in (True, "True", "true")
+        self._indexed_meshes = self._preferences.getValue("calibrationshapesreborn/indexed_meshes") in (True, "True", "true")
+        self._smooth_normals = self._preferences.getValue("calibrationshapesreborn/smooth_normals") in (True, "True", "true")
+        self._live_preview = self._preferences.getValue("calibrationshapesreborn/live_preview") in (True, "True", "true")
         
-        self._custom_box_width = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_box_width"))
-        self._custom_box_depth = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_box_depth"))
-        self._custom_box_height = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_box_height"))
-        
-        self._custom_cylinder_diameter = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_cylinder_diameter"))
-        self._custom_cylinder_height = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_cylinder_height"))
-        
-        self._custom_tube_outer_diameter = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_tube_outer_diameter"))
-        self._custom_tube_inner_diameter = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_tube_inner_diameter"))
-        self._custom_tube_height = float(self._preferences.getValue \
-            ("calibrationshapesreborn/custom_tube_height"))
-        
-        self._bridging_box_width = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_box_width"))
-        self._bridging_box_depth = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_box_depth"))
-        self._bridging_box_height = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_box_height"))
-        self._bridging_box_wall_width = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_box_wall_width"))
-        self._bridging_box_roof_height = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_box_roof_height"))
-
-        self._bridging_tube_outer_diameter = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_tube_outer_diameter"))
-        self._bridging_tube_inner_diameter = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_tube_inner_diameter"))
-        self._bridging_tube_height = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_tube_height"))
-        self._bridging_tube_roof_height = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_tube_roof_height"))
-            
-        self._bridging_triangle_base_width = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_triangle_base_width"))
-        self._bridging_triangle_base_depth = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_triangle_base_depth"))
-        self._bridging_triangle_height = int(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_triangle_height"))
-        self._bridging_triangle_wall_width = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_triangle_wall_width"))
-        self._bridging_triangle_roof_height = float(self._preferences.getValue \
-            ("calibrationshapesreborn/bridging_triangle_roof_height"))
+        # The dialog settings are kept here and only written back to the preferences once they've stopped
+        # changing for SETTINGS_SAVE_DELAY_MS, or a dialog closes, since every write tells all of Cura.
+        self._settings = {}
+        for name, (value_type, default) in DIALOG_SETTINGS.items():
+            try:
+                self._settings[name] = value_type(float(self._preferences.getValue(f"calibrationshapesreborn/{name}")))
+            except (TypeError, ValueError):
+                log("w", f"Preference calibrationshapesreborn/{name} isn't a number, using {default}")
+                self._settings[name] = value_type(default)
+        self._unsaved_settings = set()
+        self._settings_save_timer = QTimer()
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self.save_settings)
+        CuraApplication.getInstance().applicationShuttingDown.connect(self.save_settings)
 
         self._settings_popup = None
         
@@ -185,6 +456,12 @@ class CalibrationShapesReborn(QObject, Extension):
         self._bridging_box_dialog = None
         self._bridging_tube_dialog = None
         self._bridging_triangle_dialog = None
+
+        self._hole_test_dialog = None
+
+        self._add_multiple_dialog = None
+        self._sweep_dialog = None
+        self._timings_dialog = None
         
         # self._settings_qml = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qml", "settings.qml")
         self._settings_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "settings.qml"))
@@ -197,8 +474,37 @@ class CalibrationShapesReborn(QObject, Extension):
         self._bridging_tube_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "customBridgingTube.qml"))
         self._bridging_triangle_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "customBridgingTriangle.qml"))
 
+        self._hole_test_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "holeTest.qml"))
+
+        self._add_multiple_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "addMultiple.qml"))
+        self._sweep_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "sweep.qml"))
+        self._timings_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), "qml", "timings.qml"))
+
         self._controller = CuraApplication.getInstance().getController()
 
+        self._shape_jobs = {}  # ShapeJob -> (function to call with the built MeshData, progress Message or None)
+        # MeshData is immutable, so nodes with identical geometry can share it. Weak so it goes when the nodes do.
+        self._shared_mesh_data = weakref.WeakValueDictionary()  # ShapeJob.key -> MeshData
+
+        # Live preview of the shape in the dialog that's open. Only the newest job's result is shown.
+        self._preview_kind = None  # Which _customShape is being previewed
+        self._preview_job = None
+        self._preview_mesh = None  # (ShapeJob.key, MeshData) the preview node is showing
+        self._preview_node = None
+        self._preview_timer = QTimer()
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self._startPreviewJob)
+        self._shared_mesh_bytes_saved = 0
+        self._primitive_mesh_data = OrderedDict()  # ShapeJob.key -> MeshData, least recently used first
+        self._unit_spheres = {}  # (subdivisions, MeshOptions) -> MeshData
+        self._unit_spheres_lock = threading.Lock()  # Spheres are built on worker threads
+        self._asset_pack = AssetPack(os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", PACK_FILENAME))
+        self._plugin_version = self._readPluginVersion()
+        # Only touches the disk once a shape is added. Anything that goes wrong with it counts as a cache miss.
+        self._mesh_disk_cache = MeshDiskCache(os.path.join(Resources.getCacheStoragePath(), "calibrationshapesreborn", "meshes"),
+                                              self.DISK_CACHE_MAX_BYTES)
+
         self.setMenuName(catalog.i18nc("@item:inmenu", "Calibration Shapes"))
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a cube"), self._add_cube)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a cylinder"), self._add_cylinder)
@@ -219,6 +525,8 @@ class CalibrationShapesReborn(QObject, Extension):
             self.add_bridging_tube_dialog)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a custom Bridging Triangle..."), \
             self.add_bridging_triangle_dialog)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Bridging Hexagon"), self._add_bridging_hexagon)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Bridging Star"), self._add_bridging_star)
         self.addMenuItem("    ", lambda: None)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Calibration Cube"), self._add_calibration_cube)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Layer Adhesion Test"), self._add_layer_adhesion)
@@ -227,6 +535,7 @@ class CalibrationShapesReborn(QObject, Extension):
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Dimensional Accuracy Test"), self._add_dimensional_test)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Tolerance Test"), self._add_tolerance)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Hole Test"), self._add_hole_test)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a custom Hole Test..."), self.add_hole_test_dialog)
         
         # self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Junction Deviation Tower"), self.addJunctionDeviationTower)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Bridge Test"), self._add_bridge_test)
@@ -247,7 +556,15 @@ class CalibrationShapesReborn(QObject, Extension):
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a Bi-Color Calibration Cube"), self._add_calibration_cube_bi_color)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Add an Extruder Offset Calibration Part"), self._add_extruder_offset_calibration)        
         self.addMenuItem("      ", lambda: None)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Add multiple..."), self.add_multiple_dialog)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Add a parameter sweep..."), self.add_sweep_dialog)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Set default size..."), self.showSettingsPopup)
+        if DEBUG_MODE:
+            self.addMenuItem(catalog.i18nc("@item:inmenu", "Shape timings..."), self.show_timings_dialog)
+
+        init_time = time.perf_counter() - init_start
+        log("i", f"Calibration Shapes Reborn added {(_module_load_time + init_time) * 1000:.1f} ms to startup "
+            f"({_module_load_time * 1000:.1f} ms loading the module, {init_time * 1000:.1f} ms initialising)")
         
     @pyqtSlot(str)
     def logMessage(self, value: str) -> None:
@@ -269,6 +586,9 @@ class CalibrationShapesReborn(QObject, Extension):
     def SetShapeSize(self, value: int) -> None:
         #Logger.log("d", f"Attempting to set ShapeSize from pyqtProperty: {value}")
         self._preferences.setValue("calibrationshapesreborn/shapesize", value)
+        if value != self._shape_size:
+            # Most of the cached primitives were the old default size and won't be asked for again
+            self._primitive_mesh_data.clear()
         self._shape_size = value
         self._shape_size_changed.emit()
 
@@ -277,54 +597,120 @@ class CalibrationShapesReborn(QObject, Extension):
         #Logger.log("d", f"ShapeSize pyqtProperty accessed: {self._shape_size}, cast to {int(self._shape_size)}")
         return int(self._shape_size)
 
-    ### Custom box settings
-    _custom_box_width_changed = pyqtSignal()
-    _custom_box_depth_changed = pyqtSignal()
-    _custom_box_height_changed = pyqtSignal()
-    
-    def _set_custom_box_width(self, value: float) -> None:
-        log("d", f"_set_custom_box_width is running with a value of {value}")
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_box_width got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/custom_box_width", new_value)
-        self._custom_box_width = new_value
-        self._custom_box_width_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_box_width_changed, fset=_set_custom_box_width)
-    def custom_box_width(self) -> float:
-        return self._custom_box_width
+    _curve_quality_changed = pyqtSignal()
 
-    def _set_custom_box_depth(self, value: float) -> None:
-        log("d", f"_set_custom_box_depth is running with a value of {value}")
+    def _set_curve_quality(self, value: int) -> None:
         try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_box_depth got passed a non-float")
+            new_value = int(value)
+        except (TypeError, ValueError):
+            log("w", "_set_curve_quality got passed a non-int")
             return
-        self._preferences.setValue("calibrationshapesreborn/custom_box_depth", new_value)
-        self._custom_box_depth = new_value
-        self._custom_box_depth_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_box_depth_changed, fset=_set_custom_box_depth)
-    def custom_box_depth(self) -> float:
-        return self._custom_box_depth
-
-    def _set_custom_box_height(self, value: float) -> None:
+        if not 0 <= new_value < len(CURVE_QUALITY_TOLERANCES):
+            log("w", f"_set_curve_quality got passed an out of range value: {new_value}")
+            return
+        self._preferences.setValue("calibrationshapesreborn/curve_quality", new_value)
+        self._curve_quality = new_value
+        self._curve_quality_changed.emit()
+
+    @pyqtProperty(int, notify=_curve_quality_changed, fset=_set_curve_quality)
+    def curve_quality(self) -> int:
+        return self._curve_quality
+
+    _reduced_models_changed = pyqtSignal()
+
+    def _set_reduced_models(self, value: bool) -> None:
+        new_value = bool(value)
+        self._preferences.setValue("calibrationshapesreborn/reduced_models", new_value)
+        self._reduced_models = new_value
+        self._reduced_models_changed.emit()
+
+    @pyqtProperty(bool, notify=_reduced_models_changed, fset=_set_reduced_models)
+    def reduced_models(self) -> bool:
+        return self._reduced_models
+
+    _indexed_meshes_changed = pyqtSignal()
+
+    def _set_indexed_meshes(self, value: bool) -> None:
+        new_value = bool(value)
+        self._preferences.setValue("calibrationshapesreborn/indexed_meshes", new_value)
+        if new_value != self._indexed_meshes:
+            # Meshes already built are in the other layout
+            self._shared_mesh_data.clear()
+            self._primitive_mesh_data.clear()
+            with self._unit_spheres_lock:
+                self._unit_spheres.clear()
+        self._indexed_meshes = new_value
+        self._indexed_meshes_changed.emit()
+
+    @pyqtProperty(bool, notify=_indexed_meshes_changed, fset=_set_indexed_meshes)
+    def indexed_meshes(self) -> bool:
+        return self._indexed_meshes
+
+    _smooth_normals_changed = pyqtSignal()
+
+    def _set_smooth_normals(self, value: bool) -> None:
+        new_value = bool(value)
+        self._preferences.setValue("calibrationshapesreborn/smooth_normals", new_value)
+        if new_value != self._smooth_normals:
+            # Round shapes already built are shaded the other way
+            self._shared_mesh_data.clear()
+            self._primitive_mesh_data.clear()
+            with self._unit_spheres_lock:
+                self._unit_spheres.clear()
+        self._smooth_normals = new_value
+        self._smooth_normals_changed.emit()
+
+    @pyqtProperty(bool, notify=_smooth_normals_changed, fset=_set_smooth_normals)
+    def smooth_normals(self) -> bool:
+        return self._smooth_normals
+
+    _live_preview_changed = pyqtSignal()
+
+    def _set_live_preview(self, value: bool) -> None:
+        new_value = value in (True, "True", "true")
+        self._preferences.setValue("calibrationshapesreborn/live_preview", new_value)
+        self._live_preview = new_value
+        if not new_value:
+            self.stop_preview()
+        self._live_preview_changed.emit()
+
+    @pyqtProperty(bool, notify=_live_preview_changed, fset=_set_live_preview)
+    def live_preview(self) -> bool:
+        return self._live_preview
+
+    def _setSetting(self, name: str, value) -> None:
+        """Sets one of DIALOG_SETTINGS. It's saved to the preferences later by save_settings."""
+        value_type = DIALOG_SETTINGS[name][0]
         try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_box_height got passed a non-float")
+            new_value = value_type(value)
+        except (TypeError, ValueError):
+            log("w", f"Setting {name} got passed a non-{value_type.__name__}: {value}")
+            return
+        if new_value == self._settings[name]:
             return
-        self._preferences.setValue("calibrationshapesreborn/custom_box_height", new_value)
-        self._custom_box_height = new_value
-        self._custom_box_height_changed.emit()
+        log("d", f"Setting {name} to {new_value}")
+        self._settings[name] = new_value
+        self._unsaved_settings.add(name)
+        self._settings_save_timer.start()
+        getattr(self, f"_{name}_changed").emit()
+        self._schedulePreview()
+
+    @pyqtSlot()
+    def save_settings(self) -> None:
+        """Writes the dialog settings which have changed since last time to Cura's preferences, all at once."""
+        self._settings_save_timer.stop()
+        for name in self._unsaved_settings:
+            self._preferences.setValue(f"calibrationshapesreborn/{name}", self._settings[name])
+        self._unsaved_settings.clear()
 
-    @pyqtProperty(float, notify=_custom_box_height_changed, fset=_set_custom_box_height)
-    def custom_box_height(self) -> float:
-        return self._custom_box_height
+    ### Custom box settings
+    _custom_box_width_changed = pyqtSignal()
+    _custom_box_depth_changed = pyqtSignal()
+    _custom_box_height_changed = pyqtSignal()
+    
+    custom_box_width = dialog_setting("custom_box_width", _custom_box_width_changed)
+    custom_box_depth = dialog_setting("custom_box_depth", _custom_box_depth_changed)
+    custom_box_height = dialog_setting("custom_box_height", _custom_box_height_changed)
     
     def add_custom_box_dialog(self) -> None:
         """Loads the dialog to make a custom box"""
@@ -344,34 +730,8 @@ class CalibrationShapesReborn(QObject, Extension):
     _custom_cylinder_diameter_changed = pyqtSignal()
     _custom_cylinder_height_changed = pyqtSignal()
     
-    def _set_custom_cylinder_diameter(self, value: float) -> None:
-        log("d", f"_set_custom_cylinder_diameter is running with a value of {value}")
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_cylinder_diameter got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/custom_cylinder_diameter", new_value)
-        self._custom_cylinder_diameter = new_value
-        self._custom_cylinder_diameter_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_cylinder_diameter_changed, fset=_set_custom_cylinder_diameter)
-    def custom_cylinder_diameter(self) -> float:
-        return self._custom_cylinder_diameter
-
-    def _set_custom_cylinder_height(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_cylinder_height got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/custom_cylinder_height", new_value)
-        self._custom_cylinder_height = new_value
-        self._custom_cylinder_height_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_cylinder_height_changed, fset=_set_custom_cylinder_height)
-    def custom_cylinder_height(self) -> float:
-        return self._custom_cylinder_height
+    custom_cylinder_diameter = dialog_setting("custom_cylinder_diameter", _custom_cylinder_diameter_changed)
+    custom_cylinder_height = dialog_setting("custom_cylinder_height", _custom_cylinder_height_changed)
     
     def add_custom_cylinder_dialog(self) -> None:
         """Loads the dialog to make a custom cylinder"""
@@ -392,49 +752,9 @@ class CalibrationShapesReborn(QObject, Extension):
     _custom_tube_inner_diameter_changed = pyqtSignal()
     _custom_tube_height_changed = pyqtSignal()
     
-    def _set_custom_tube_outer_diameter(self, value: float) -> None:
-        log("d", f"_set_custom_tube_outer_diameter is running with a value of {value}")
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_tube_outer_diameter got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/custom_tube_outer_diameter", new_value)
-        self._custom_tube_outer_diameter = new_value
-        self._custom_tube_outer_diameter_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_tube_outer_diameter_changed, fset=_set_custom_tube_outer_diameter)
-    def custom_tube_outer_diameter(self) -> float:
-        return self._custom_tube_outer_diameter
-
-    def _set_custom_tube_inner_diameter(self, value: float) -> None:
-        log("d", f"_set_custom_tube_inner_diameter is running with a value of {value}")
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_tube_inner_diameter got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/custom_tube_inner_diameter", new_value)
-        self._custom_tube_inner_diameter = new_value
-        self._custom_tube_inner_diameter_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_tube_inner_diameter_changed, fset=_set_custom_tube_inner_diameter)
-    def custom_tube_inner_diameter(self) -> float:
-        return self._custom_tube_inner_diameter
-
-    def _set_custom_tube_height(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_custom_tube_height got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/custom_tube_height", new_value)
-        self._custom_tube_height = new_value
-        self._custom_tube_height_changed.emit()
-
-    @pyqtProperty(float, notify=_custom_tube_height_changed, fset=_set_custom_tube_height)
-    def custom_tube_height(self) -> float:
-        return self._custom_tube_height
+    custom_tube_outer_diameter = dialog_setting("custom_tube_outer_diameter", _custom_tube_outer_diameter_changed)
+    custom_tube_inner_diameter = dialog_setting("custom_tube_inner_diameter", _custom_tube_inner_diameter_changed)
+    custom_tube_height = dialog_setting("custom_tube_height", _custom_tube_height_changed)
     
     def add_custom_tube_dialog(self) -> None:
         """Loads the dialog to make a custom tube"""
@@ -457,77 +777,11 @@ class CalibrationShapesReborn(QObject, Extension):
     _bridging_box_wall_width_changed = pyqtSignal()
     _bridging_box_roof_height_changed = pyqtSignal()
 
-    def _set_bridging_box_width(self, value: int) -> None:
-        log("d", f"_set_bridging_box_width is running with a value of {value}")
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_box_width got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_box_width", new_value)
-        self._bridging_box_width = new_value
-        self._bridging_box_width_changed.emit()
-
-    @pyqtProperty(int, notify=_bridging_box_width_changed, fset=_set_bridging_box_width)
-    def bridging_box_width(self) -> int:
-        return self._bridging_box_width
-
-    def _set_bridging_box_depth(self, value: int) -> None:
-        log("d", f"_set_bridging_box_depth is running with a value of {value}")
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_box_depth got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_box_depth", new_value)
-        self._bridging_box_depth = new_value
-        self._bridging_box_depth_changed.emit()
-
-    @pyqtProperty(int, notify=_bridging_box_depth_changed, fset=_set_bridging_box_depth)
-    def bridging_box_depth(self) -> int:
-        return self._bridging_box_depth
-
-    def _set_bridging_box_height(self, value: int) -> None:
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_box_height got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_box_height", new_value)
-        self._bridging_box_height = new_value
-        self._bridging_box_height_changed.emit()
-
-    @pyqtProperty(int, notify=_bridging_box_height_changed, fset=_set_bridging_box_height)
-    def bridging_box_height(self) -> int:
-        return self._bridging_box_height
-
-    def _set_bridging_box_wall_width(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "set_bridging_box_wall_width got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_box_wall_width", new_value)
-        self._bridging_box_wall_width = new_value
-        self._bridging_box_wall_width_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_box_wall_width_changed, fset=_set_bridging_box_wall_width)
-    def bridging_box_wall_width(self) -> float:
-        return self._bridging_box_wall_width
-
-    def _set_bridging_box_roof_height(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "set_bridging_box_roof_height got passed a non-float")
-        self._preferences.setValue(
-            "calibrationshapesreborn/bridging_box_roof_height", new_value)
-        self._bridging_box_roof_height = new_value
-        self._bridging_box_roof_height_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_box_roof_height_changed, fset=_set_bridging_box_roof_height)
-    def bridging_box_roof_height(self) -> float:
-        return self._bridging_box_roof_height
+    bridging_box_width = dialog_setting("bridging_box_width", _bridging_box_width_changed)
+    bridging_box_depth = dialog_setting("bridging_box_depth", _bridging_box_depth_changed)
+    bridging_box_height = dialog_setting("bridging_box_height", _bridging_box_height_changed)
+    bridging_box_wall_width = dialog_setting("bridging_box_wall_width", _bridging_box_wall_width_changed)
+    bridging_box_roof_height = dialog_setting("bridging_box_roof_height", _bridging_box_roof_height_changed)
  
     def add_bridging_box_dialog(self):
         """Loads the dialog to make a custom bridging box"""
@@ -550,61 +804,10 @@ class CalibrationShapesReborn(QObject, Extension):
     _bridging_tube_height_changed = pyqtSignal()
     _bridging_tube_roof_height_changed = pyqtSignal()
 
-    def _set_bridging_tube_outer_diameter(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_bridging_tube_outer_diameter got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_tube_outer_diameter", new_value)
-        self._bridging_tube_outer_diameter = new_value
-        self._bridging_tube_outer_diameter_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_tube_outer_diameter_changed, fset=_set_bridging_tube_outer_diameter)
-    def bridging_tube_outer_diameter(self) -> float:
-        return self._bridging_tube_outer_diameter
-
-    def _set_bridging_tube_inner_diameter(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "_set_bridging_tube_inner_diameter got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_tube_inner_diameter", new_value)
-        self._bridging_tube_inner_diameter = new_value
-        self._bridging_tube_inner_diameter_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_tube_inner_diameter_changed, fset=_set_bridging_tube_inner_diameter)
-    def bridging_tube_inner_diameter(self) -> int:
-        return self._bridging_tube_inner_diameter
-
-    def _set_bridging_tube_height(self, value: int) -> None:
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_tube_height got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_tube_height", new_value)
-        self._bridging_tube_height = new_value
-        self._bridging_tube_height_changed.emit()
-        
-    @pyqtProperty(int, notify=_bridging_tube_height_changed, fset=_set_bridging_tube_height)
-    def bridging_tube_height(self) -> int:
-        return self._bridging_tube_height
-
-    def _set_bridging_tube_roof_height(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "set_bridging_tube_roof_height got passed a non-float")
-        self._preferences.setValue(
-            "calibrationshapesreborn/bridging_tube_roof_height", new_value)
-        self._bridging_tube_roof_height = new_value
-        self._bridging_tube_roof_height_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_tube_roof_height_changed, fset=_set_bridging_tube_roof_height)
-    def bridging_tube_roof_height(self) -> float:
-        return self._bridging_tube_roof_height
+    bridging_tube_outer_diameter = dialog_setting("bridging_tube_outer_diameter", _bridging_tube_outer_diameter_changed)
+    bridging_tube_inner_diameter = dialog_setting("bridging_tube_inner_diameter", _bridging_tube_inner_diameter_changed)
+    bridging_tube_height = dialog_setting("bridging_tube_height", _bridging_tube_height_changed)
+    bridging_tube_roof_height = dialog_setting("bridging_tube_roof_height", _bridging_tube_roof_height_changed)
 
     def add_bridging_tube_dialog(self):
         """Loads the dialog to make a custom bridging tube"""
@@ -628,77 +831,11 @@ class CalibrationShapesReborn(QObject, Extension):
     _bridging_triangle_wall_width_changed = pyqtSignal()
     _bridging_triangle_roof_height_changed = pyqtSignal()
 
-    def _set_bridging_triangle_base_width(self, value: int) -> None:
-        log("d", f"_set_bridging_triangle_base_width is running with a value of {value}")
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_triangle_base_width got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_triangle_base_width", new_value)
-        self._bridging_triangle_base_width = new_value
-        self._bridging_triangle_base_width_changed.emit()
-
-    @pyqtProperty(int, notify=_bridging_triangle_base_width_changed, fset=_set_bridging_triangle_base_width)
-    def bridging_triangle_base_width(self) -> int:
-        return self._bridging_triangle_base_width
-
-    def _set_bridging_triangle_base_depth(self, value: int) -> None:
-        log("d", f"_set_bridging_triangle_base_depth is running with a value of {value}")
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_triangle_base_depth got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_triangle_base_depth", new_value)
-        self._bridging_triangle_base_depth = new_value
-        self._bridging_triangle_base_depth_changed.emit()
-
-    @pyqtProperty(int, notify=_bridging_triangle_base_depth_changed, fset=_set_bridging_triangle_base_depth)
-    def bridging_triangle_base_depth(self) -> int:
-        return self._bridging_triangle_base_depth
-
-    def _set_bridging_triangle_height(self, value: int) -> None:
-        try:
-            new_value = int(value)
-        except ValueError:
-            log("w", "_set_bridging_triangle_height got passed a non-int")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_triangle_height", new_value)
-        self._bridging_triangle_height = new_value
-        self._bridging_triangle_height_changed.emit()
-        
-    @pyqtProperty(int, notify=_bridging_triangle_height_changed, fset=_set_bridging_triangle_height)
-    def bridging_triangle_height(self) -> int:
-        return self._bridging_triangle_height
-
-    def _set_bridging_triangle_wall_width(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "set_bridging_triangle_wall_width got passed a non-float")
-            return
-        self._preferences.setValue("calibrationshapesreborn/bridging_triangle_wall_width", new_value)
-        self._bridging_triangle_wall_width = new_value
-        self._bridging_triangle_wall_width_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_triangle_wall_width_changed, fset=_set_bridging_triangle_wall_width)
-    def bridging_triangle_wall_width(self) -> float:
-        return self._bridging_triangle_wall_width
-
-    def _set_bridging_triangle_roof_height(self, value: float) -> None:
-        try:
-            new_value = float(value)
-        except ValueError:
-            log("w", "set_bridging_triangle_roof_height got passed a non-float")
-        self._preferences.setValue(
-            "calibrationshapesreborn/bridging_triangle_roof_height", new_value)
-        self._bridging_triangle_roof_height = new_value
-        self._bridging_triangle_roof_height_changed.emit()
-
-    @pyqtProperty(float, notify=_bridging_triangle_roof_height_changed, fset=_set_bridging_triangle_roof_height)
-    def bridging_triangle_roof_height(self) -> float:
-        return self._bridging_triangle_roof_height
+    bridging_triangle_base_width = dialog_setting("bridging_triangle_base_width", _bridging_triangle_base_width_changed)
+    bridging_triangle_base_depth = dialog_setting("bridging_triangle_base_depth", _bridging_triangle_base_depth_changed)
+    bridging_triangle_height = dialog_setting("bridging_triangle_height", _bridging_triangle_height_changed)
+    bridging_triangle_wall_width = dialog_setting("bridging_triangle_wall_width", _bridging_triangle_wall_width_changed)
+    bridging_triangle_roof_height = dialog_setting("bridging_triangle_roof_height", _bridging_triangle_roof_height_changed)
 
     def add_bridging_triangle_dialog(self):
         """Loads the dialog to make a custom bridging triangle"""
@@ -715,6 +852,213 @@ class CalibrationShapesReborn(QObject, Extension):
         self._bridging_triangle_dialog = CuraApplication.getInstance().\
             createQmlComponent(self._bridging_triangle_qml, context_dict)
 
+    ### Hole test settings
+    _hole_test_min_diameter_changed = pyqtSignal()
+    _hole_test_max_diameter_changed = pyqtSignal()
+    _hole_test_step_changed = pyqtSignal()
+    _hole_test_wall_width_changed = pyqtSignal()
+    _hole_test_height_changed = pyqtSignal()
+
+    hole_test_min_diameter = dialog_setting("hole_test_min_diameter", _hole_test_min_diameter_changed)
+    hole_test_max_diameter = dialog_setting("hole_test_max_diameter", _hole_test_max_diameter_changed)
+    hole_test_step = dialog_setting("hole_test_step", _hole_test_step_changed)
+    hole_test_wall_width = dialog_setting("hole_test_wall_width", _hole_test_wall_width_changed)
+    hole_test_height = dialog_setting("hole_test_height", _hole_test_height_changed)
+
+    def add_hole_test_dialog(self) -> None:
+        """Loads the dialog to make a hole test with your own hole sizes"""
+        if self._hole_test_dialog is None:
+            self._create_hole_test_dialog()
+        self._hole_test_dialog.show()
+
+    def _create_hole_test_dialog(self) -> None:
+        """Creates the hole test dialog if it doesn't already exist"""
+        context_dict = {
+            "manager": self,
+        }
+        self._hole_test_dialog = CuraApplication.getInstance().\
+            createQmlComponent(self._hole_test_qml, context_dict)
+
+    ### Add multiple settings
+    _batch_shape_index_changed = pyqtSignal()
+    _batch_count_changed = pyqtSignal()
+    _batch_spacing_changed = pyqtSignal()
+
+    batch_shape_index = dialog_setting("batch_shape_index", _batch_shape_index_changed)
+    batch_count = dialog_setting("batch_count", _batch_count_changed)
+    batch_spacing = dialog_setting("batch_spacing", _batch_spacing_changed)
+
+    @pyqtProperty("QVariantList", constant=True)
+    def batch_shape_names(self) -> List[str]:
+        return [label for label, _, _, _ in self._batchShapes()]
+
+    def add_multiple_dialog(self) -> None:
+        """Loads the dialog to add several copies of a shape at once"""
+        if self._add_multiple_dialog is None:
+            self._create_add_multiple_dialog()
+        self._add_multiple_dialog.show()
+
+    def _create_add_multiple_dialog(self) -> None:
+        """Creates the add multiple dialog if it doesn't already exist"""
+        context_dict = {
+            "manager": self,
+        }
+        self._add_multiple_dialog = CuraApplication.getInstance().\
+            createQmlComponent(self._add_multiple_qml, context_dict)
+
+    ### Parameter sweep settings
+    _sweep_shape_index_changed = pyqtSignal()
+    _sweep_parameter_index_changed = pyqtSignal()
+    _sweep_start_changed = pyqtSignal()
+    _sweep_end_changed = pyqtSignal()
+    _sweep_step_changed = pyqtSignal()
+
+    sweep_shape_index = dialog_setting("sweep_shape_index", _sweep_shape_index_changed)
+    sweep_parameter_index = dialog_setting("sweep_parameter_index", _sweep_parameter_index_changed)
+    sweep_start = dialog_setting("sweep_start", _sweep_start_changed)
+    sweep_end = dialog_setting("sweep_end", _sweep_end_changed)
+    sweep_step = dialog_setting("sweep_step", _sweep_step_changed)
+
+    @pyqtProperty("QVariantList", constant=True)
+    def sweep_shape_names(self) -> List[str]:
+        return [label for label, _, _ in self._sweepShapes()]
+
+    @pyqtSlot(int, result="QVariantList")
+    def sweep_parameter_names(self, shape_index: int) -> List[str]:
+        shapes = self._sweepShapes()
+        if not 0 <= shape_index < len(shapes):
+            return []
+        return [label for label, _ in shapes[shape_index][2]]
+
+    @pyqtSlot(int, int, float, float, float, result=str)
+    def sweep_problem(self, shape_index: int, parameter_index: int, start: float, end: float, step: float) -> str:
+        """Why the sweep the dialog is set to can't be made with the shape's other sizes, or "" if it can.
+        Only the first and last variants are checked, as every size limit is on one side or the other.
+        This runs as the dialog is typed in, so nothing is built to find out."""
+        kind, parameter = self._sweepParameter(shape_index, parameter_index)
+        values = ShapeGenerators.stepped_values(start, end, step, self.SWEEP_MAX_VARIANTS)
+        for value in sorted({values[0], values[-1]}):
+            _, build, build_args = self._customShape(kind, {parameter: value})
+            try:
+                self._checkShape(build, build_args)
+            except ValueError as error:
+                return catalog.i18nc("@error:sweep_variant", "At {0:g}: {1}.").format(value, str(error))
+        return ""
+
+    def add_sweep_dialog(self) -> None:
+        """Loads the dialog to add a row of one shape with a parameter stepped across a range"""
+        if self._sweep_dialog is None:
+            self._create_sweep_dialog()
+        self._sweep_dialog.show()
+
+    def _create_sweep_dialog(self) -> None:
+        """Creates the parameter sweep dialog if it doesn't already exist"""
+        context_dict = {
+            "manager": self,
+        }
+        self._sweep_dialog = CuraApplication.getInstance().\
+            createQmlComponent(self._sweep_qml, context_dict)
+
+    def _sweepShapes(self) -> List[Tuple[str, str, Tuple[Tuple[str, str], ...]]]:
+        """Shapes a sweep can be made of, as (label, _customShape kind, ((label, setting), ...) for the parameters it can step)."""
+        return [
+            (catalog.i18nc("@item:inlistbox", "Custom Box"), "custom_box", (
+                (catalog.i18nc("sweep:width", "Width"), "custom_box_width"),
+                (catalog.i18nc("sweep:depth", "Depth"), "custom_box_depth"),
+                (catalog.i18nc("sweep:height", "Height"), "custom_box_height"))),
+            (catalog.i18nc("@item:inlistbox", "Custom Cylinder"), "custom_cylinder", (
+                (catalog.i18nc("sweep:diameter", "Diameter"), "custom_cylinder_diameter"),
+                (catalog.i18nc("sweep:height", "Height"), "custom_cylinder_height"))),
+            (catalog.i18nc("@item:inlistbox", "Custom Tube"), "custom_tube", (
+                (catalog.i18nc("sweep:outer_diameter", "Outer Diameter"), "custom_tube_outer_diameter"),
+                (catalog.i18nc("sweep:inner_diameter", "Inner Diameter"), "custom_tube_inner_diameter"),
+                (catalog.i18nc("sweep:height", "Height"), "custom_tube_height"))),
+            (catalog.i18nc("@item:inlistbox", "Bridging Box"), "bridging_box", (
+                (catalog.i18nc("sweep:width", "Width"), "bridging_box_width"),
+                (catalog.i18nc("sweep:depth", "Depth"), "bridging_box_depth"),
+                (catalog.i18nc("sweep:height", "Height"), "bridging_box_height"),
+                (catalog.i18nc("sweep:wall_width", "Wall Width"), "bridging_box_wall_width"),
+                (catalog.i18nc("sweep:roof_height", "Roof Height"), "bridging_box_roof_height"))),
+            (catalog.i18nc("@item:inlistbox", "Bridging Tube"), "bridging_tube", (
+                (catalog.i18nc("sweep:outer_diameter", "Outer Diameter"), "bridging_tube_outer_diameter"),
+                (catalog.i18nc("sweep:inner_diameter", "Inner Diameter"), "bridging_tube_inner_diameter"),
+                (catalog.i18nc("sweep:height", "Height"), "bridging_tube_height"),
+                (catalog.i18nc("sweep:roof_height", "Roof Height"), "bridging_tube_roof_height"))),
+            (catalog.i18nc("@item:inlistbox", "Bridging Triangle"), "bridging_triangle", (
+                (catalog.i18nc("sweep:width", "Width"), "bridging_triangle_base_width"),
+                (catalog.i18nc("sweep:depth", "Depth"), "bridging_triangle_base_depth"),
+                (catalog.i18nc("sweep:height", "Height"), "bridging_triangle_height"),
+                (catalog.i18nc("sweep:wall_width", "Wall Width"), "bridging_triangle_wall_width"),
+                (catalog.i18nc("sweep:roof_height", "Roof Height"), "bridging_triangle_roof_height"))),
+        ]
+
+    def _batchShapes(self) -> List[Tuple[str, str, Callable[..., MeshData], tuple]]:
+        """Shapes which can be added several at a time, as (label, node name, build function, build arguments).
+        The arguments come from the current shape size and the values last used in each dialog."""
+        size = self._shape_size
+        sections = self._sections(size / 2)
+        return [
+            (catalog.i18nc("@item:inlistbox", "Cube"), "Cube", self._build_box, (size, size, size)),
+            (catalog.i18nc("@item:inlistbox", "Cylinder"), "Cylinder", self._build_cylinder, (size, size, sections)),
+            (catalog.i18nc("@item:inlistbox", "Sphere"), "Sphere", self._build_sphere, (size, self._sphereSubdivisions(size / 2))),
+            (catalog.i18nc("@item:inlistbox", "Tube"), "Tube", self._build_tube, (size, size / 2, size, sections)),
+            (catalog.i18nc("@item:inlistbox", "Cone"), "Cone", self._build_cone, (size, size, sections)),
+            (catalog.i18nc("@item:inlistbox", "Custom Box"), *self._customShape("custom_box")),
+            (catalog.i18nc("@item:inlistbox", "Custom Cylinder"), *self._customShape("custom_cylinder")),
+            (catalog.i18nc("@item:inlistbox", "Custom Tube"), *self._customShape("custom_tube")),
+            (catalog.i18nc("@item:inlistbox", "Bridging Box"), *self._customShape("bridging_box")),
+            (catalog.i18nc("@item:inlistbox", "Bridging Tube"), *self._customShape("bridging_tube")),
+            (catalog.i18nc("@item:inlistbox", "Bridging Triangle"), *self._customShape("bridging_triangle")),
+            (catalog.i18nc("@item:inlistbox", "Calibration Cube"), "CalibrationCube", self._load_model_mesh_data,
+                ("CalibrationCube.stl",)),
+            (catalog.i18nc("@item:inlistbox", "Retract Test"), "RetractTest", self._load_model_mesh_data,
+                ("RetractTest.stl",)),
+            (catalog.i18nc("@item:inlistbox", "Flow Test"), "FlowTest", self._load_model_mesh_data,
+                ("FlowTest.stl",)),
+            (catalog.i18nc("@item:inlistbox", "Tolerance Test"), "Tolerance", self._load_model_mesh_data,
+                ("Tolerance.stl",)),
+            (catalog.i18nc("@item:inlistbox", "Hole Test"), *self._standardHoleTest()),
+            (catalog.i18nc("@item:inlistbox", "Overhang Test"), "OverhangTest", self._load_model_mesh_data,
+                ("Overhang.stl",)),
+        ]
+
+    @pyqtSlot(result="QVariantList")
+    def timing_stats(self) -> List[Dict]:
+        """p50 and p95 times (ms) of each stage of adding every recently added shape, slowest first.
+        Each entry has shape, count, triangles and <stage>_p50/<stage>_p95 for each of ShapeTimings.STAGES and total."""
+        return shape_timings.summary()
+
+    @pyqtSlot()
+    def clear_timing_stats(self) -> None:
+        shape_timings.clear()
+
+    @pyqtSlot()
+    def clear_mesh_cache(self) -> None:
+        """Deletes the shapes kept on disk between sessions."""
+        self._mesh_disk_cache.clear()
+        log("i", "Cleared the cached shapes")
+
+    def show_timings_dialog(self) -> None:
+        """Shows the table of how long shapes have taken to add. Only on the menu in debug mode."""
+        if self._timings_dialog is None:
+            self._timings_dialog = CuraApplication.getInstance().\
+                createQmlComponent(self._timings_qml, {"manager": self})
+        self._timings_dialog.show()
+
+    @pyqtSlot()
+    def make_multiple_shapes(self) -> None:
+        """Builds the chosen shape once and adds batch_count copies of it in a grid, as a single undo step."""
+        shapes = self._batchShapes()
+        shape_index = self._settings["batch_shape_index"]
+        if not 0 <= shape_index < len(shapes):
+            log("w", f"make_multiple_shapes got an invalid shape index {shape_index}")
+            return
+        _, mesh_name, build, build_args = shapes[shape_index]
+        count = max(1, self._settings["batch_count"])
+        spacing = self._settings["batch_spacing"]
+        self._startShapeJob(self._shapeJob(mesh_name, build, build_args),
+                            lambda mesh_data: self._addShapeGrid(mesh_name, mesh_data, count, spacing))
+
     def _add_bed_level_calibration(self) -> None:
         # Get the build plate Size
         machine_manager = CuraApplication.getInstance().getMachineManager()
@@ -726,32 +1070,93 @@ class CalibrationShapesReborn(QObject, Extension):
             factor_width=round((machine_width/100), 1)
             factor_depth=round((machine_depth/100), 1)
         else:
-            factor_width=int(machine_width/100)
-            factor_depth=int(machine_depth/100)
+            # Whole hundreds, unless the bed isn't even one hundred across
+            factor_width=int(machine_width/100) or round((machine_width/100), 1)
+            factor_depth=int(machine_depth/100) or round((machine_depth/100), 1)
+        # A scale of 0 would flatten it to nothing, which is what a bed under 5 mm rounds to
+        factor_width=max(factor_width, 0.1)
+        factor_depth=max(factor_depth, 0.1)
 
         # Logger.log("d", "factor_w= %.1f", factor_w)
         # Logger.log("d", "factor_d= %.1f", factor_d)
 
-        model_definition_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "ParametricBedLevel.stl")
-        mesh = trimesh.load(model_definition_path)
-        origin = [0, 0, 0]
-        direction_x = [1, 0, 0]
-        direction_y = [0, 1, 0]
-        # DirZ = [0, 0, 1]
-        mesh.apply_transform(trimesh.transformations.scale_matrix(factor_width, origin, direction_x))
-        mesh.apply_transform(trimesh.transformations.scale_matrix(factor_depth, origin, direction_y))
-        # addShape
-        self._addShape("BedLevelCalibration",self._toMeshData(mesh))
-
-    def _registerShapeStl(self, mesh_name, mesh_filename=None, **kwargs) -> None:
+        self._queueShape("BedLevelCalibration", self._build_bed_level_calibration, factor_width, factor_depth)
+
+    def _build_bed_level_calibration(self, options: MeshOptions, factor_width: float, factor_depth: float) -> MeshData:
+        # Stretched across the bed around the origin, in the same pass that lays it down
+        scale = numpy.diag((factor_width, factor_depth, 1.0, 1.0))
+        return self._load_model_mesh_data(options, "ParametricBedLevel.stl", transform=scale)
+
+    def _registerShapeStl(self, mesh_name, mesh_filename=None, extruder_position = 0) -> None:
         if mesh_filename is None:
             mesh_filename = mesh_name + ".stl"
 
-        model_definition_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", mesh_filename)
-        mesh =  trimesh.load(model_definition_path)
+        self._queueShape(mesh_name, self._load_model_mesh_data, self._modelVariant(mesh_filename),
+                         extruder_position = extruder_position)
+
+    def _modelVariant(self, mesh_filename: str) -> str:
+        """The reduced detail version of a bundled model if they're turned on and it has one, otherwise mesh_filename.
+        Reduced versions are made by tools/decimate_models.py and stay within 0.005 mm of the original."""
+        if self._reduced_models and self._hasModel(f"{REDUCED_MODELS_DIR}/{mesh_filename}"):
+            return f"{REDUCED_MODELS_DIR}/{mesh_filename}"
+        return mesh_filename
+
+    def _hasModel(self, mesh_filename: str) -> bool:
+        """Whether a bundled model is in the asset pack or has an STL file. Release packages only have the pack."""
+        if self._asset_pack is not None:
+            try:
+                if mesh_filename in self._asset_pack:
+                    return True
+            except (OSError, ValueError):
+                pass  # Loading the model will report it and stop using the pack
+        return os.path.isfile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", *mesh_filename.split("/")))
+
+    def _load_model_mesh_data(self, options: MeshOptions, mesh_filename: str, transform: Optional[numpy.ndarray] = None) -> MeshData:
+        """Gets the MeshData for one of the bundled models, using the quickest source available.
+        The asset pack and binary STLs are read straight into MeshData, anything else goes through trimesh.
+        transform is a 4x4 matrix applied to the model before it's laid down."""
+        packed = self._load_packed_model(mesh_filename)
+        if packed is not None:
+            vertices, faces, face_normals = packed
+            return self._trianglesToMeshData(options, vertices[faces], face_normals, transform)
 
-        # addShape
-        self._addShape(mesh_name,self._toMeshData(mesh), **kwargs)
+        model_definition_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", mesh_filename)
+        try:
+            with shape_timings.stage("load"):
+                stl = read_binary_stl(model_definition_path)
+        except (OSError, ValueError) as e:
+            log("w", f"Couldn't memory map {mesh_filename}, loading it with trimesh instead: {e}")
+            stl = None
+        if stl is not None:
+            triangles, facet_normals = stl
+            return self._trianglesToMeshData(options, triangles, facet_normals, transform)
+
+        vertices, faces = self._load_model(mesh_filename)
+        return self._indexedToMeshData(options, vertices, faces, transform=transform)
+
+    def _load_model(self, mesh_filename: str) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Loads one of the bundled models with trimesh, for the ones that can't be memory mapped
+        (ASCII STLs that aren't in the asset pack, which only happens without a built pack). Returns (vertices, faces)."""
+        model_definition_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", mesh_filename)
+        with shape_timings.stage("load"):
+            trimesh = import_trimesh()
+            mesh = trimesh.load(model_definition_path)
+        return mesh.vertices, mesh.faces
+
+    def _load_packed_model(self, mesh_filename: str) -> Optional[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+        """Gets (vertices, faces, face_normals) for a model from the asset pack, or None if it's not in there."""
+        if self._asset_pack is None:
+            return None
+        try:
+            with shape_timings.stage("load"):
+                packed = self._asset_pack.get(mesh_filename)
+        except (OSError, ValueError) as e:
+            log("w", f"Couldn't read the model asset pack, using STL files instead: {e}")
+            self._asset_pack = None
+            return None
+        if packed is None:
+            log("d", f"{mesh_filename} isn't in the model asset pack")
+        return packed
 
     def _add_calibration_cube(self) -> None:
         self._registerShapeStl("CalibrationCube")
@@ -790,7 +1195,35 @@ class CalibrationShapesReborn(QObject, Extension):
         self._registerShapeStl("FlowTest", "FlowTest.stl")
 
     def _add_hole_test(self) -> None:
-        self._registerShapeStl("FlowTest", "HoleTest.stl")
+        mesh_name, build, build_args = self._standardHoleTest()
+        self._queueShape(mesh_name, build, *build_args)
+
+    @pyqtSlot()
+    def make_custom_hole_test(self) -> None:
+        mesh_name, build, build_args = self._customShape("hole_test")
+        self._queueShape(mesh_name, build, *build_args)
+
+    def _standardHoleTest(self) -> Tuple[str, Callable[..., MeshData], tuple]:
+        """_customShape for the hole test at its standard sizes, whatever the custom hole test dialog
+        was last set to. They make the same holes as the STL it replaced."""
+        defaults = {name: default for name, (_, default) in DIALOG_SETTINGS.items()}
+        return "HoleTest", self._build_hole_test, self._holeTestArgs(defaults)
+
+    def _holeTestArgs(self, settings: Dict) -> tuple:
+        """Arguments for _build_hole_test from the hole test settings in settings. There's a hole every step from
+        the smallest diameter up to the largest (or as near as the steps get to it)."""
+        diameters = ShapeGenerators.stepped_values(settings["hole_test_min_diameter"], settings["hole_test_max_diameter"],
+                                                   settings["hole_test_step"], self.HOLE_TEST_MAX_HOLES)
+        segments = tuple(self._sections(diameter / 2 + settings["hole_test_wall_width"]) for diameter in diameters)
+        return diameters, settings["hole_test_wall_width"], settings["hole_test_height"], segments
+
+    def _build_hole_test(self, options: MeshOptions, hole_diameters: tuple, wall_width: float, height: float, segments: tuple) -> MeshData:
+        """Generates the hole test from models/HoleTest.scad with any hole sizes. The default settings
+        make the same holes as the STL it replaced (1 to 15 mm, 1.3 mm walls, 5 mm high) on the same 24 mm circle,
+        spaced a little differently (see ShapeGenerators.hole_test)."""
+        vertices, indices, face_normals = ShapeGenerators.hole_test(numpy.array(hole_diameters), wall_width, height,
+                                                                    numpy.array(segments))
+        return self._indexedToMeshData(options, vertices, indices, face_normals)
 
     def _add_tolerance(self) -> None:
         self._registerShapeStl("Tolerance")
@@ -814,443 +1247,557 @@ class CalibrationShapesReborn(QObject, Extension):
     #   Dual Extruder 
     #----------------------------- 
     def _add_cube_bi_color(self) -> None:
-        self._registerShapeStl("CubeBiColorExt1", "CubeBiColorWhite.stl", ext_pos=1)
-        self._registerShapeStl("CubeBiColorExt2", "CubeBiColorRed.stl", ext_pos=2)
+        self._registerShapeStl("CubeBiColorExt1", "CubeBiColorWhite.stl", extruder_position=1)
+        self._registerShapeStl("CubeBiColorExt2", "CubeBiColorRed.stl", extruder_position=2)
 
     def _add_calibration_cube_bi_color(self) -> None:
-        self._registerShapeStl("CubeBiColorExt", "HollowCalibrationCube.stl", ext_pos=1)
-        self._registerShapeStl("CubeBiColorInt", "HollowCenterCube.stl", ext_pos=2)
+        self._registerShapeStl("CubeBiColorExt", "HollowCalibrationCube.stl", extruder_position=1)
+        self._registerShapeStl("CubeBiColorInt", "HollowCenterCube.stl", extruder_position=2)
 
     def _add_extruder_offset_calibration(self) -> None:
         self._registerShapeStl("CalibrationMultiExtruder1",
-                               "nozzle-to-nozzle-xy-offset-calibration-pattern-a.stl", ext_pos=1)
+                               "nozzle-to-nozzle-xy-offset-calibration-pattern-a.stl", extruder_position=1)
         self._registerShapeStl("CalibrationMultiExtruder1",
-                               "nozzle-to-nozzle-xy-offset-calibration-pattern-b.stl", ext_pos=2)
+                               "nozzle-to-nozzle-xy-offset-calibration-pattern-b.stl", extruder_position=2)
 
     #-----------------------------
     #   Standard Geometry
     #-----------------------------
     def _add_cube(self) -> None:
-        mesh = trimesh.creation.box(extents = [self._shape_size, self._shape_size, self._shape_size])
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._shape_size*0.5]))
-        self._addShape("Cube", self._toMeshData(mesh))
+        self._queueShape("Cube", self._build_box, self._shape_size, self._shape_size, self._shape_size)
 
     def _add_cylinder(self) -> None:
-        mesh = trimesh.creation.cylinder(radius = self._shape_size / 2, height = self._shape_size, sections=90)
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._shape_size*0.5]))
-        self._addShape("Cylinder", self._toMeshData(mesh))
+        self._queueShape("Cylinder", self._build_cylinder, self._shape_size, self._shape_size,
+                         self._sections(self._shape_size / 2))
 
     def _add_tube(self) -> None:
-        mesh = trimesh.creation.annulus(r_min = self._shape_size / 4, r_max = self._shape_size / 2, height = self._shape_size, sections = 90)
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._shape_size*0.5]))
-        self._addShape("Tube", self._toMeshData(mesh))
+        self._queueShape("Tube", self._build_tube, self._shape_size, self._shape_size / 2, self._shape_size,
+                         self._sections(self._shape_size / 2))
 
     def _add_sphere(self) -> None:
-        # subdivisions (int) – How many times to subdivide the mesh. Note that the number of faces will grow as function of 4 ** subdivisions, so you probably want to keep this under ~5
-        mesh = trimesh.creation.icosphere(subdivisions=4,radius = self._shape_size / 2,)
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._shape_size*0.5]))
-        self._addShape("Sphere", self._toMeshData(mesh))
+        self._queueShape("Sphere", self._build_sphere, self._shape_size, self._sphereSubdivisions(self._shape_size / 2))
         
     def _add_cone(self) -> None:
-        mesh = trimesh.creation.cone(self._shape_size/2, self._shape_size, sections=90)
-        # For some reason the cone seems to start at Z0 even though the docs say Z centred on origin.
-        #mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._shape_size*0.5]))
-        self._addShape("Cone", self._toMeshData(mesh))
+        self._queueShape("Cone", self._build_cone, self._shape_size, self._shape_size,
+                         self._sections(self._shape_size / 2))
+
+    def _build_box(self, options: MeshOptions, width: float, depth: float, height: float) -> MeshData:
+        return self._indexedToMeshData(options, *ShapeGenerators.box(width, depth, height))
+
+    def _build_cylinder(self, options: MeshOptions, diameter: float, height: float, sections: int = FIXED_SECTIONS) -> MeshData:
+        return self._indexedToMeshData(options, *ShapeGenerators.cylinder(diameter / 2, height, sections, options.smooth))
+
+    def _build_tube(self, options: MeshOptions, outer_diameter: float, inner_diameter: float, height: float,
+                    sections: int = FIXED_SECTIONS) -> MeshData:
+        return self._indexedToMeshData(options, *ShapeGenerators.tube(outer_diameter / 2, inner_diameter / 2, height, sections,
+                                                                      options.smooth))
+
+    def _check_tube(self, outer_diameter: float, inner_diameter: float, height: float,
+                    sections: int = FIXED_SECTIONS) -> None:
+        ShapeGenerators.check_tube(outer_diameter / 2, inner_diameter / 2)
+
+    def _build_sphere(self, options: MeshOptions, diameter: float, subdivisions: int = FIXED_SPHERE_SUBDIVISIONS) -> MeshData:
+        """Scales a unit sphere, which only has to be subdivided once. Scaling doesn't change its normals."""
+        with self._unit_spheres_lock:
+            unit_sphere = self._unit_spheres.get((subdivisions, options))
+        if unit_sphere is None:
+            trimesh = import_trimesh()
+            # subdivisions (int) – How many times to subdivide the mesh. Note that the number of faces will grow as function of 4 ** subdivisions, so you probably want to keep this under ~5
+            icosphere = trimesh.creation.icosphere(subdivisions=subdivisions, radius=1)
+            # Every point on a unit sphere is its own normal
+            corner_normals = icosphere.vertices[icosphere.faces] if options.smooth else None
+            unit_sphere = self._toMeshData(options, icosphere, corner_normals)
+            with self._unit_spheres_lock:
+                self._unit_spheres[(subdivisions, options)] = unit_sphere
+        radius = diameter / 2
+        vertices = unit_sphere.getVertices() * numpy.float32(radius)
+        vertices[:, 1] += radius  # Up is Y once laid down
+        return MeshData(vertices=vertices, indices=unit_sphere.getIndices(), normals=unit_sphere.getNormals())
+
+    def _build_cone(self, options: MeshOptions, diameter: float, height: float, sections: int = FIXED_SECTIONS) -> MeshData:
+        return self._indexedToMeshData(options, *ShapeGenerators.cone(diameter / 2, height, sections, options.smooth))
         
     #------------------
     #  Custom Stuff
     # -----------------
     @pyqtSlot()
     def make_custom_box(self) -> None:
-        mesh = trimesh.creation.box(extents = [self._custom_box_width, self._custom_box_depth, self._custom_box_height])
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._custom_box_height*0.5]))
-        self._addShape("Custom Box", self._toMeshData(mesh))
+        mesh_name, build, build_args = self._customShape("custom_box")
+        self._queueShape(mesh_name, build, *build_args)
     
     @pyqtSlot()
     def make_custom_cylinder(self) -> None:
-        mesh = trimesh.creation.cylinder(radius = self._custom_cylinder_diameter / 2, height = self._custom_cylinder_height, sections=90)
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._custom_cylinder_height*0.5]))
-        self._addShape("Custom Cylinder", self._toMeshData(mesh))
+        mesh_name, build, build_args = self._customShape("custom_cylinder")
+        self._queueShape(mesh_name, build, *build_args)
     
     @pyqtSlot()
     def make_custom_tube(self) -> None:
-        mesh = trimesh.creation.annulus(r_min = self._custom_tube_inner_diameter / 2, r_max = self._custom_tube_outer_diameter / 2, height = self._custom_tube_height, sections=90)
-        mesh.apply_transform(trimesh.transformations.translation_matrix([0, 0, self._custom_tube_height*0.5]))
-        self._addShape("Custom Tube", self._toMeshData(mesh))
+        mesh_name, build, build_args = self._customShape("custom_tube")
+        self._queueShape(mesh_name, build, *build_args)
+
+    def _customShape(self, kind: str, overrides: Optional[Dict] = None) -> Tuple[str, Callable[..., MeshData], tuple]:
+        """(node name, build function, build arguments) for the shape made by one of the dialogs,
+        from the values currently set in it. kind is the dialog's shape, like custom_box or bridging_tube.
+        overrides are {setting: value} to use instead of what the dialog has."""
+        settings = self._settings if overrides is None else {**self._settings, **overrides}
+        if kind == "custom_box":
+            return "Custom Box", self._build_box, \
+                (settings["custom_box_width"], settings["custom_box_depth"], settings["custom_box_height"])
+        if kind == "custom_cylinder":
+            return "Custom Cylinder", self._build_cylinder, \
+                (settings["custom_cylinder_diameter"], settings["custom_cylinder_height"],
+                 self._sections(settings["custom_cylinder_diameter"] / 2))
+        if kind == "custom_tube":
+            return "Custom Tube", self._build_tube, \
+                (settings["custom_tube_outer_diameter"], settings["custom_tube_inner_diameter"], settings["custom_tube_height"],
+                 self._sections(settings["custom_tube_outer_diameter"] / 2))
+        if kind == "bridging_box":
+            return "Bridging Box", self._build_bridging_box, \
+                (settings["bridging_box_width"], settings["bridging_box_depth"], settings["bridging_box_wall_width"],
+                 settings["bridging_box_height"], settings["bridging_box_roof_height"])
+        if kind == "bridging_tube":
+            return "Bridging Tube", self._build_bridging_tube, \
+                (settings["bridging_tube_outer_diameter"], settings["bridging_tube_inner_diameter"],
+                 settings["bridging_tube_height"], settings["bridging_tube_roof_height"],
+                 self._sections(settings["bridging_tube_outer_diameter"] / 2, fixed=96))
+        if kind == "bridging_triangle":
+            return "Bridging Triangle", self._build_bridging_triangle, \
+                (settings["bridging_triangle_base_width"], settings["bridging_triangle_base_depth"],
+                 settings["bridging_triangle_wall_width"], settings["bridging_triangle_height"],
+                 settings["bridging_triangle_roof_height"])
+        if kind == "hole_test":
+            return "HoleTest", self._build_hole_test, self._holeTestArgs(settings)
+        if kind == "sweep":
+            return self._sweepShape()
+        raise ValueError(f"Unknown custom shape {kind}")
     
+    @pyqtSlot()
+    def make_custom_sweep(self) -> None:
+        mesh_name, build, build_args = self._customShape("sweep")
+        self._queueShape(mesh_name, build, *build_args)
+
+    def _sweepShape(self) -> Tuple[str, Callable[..., MeshData], tuple]:
+        """_customShape for the sweep: the chosen shape with the chosen parameter at every step from sweep_start
+        to sweep_end, and the rest of its sizes from its own dialog."""
+        kind, parameter = self._sweepParameter(self._settings["sweep_shape_index"], self._settings["sweep_parameter_index"])
+        values = ShapeGenerators.stepped_values(self._settings["sweep_start"], self._settings["sweep_end"],
+                                                self._settings["sweep_step"], self.SWEEP_MAX_VARIANTS)
+        variants = []
+        for value in values:
+            _, build, build_args = self._customShape(kind, {parameter: value})
+            variants.append((build.__name__, build_args))
+        mesh_name = f"{self._customShape(kind)[0]} Sweep"
+        return mesh_name, self._build_sweep, (tuple(variants), tuple(f"{value:g}" for value in values))
+
+    def _checkShape(self, build: Callable[..., MeshData], build_args: tuple) -> None:
+        """Raises the ValueError build would with build_args, from the sizes alone without building anything.
+        The checks are build's name with _check_ in place of _build_. Shapes without one fit at any size."""
+        check = getattr(self, build.__name__.replace("_build_", "_check_", 1), None)
+        if check is not None:
+            check(*build_args)
+
+    def _sweepParameter(self, shape_index: int, parameter_index: int) -> Tuple[str, str]:
+        """(_customShape kind, setting) a sweep steps for the shape and parameter chosen in its dialog.
+        Indexes out of range are taken as the nearest one."""
+        shapes = self._sweepShapes()
+        _, kind, parameters = shapes[min(max(shape_index, 0), len(shapes) - 1)]
+        return kind, parameters[min(max(parameter_index, 0), len(parameters) - 1)][1]
+
+    def _build_sweep(self, options: MeshOptions, variants: tuple, labels: tuple) -> MeshData:
+        """One mesh of every variant ((build function name, build arguments) for each) in a grid,
+        each with its label in seven segment digits on the build plate in front of it.
+        A sweep is a single node however many variants there are."""
+        meshes = [getattr(self, build_name)(options, *build_args) for build_name, build_args in variants]
+        texts = [ShapeGenerators.seven_segment(label, self.SWEEP_LABEL_HEIGHT, self.SWEEP_LABEL_STROKE) for label in labels]
+        # Laid down meshes are Y-up with the front towards +Z, so their footprint in model coordinates is X by -Z
+        lower = numpy.array([mesh.getVertices().min(axis=0) for mesh in meshes])
+        upper = numpy.array([mesh.getVertices().max(axis=0) for mesh in meshes])
+        shape_sizes = (upper - lower)[:, (0, 2)]
+        label_widths = numpy.array([width for _, width in texts])
+        label_depth = self.SWEEP_LABEL_STROKE + self.SWEEP_LABEL_HEIGHT
+        sizes = numpy.column_stack((numpy.maximum(shape_sizes[:, 0], label_widths), shape_sizes[:, 1] + label_depth))
+        centres = ShapeGenerators.grid_layout(sizes, self.SWEEP_SPACING)
+
+        # Each shape at the back of its cell and its label at the front
+        tops = centres[:, 1] + sizes[:, 1] / 2
+        shifts = numpy.zeros((len(meshes), 3), dtype=numpy.float32)
+        shifts[:, 0] = centres[:, 0] - (lower[:, 0] + upper[:, 0]) / 2
+        shifts[:, 2] = -(tops - shape_sizes[:, 1]) - upper[:, 2]
+        rectangles = numpy.concatenate([rectangles + (x - width / 2, y, x - width / 2, y) for (rectangles, width), x, y
+                                        in zip(texts, centres[:, 0], centres[:, 1] - sizes[:, 1] / 2)])
+        label_boxes = ShapeGenerators.boxes(numpy.column_stack((rectangles[:, :2], numpy.zeros(len(rectangles)))),
+                                            numpy.column_stack((rectangles[:, 2:], numpy.full(len(rectangles), self.SWEEP_LABEL_THICKNESS))))
+        meshes.append(self._indexedToMeshData(options, *label_boxes))
+        shifts = numpy.vstack((shifts, numpy.zeros((1, 3), dtype=numpy.float32)))
+
+        with shape_timings.stage("convert"):
+            vertices = numpy.concatenate([mesh.getVertices() + shift for mesh, shift in zip(meshes, shifts)])
+            normals = numpy.concatenate([mesh.getNormals() for mesh in meshes])
+            offsets = numpy.cumsum([0] + [mesh.getVertexCount() for mesh in meshes[:-1]])
+            indices = numpy.concatenate([(mesh.getIndices() if mesh.getIndices() is not None else
+                                          numpy.arange(mesh.getVertexCount(), dtype=numpy.int32).reshape(-1, 3)) + offset
+                                         for mesh, offset in zip(meshes, offsets)]).astype(numpy.int32)
+            return MeshData(vertices=vertices, normals=normals, indices=indices)
+
     #------------------
     #  Bridging Stuff
     # -----------------
     @pyqtSlot()
     def make_custom_bridging_box(self) -> None:
         """Function that actually creates a bridging box."""
-        height = self._bridging_box_height
-        width = self._bridging_box_width
-        depth = self._bridging_box_depth
-        wall_width = self._bridging_box_wall_width
-        roof_height = self._bridging_box_roof_height
-        
-        bridging_box_mesh_data = self.generate_capped_cuboid(width, depth, wall_width, height, roof_height)
-        bridging_box = self._toTriMesh(bridging_box_mesh_data)
-        
-        self._addShape("Bridging Box", self._toMeshData(bridging_box))
-    
-    def generate_capped_cuboid(self, width, depth, wall_width, height, cap_thickness):
-        mesh = MeshBuilder()
-        
-        cap_height = height - cap_thickness  # Where the cap starts
-        
-        outer_vertices = [
-            Vector(-width/2, -depth/2, 0), Vector(width/2, -depth/2, 0),
-            Vector(width/2, depth/2, 0), Vector(-width/2, depth/2, 0),
-            Vector(-width/2, -depth/2, height), Vector(width/2, -depth/2, height),
-            Vector(width/2, depth/2, height), Vector(-width/2, depth/2, height)
-        ]
-        
-        inner_vertices = [
-            Vector(-width/2 + wall_width, -depth/2 + wall_width, 0),
-            Vector(width/2 - wall_width, -depth/2 + wall_width, 0),
-            Vector(width/2 - wall_width, depth/2 - wall_width, 0),
-            Vector(-width/2 + wall_width, depth/2 - wall_width, 0),
-            Vector(-width/2 + wall_width, -depth/2 + wall_width, cap_height),
-            Vector(width/2 - wall_width, -depth/2 + wall_width, cap_height),
-            Vector(width/2 - wall_width, depth/2 - wall_width, cap_height),
-            Vector(-width/2 + wall_width, depth/2 - wall_width, cap_height)
-        ]
-        
-        for v in outer_vertices + inner_vertices:
-            mesh.addVertex(v.x, v.y, v.z)
-        
-        # Walls
-        for i in range(4):
-            mesh.addQuad(outer_vertices[i], outer_vertices[(i+1)%4], outer_vertices[(i+1)%4 + 4], outer_vertices[i+4])
-            mesh.addQuad(inner_vertices[(i+1)%4], inner_vertices[i], inner_vertices[i+4], inner_vertices[(i+1)%4 + 4])
-        
-        # Cap top
-        mesh.addQuad(outer_vertices[7], outer_vertices[6], outer_vertices[5], outer_vertices[4])
-        
-        # Bottom cap inside
-        mesh.addQuad(inner_vertices[4], inner_vertices[5], inner_vertices[6], inner_vertices[7])
-        
-        # Bottom rim (separate quads for each base of the walls)
-        for i in range(4):
-            mesh.addQuad(inner_vertices[i], inner_vertices[(i+1)%4], outer_vertices[(i+1)%4], outer_vertices[i])
-        return mesh.build()
+        mesh_name, build, build_args = self._customShape("bridging_box")
+        self._queueShape(mesh_name, build, *build_args)
+
+    def _build_bridging_box(self, options: MeshOptions, width, depth, wall_width, height, roof_height) -> MeshData:
+        return self._indexedToMeshData(options, *ShapeGenerators.capped_prism(ShapeGenerators.rectangle(width, depth),
+                                                                              wall_width, height, roof_height))
 
+    def _check_bridging_box(self, width, depth, wall_width, height, roof_height) -> None:
+        ShapeGenerators.check_capped_prism(ShapeGenerators.rectangle(width, depth), wall_width, height, roof_height)
         
     @pyqtSlot()
     def make_custom_bridging_tube(self) -> None:
         """Function that actually creates a tube with a roof."""
-        outer_diameter = self._bridging_tube_outer_diameter
-        inner_diameter = self._bridging_tube_inner_diameter
-        height = self._bridging_tube_height
-        roof_height = self._bridging_tube_roof_height
-        
-        bridging_tube_mesh_data = self.generate_capped_tube(outer_diameter, inner_diameter, height, roof_height)
-        bridging_tube = self._toTriMesh(bridging_tube_mesh_data)
-        # For whatever reason it lacks colour as a MeshData and I get exceptions trying to calculate the normals.
-        self._addShape("Bridging Tube",self._toMeshData(bridging_tube))
-    
-    def generate_capped_tube(self, outer_diameter, inner_diameter, height, cap_thickness, segments=96):
-        mesh = MeshBuilder()
-        
-        outer_radius = outer_diameter / 2.0
-        inner_radius = inner_diameter / 2.0
-        cap_height = height - cap_thickness  # Where the cap starts
-        
-        vertices = []
-    
-        # Generate vertices
-        for i in range(segments):
-            angle = (2.0 * math.pi * i) / segments
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-            
-            # Outer tube
-            vertices.append(Vector(outer_radius * cos_a, outer_radius * sin_a, 0))  # Bottom outer
-            vertices.append(Vector(outer_radius * cos_a, outer_radius * sin_a, cap_height))  # Top outer
-            
-            # Inner tube
-            vertices.append(Vector(inner_radius * cos_a, inner_radius * sin_a, 0))  # Bottom inner
-            vertices.append(Vector(inner_radius * cos_a, inner_radius * sin_a, cap_height))  # Top inner
-            
-            # Cap outer
-            vertices.append(Vector(outer_radius * cos_a, outer_radius * sin_a, height))  # Cap outer
-            
-            # Cap base
-            vertices.append(Vector(inner_radius * cos_a, inner_radius * sin_a, cap_height))  # Cap inner base
-        
-        center_cap = Vector(0, 0, height)  # Center of the cap
-        center_cap_base = Vector(0, 0, cap_height)  # Center of the cap base
-        
-        # Add vertices to the mesh
-        for vert in vertices:
-            mesh.addVertex(vert.x, vert.y, vert.z)
-        mesh.addVertex(center_cap.x, center_cap.y, center_cap.z)
-        mesh.addVertex(center_cap_base.x, center_cap_base.y, center_cap_base.z)
-        
-        # Generate faces
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            v0, v1, v2, v3, v4, v5 = vertices[i * 6], vertices[i * 6 + 1], vertices[i * 6 + 2], vertices[i * 6 + 3], vertices[i * 6 + 4], vertices[i * 6 + 5]
-            v0_next, v1_next, v2_next, v3_next, v4_next, v5_next = vertices[next_i * 6], vertices[next_i * 6 + 1], vertices[next_i * 6 + 2], vertices[next_i * 6 + 3], vertices[next_i * 6 + 4], vertices[next_i * 6 + 5]
-            
-            # Outer wall
-            mesh.addQuad(v0, v1, v1_next, v0_next)
-            
-            # Inner wall
-            mesh.addQuad(v2_next, v3_next, v3, v2)
-            
-            # Top cap side
-            mesh.addQuad(v1, v4, v4_next, v1_next)
-            
-            # Bottom rim (optional if needed)
-            mesh.addQuad(v2, v0, v0_next, v2_next)
-            
-            # Top cap outer (triangulated to center)
-            mesh.addFace(v4, v4_next, center_cap)
-            
-            # Bottom of cap (between inner and outer edges)
-            mesh.addQuad(v5, v3, v3_next, v5_next)
-            
-            # Bottom cap base (triangulated to center base)
-            mesh.addFace(v5_next, v5, center_cap_base)
+        mesh_name, build, build_args = self._customShape("bridging_tube")
+        self._queueShape(mesh_name, build, *build_args)
 
-        return mesh.build()
+    def _build_bridging_tube(self, options: MeshOptions, outer_diameter, inner_diameter, height, roof_height, segments=96) -> MeshData:
+        return self._indexedToMeshData(options, *ShapeGenerators.capped_tube(outer_diameter, inner_diameter, height,
+                                                                             roof_height, segments))
+
+    def _check_bridging_tube(self, outer_diameter, inner_diameter, height, roof_height, segments=96) -> None:
+        ShapeGenerators.check_capped_tube(outer_diameter, inner_diameter, height, roof_height)
 
     @pyqtSlot()
     def make_custom_bridging_triangle(self) -> None:
         """Function that creates a hollow triangular prism with a roof."""
-        width = self._bridging_triangle_base_width
-        depth = self._bridging_triangle_base_depth
-        height = self._bridging_triangle_height
-        wall_width = self._bridging_triangle_wall_width
-        roof_height = self._bridging_triangle_roof_height
-
-        bridging_triangle_mesh_data = self.generate_capped_triangle(width, depth, wall_width, height, roof_height)
-        bridging_triangle = self._toTriMesh(bridging_triangle_mesh_data)
-        bridging_triangle.apply_translation([-width/2, -depth/2, 0])
-        self._addShape("Bridging Triangle",self._toMeshData(bridging_triangle))
-        
-    def generate_capped_triangle(self, base, height, wall_width, total_height, cap_thickness):
-        """
-        Create a right-angled triangular prism in CCW order:
-        B = (0,0) bottom-left
-        A = (base,0) bottom-right (90° corner)
-        C = (base,height) top-right
-        Then offset inward by wall_width, extrude to total_height,
-        and add a 'cap' at (z=cap_height).
-        """
-        mesh = MeshBuilder()
-        
-        cap_height = total_height - cap_thickness  # Where the cap starts
-
-        # -----------------------------
-        # 1) Outer 2D loop (CCW)
-        # -----------------------------
-        B2D = Vector(0, 0, 0)
-        A2D = Vector(base, 0, 0)
-        C2D = Vector(base, height, 0)
-
-        outer_2D = [B2D, A2D, C2D]  # CCW
-
-        # -----------------------------
-        # 2) Offset each edge inward
-        # -----------------------------
-        def rotate_ccw(v: Vector) -> Vector:
-            # 2D rotate 90° CCW: (x, y) -> (-y, x)
-            return Vector(-v.y, v.x, 0)
-
-        def normalize(v: Vector) -> Vector:
-            length = math.sqrt(v.x**2 + v.y**2)
-            if length < 1e-9:
-                return Vector(0, 0, 0)
-            return Vector(v.x / length, v.y / length, 0)
-
-        def offset_edge(p0: Vector, p1: Vector, offset: float):
-            """
-            Returns (anchor, direction) for the line that is
-            'wall_width' inward from edge (p0->p1).
-            anchor = p0 shifted by the inward normal
-            direction = (p1 - p0)
-            """
-            edge = Vector(p1.x - p0.x, p1.y - p0.y, 0)
-            # 'Left' normal for CCW
-            left_normal = rotate_ccw(edge)
-            left_normal = normalize(left_normal)
-            # Shift p0 by +left_normal*offset
-            anchor = Vector(p0.x + left_normal.x*offset,
-                            p0.y + left_normal.y*offset, 0)
-            return (anchor, edge)
-
-        # For a CCW triangle, edges are:
-        #   E0: B->A
-        #   E1: A->C
-        #   E2: C->B
-        edges = [
-            offset_edge(outer_2D[0], outer_2D[1], wall_width),
-            offset_edge(outer_2D[1], outer_2D[2], wall_width),
-            offset_edge(outer_2D[2], outer_2D[0], wall_width)
-        ]
-
-        def intersect_lines(anchor1, dir1, anchor2, dir2):
-            """
-            Intersect two lines in 2D:
-            L1(t) = anchor1 + t*dir1
-            L2(u) = anchor2 + u*dir2
-            Return Vector of intersection or None if parallel.
-            """
-            # Solve:
-            # anchor1 + t*dir1 = anchor2 + u*dir2
-            # => anchor1.x + t*dir1.x = anchor2.x + u*dir2.x
-            # => anchor1.y + t*dir1.y = anchor2.y + u*dir2.y
-            denom = (dir1.x * dir2.y - dir1.y * dir2.x)
-            if abs(denom) < 1e-9:
-                # Parallel or degenerate
-                return None
-            dx = anchor2.x - anchor1.x
-            dy = anchor2.y - anchor1.y
-            t = (dx*dir2.y - dy*dir2.x) / denom
-            # Intersection coords
-            ix = anchor1.x + t*dir1.x
-            iy = anchor1.y + t*dir1.y
-            return Vector(ix, iy, 0)
-
-        # -----------------------------
-        # 3) Compute each inner vertex
-        # -----------------------------
-        # Vertex i_in = intersection of edges i-1, i in a cyc
-        # For B_in, edges are E2 (C->B) and E0 (B->A)
-        # For A_in, edges are E0 (B->A) and E1 (A->C)
-        # For C_in, edges are E1 (A->C) and E2 (C->B)
-        # We'll define a small helper to get the intersection.
-        def inner_vertex(e1_idx, e2_idx):
-            anchor1, dir1 = edges[e1_idx]
-            anchor2, dir2 = edges[e2_idx]
-            return intersect_lines(anchor1, dir1, anchor2, dir2)
-
-        B_in2D = inner_vertex(2, 0)
-        A_in2D = inner_vertex(0, 1)
-        C_in2D = inner_vertex(1, 2)
-
-        # -----------------------------
-        # 4) Build 3D: extrude in Z
-        # -----------------------------
-        # Outer bottom: B, A, C at z=0
-        # Outer top: B_top, A_top, C_top at z= total_height
-        # Inner bottom: B_in, A_in, C_in at z=0
-        # Inner top (cap base): B_in_top, A_in_top, C_in_top at z=cap_height
-        # We'll add them in a consistent order to the mesh.
-        B     = Vector(B2D.x,     B2D.y,     0)
-        A     = Vector(A2D.x,     A2D.y,     0)
-        C     = Vector(C2D.x,     C2D.y,     0)
-        B_top = Vector(B2D.x,     B2D.y,     total_height)
-        A_top = Vector(A2D.x,     A2D.y,     total_height)
-        C_top = Vector(C2D.x,     C2D.y,     total_height)
-
-        # Make sure the intersections returned valid points:
-        # (If any is None, we have a degenerate case.)
-        if not (B_in2D and A_in2D and C_in2D):
-            # Fallback: no offset or raise an error
-            # But for brevity, just do a fallback:
-            B_in = B
-            A_in = A
-            C_in = C
+        mesh_name, build, build_args = self._customShape("bridging_triangle")
+        self._queueShape(mesh_name, build, *build_args)
+
+    def _build_bridging_triangle(self, options: MeshOptions, width, depth, wall_width, height, roof_height) -> MeshData:
+        """Right-angled triangular prism centred on the origin, with the 90° corner at the bottom right."""
+        return self._indexedToMeshData(options, *ShapeGenerators.capped_prism(ShapeGenerators.right_triangle(width, depth),
+                                                                              wall_width, height, roof_height))
+
+    def _check_bridging_triangle(self, width, depth, wall_width, height, roof_height) -> None:
+        ShapeGenerators.check_capped_prism(ShapeGenerators.right_triangle(width, depth), wall_width, height, roof_height)
+
+    def _add_bridging_hexagon(self) -> None:
+        """Hexagonal version of the bridging tube, using the same dimensions."""
+        self._queueShape("Bridging Hexagon", self._build_bridging_polygon, "hexagon",
+                         self._settings["bridging_tube_outer_diameter"], self._settings["bridging_tube_inner_diameter"],
+                         self._settings["bridging_tube_height"], self._settings["bridging_tube_roof_height"])
+
+    def _add_bridging_star(self) -> None:
+        """Five pointed star version of the bridging tube, using the same dimensions."""
+        self._queueShape("Bridging Star", self._build_bridging_polygon, "star",
+                         self._settings["bridging_tube_outer_diameter"], self._settings["bridging_tube_inner_diameter"],
+                         self._settings["bridging_tube_height"], self._settings["bridging_tube_roof_height"])
+
+    def _build_bridging_polygon(self, options: MeshOptions, shape, outer_diameter, inner_diameter, height, roof_height) -> MeshData:
+        if shape == "star":
+            outline = ShapeGenerators.star_polygon(5, outer_diameter / 2, outer_diameter / 4)
         else:
-            B_in = Vector(B_in2D.x, B_in2D.y, 0)
-            A_in = Vector(A_in2D.x, A_in2D.y, 0)
-            C_in = Vector(C_in2D.x, C_in2D.y, 0)
-
-        B_in_top = Vector(B_in.x, B_in.y, cap_height)
-        A_in_top = Vector(A_in.x, A_in.y, cap_height)
-        C_in_top = Vector(C_in.x, C_in.y, cap_height)
-
-        # Add them all to the mesh as vertices
-        all_verts = [
-            B, A, C,
-            B_top, A_top, C_top,
-            B_in, A_in, C_in,
-            B_in_top, A_in_top, C_in_top
-        ]
-        for v in all_verts:
-            mesh.addVertex(v.x, v.y, v.z)
-
-        # -----------------------------
-        # 5) Build the walls
-        # -----------------------------
-        # Outer walls (vertical quads)
-        mesh.addQuad(B, A, A_top, B_top)  # edge BA
-        mesh.addQuad(A, C, C_top, A_top)  # edge AC
-        mesh.addQuad(C, B, B_top, C_top)  # edge CB
-
-        # Inner walls (vertical quads, reversed winding for outward normals)
-        mesh.addQuad(A_in, B_in, B_in_top, A_in_top)  # edge BA (inner)
-        mesh.addQuad(C_in, A_in, A_in_top, C_in_top)  # edge AC (inner)
-        mesh.addQuad(B_in, C_in, C_in_top, B_in_top)  # edge CB (inner)
-
-        # -----------------------------
-        # 6) Caps
-        # -----------------------------
-        # Outer cap (top) => single triangle
-        mesh.addFace(B_top, A_top, C_top)
-        # Inner cap (bottom of the cap) => single triangle
-        mesh.addFace(B_in_top, C_in_top, A_in_top)
-
-        # -----------------------------
-        # 7) Bottom rim
-        # -----------------------------
-        # Connect inner bottom to outer bottom
-        mesh.addQuad(B_in, A_in, A, B)  # edge BA
-        mesh.addQuad(A_in, C_in, C, A)  # edge AC
-        mesh.addQuad(C_in, B_in, B, C)  # edge CB
-
-        return mesh.build()
+            outline = ShapeGenerators.regular_polygon(6, outer_diameter / 2)
+        wall_width = (outer_diameter - inner_diameter) / 2
+        return self._indexedToMeshData(options, *ShapeGenerators.capped_prism(outline, wall_width, height, roof_height))
 
     #----------------------------------------
     # Initial Source code from  fieldOfView
     #----------------------------------------  
-    def _toTriMesh(self, mesh_data: MeshData) -> trimesh.base.Trimesh:
-        if not mesh_data:
-            return trimesh.base.Trimesh()
+    def _toMeshData(self, options: MeshOptions, tri_node: "trimesh.base.Trimesh", face_normals: Optional[numpy.ndarray] = None,
+                    transform: Optional[numpy.ndarray] = None) -> MeshData:
+        """Converts a Trimesh to MeshData laid down on the build plate. tri_node isn't changed.
+        transform is a 4x4 matrix to apply to the mesh first, which is done in the same pass.
+        If face_normals for the untransformed mesh are passed in they're used instead of recalculating them.
+        They can also be (n, 3, 3) normals for every corner of every face, for smooth shading."""
+        return self._indexedToMeshData(options, tri_node.vertices, tri_node.faces, face_normals, transform)
+
+    def _indexedToMeshData(self, options: MeshOptions, vertices: numpy.ndarray, faces: numpy.ndarray,
+                           face_normals: Optional[numpy.ndarray] = None, transform: Optional[numpy.ndarray] = None) -> MeshData:
+        """Builds MeshData laid down on the build plate from shared vertices and the (n, 3) faces indexing them,
+        like ShapeGenerators returns. Otherwise the same as _toMeshData."""
+        with shape_timings.stage("convert"):
+            # Rotate the part to laydown on the build plate
+            # Modification from 5@xes
+            matrix = lay_down_matrix(transform)
+            # Transforming the shared vertices before splitting them up per face is fewer vertices to do.
+            shared_vertices = numpy.matmul(vertices, matrix[:3, :3].T, dtype=numpy.float32)
+            shared_vertices += matrix[:3, 3].astype(numpy.float32)
+            # Based on source code from fieldOfView
+            # https://github.com/fieldOfView/Cura-SimpleShapes/blob/bac9133a2ddfbf1ca6a3c27aca1cfdd26e847221/SimpleShapes.py#L45
+            # Every face gets its own three vertices, so gather them all at once and number them in order.
+            face_count = len(faces)
+            vertices = shared_vertices[numpy.asarray(faces).reshape(-1)]
+            if face_normals is not None:
+                face_normals = transform_normals(face_normals.reshape(-1, 3), matrix).reshape(face_normals.shape)
+            if options.indexed:
+                return self._weldedMeshData(options, vertices.reshape(-1, 3, 3), face_normals)
+            indices = numpy.arange(face_count * 3, dtype=numpy.int32).reshape(-1, 3)
+            if face_normals is None:
+                with shape_timings.stage("normals"):
+                    normals = calculateNormalsFromIndexedVertices(vertices, indices, face_count)
+            elif face_normals.ndim == 3:
+                normals = face_normals.reshape(-1, 3)
+            else:
+                normals = numpy.repeat(face_normals, 3, axis=0)
+
+            mesh_data = MeshData(vertices=vertices, indices=indices, normals=normals)
+
+            return mesh_data
+        
+    def _trianglesToMeshData(self, options: MeshOptions, triangles: numpy.ndarray, face_normals: Optional[numpy.ndarray] = None,
+                             transform: Optional[numpy.ndarray] = None) -> MeshData:
+        """Builds MeshData laid down on the build plate from an (n, 3, 3) array of triangle corners,
+        after applying transform (a 4x4 matrix) if there is one.
+        The corners can be any view, such as a memory mapped file, and are only read once.
+        face_normals are used if they're all unit length, otherwise the normals are calculated."""
+        with shape_timings.stage("convert"):
+            face_count = len(triangles)
+            matrix = lay_down_matrix(transform)
+            vertices = numpy.matmul(triangles, matrix[:3, :3].T, dtype=numpy.float32).reshape(-1, 3)
+            if transform is not None:
+                vertices += matrix[:3, 3].astype(numpy.float32)
+            if face_normals is not None and numpy.allclose(numpy.einsum("ij,ij->i", face_normals, face_normals), 1.0, atol=1e-3):
+                face_normals = transform_normals(face_normals, matrix)
+            else:
+                face_normals = None
+            if options.indexed:
+                return self._weldedMeshData(options, vertices.reshape(-1, 3, 3), face_normals)
+            indices = numpy.arange(face_count * 3, dtype=numpy.int32).reshape(-1, 3)
+            if face_normals is not None:
+                normals = numpy.repeat(face_normals, 3, axis=0)
+            else:
+                with shape_timings.stage("normals"):
+                    normals = calculateNormalsFromIndexedVertices(vertices, indices, face_count)
+
+            return MeshData(vertices=vertices, indices=indices, normals=normals)
+
+    def _weldedMeshData(self, options: MeshOptions, triangles: numpy.ndarray,
+                        face_normals: Optional[numpy.ndarray] = None) -> MeshData:
+        """Builds indexed MeshData from laid down (n, 3, 3) triangle corners, sharing vertices between faces
+        except across hard edges. Uses about a third of the memory of a vertex per corner.
+        If face_normals are really (n, 3, 3) corner normals they decide which edges are hard.
+        Otherwise edges are smoothed up to SMOOTH_NORMAL_ANGLE with smooth normals on, and with them off
+        only faces facing exactly the same way share vertices, so it looks the same as without indexing."""
+        if face_normals is not None and face_normals.ndim == 3:
+            vertices, normals, indices = weld_corners(triangles, face_normals)
+        else:
+            smooth_angle = SMOOTH_NORMAL_ANGLE if options.smooth else 0.0
+            vertices, normals, indices = weld_triangles(triangles, face_normals, smooth_angle)
+        return MeshData(vertices=vertices, indices=indices, normals=normals)
+
+    def _curveTolerance(self) -> Optional[float]:
+        """How far facets of round shapes can be from the true surface in mm, or None to use fixed counts.
+        Based on the smallest nozzle on the printer, since detail finer than that won't print anyway."""
+        fraction = CURVE_QUALITY_TOLERANCES[self._curve_quality]
+        if fraction is None:
+            return None
+        application = CuraApplication.getInstance()
+        nozzle_sizes = []
+        for extruder_stack in application.getExtruderManager().getActiveExtruderStacks():
+            try:
+                nozzle_sizes.append(float(extruder_stack.getProperty("machine_nozzle_size", "value")))
+            except (TypeError, ValueError):
+                pass
+        nozzle_sizes = [size for size in nozzle_sizes if size > 0]
+        return (min(nozzle_sizes) if nozzle_sizes else DEFAULT_NOZZLE_SIZE) * fraction
+
+    def _sections(self, radius: float, fixed: int = FIXED_SECTIONS) -> int:
+        """Number of sections for a round shape of radius with the current curve quality."""
+        tolerance = self._curveTolerance()
+        if tolerance is None:
+            return fixed
+        return ShapeGenerators.segments_for_radius(radius, tolerance)
+
+    def _sphereSubdivisions(self, radius: float) -> int:
+        """Icosphere subdivisions for a sphere of radius with the current curve quality."""
+        tolerance = self._curveTolerance()
+        if tolerance is None:
+            return FIXED_SPHERE_SUBDIVISIONS
+        return ShapeGenerators.sphere_subdivisions(radius, tolerance)
+
+    def _queueShape(self, mesh_name: str, build: Callable[..., MeshData], *build_args, extruder_position = 0) -> None:
+        """Runs build(options, *build_args) on a worker thread and adds the MeshData it returns to the scene.
+        Any values the build needs from preferences or the machine should be read now and passed in,
+        since they can change before the job runs. The MeshOptions are passed in for it."""
+        self._startShapeJob(self._shapeJob(mesh_name, build, build_args),
+                            lambda mesh_data: self._addShape(mesh_name, mesh_data, extruder_position))
+
+    def _shapeJob(self, mesh_name: str, build: Callable[..., MeshData], build_args: tuple) -> ShapeJob:
+        """A ShapeJob for build(options, *build_args), with the MeshOptions as they're set now."""
+        return ShapeJob(mesh_name, build, self._meshOptions(), *build_args)
+
+    def _meshOptions(self) -> MeshOptions:
+        return MeshOptions(self._indexed_meshes, self._smooth_normals)
+
+    def _startShapeJob(self, job: ShapeJob, on_built: Callable[[MeshData], None]) -> None:
+        """Starts job and calls on_built on the main thread with its MeshData once it's done.
+        If a node in the scene already has the same geometry its MeshData is reused and the job isn't run,
+        and so is a recently built primitive or the preview being shown of it."""
+        if self._preview_mesh is not None and self._preview_mesh[0] == job.key:
+            mesh_data = self._preview_mesh[1]
+            self.stop_preview()
+            self._shared_mesh_data[job.key] = mesh_data
+            log("d", f"Using the preview of {job.mesh_name}")
+            self._finishShape(job, mesh_data, on_built)
+            return
+        shared = self._shared_mesh_data.get(job.key)
+        if shared is not None:
+            self._reportSharedMeshData(job.mesh_name, shared, 1)
+            self._finishShape(job, shared, on_built)
+            return
+        cached = self._primitive_mesh_data.get(job.key)
+        if cached is not None:
+            self._primitive_mesh_data.move_to_end(job.key)
+            self._shared_mesh_data[job.key] = cached
+            log("d", f"Reusing cached mesh for {job.mesh_name}")
+            self._finishShape(job, cached, on_built)
+            return
+        if job.key[0] in self.DISK_CACHE_BUILDS:
+            job.disk_cache = (self._mesh_disk_cache, self._diskCacheKey(job))
+        self._shape_jobs[job] = (on_built, None)
+        job.finished.connect(self._onShapeJobDone)
+        job.start()
+        QTimer.singleShot(self.PROGRESS_MESSAGE_DELAY_MS, lambda: self._showShapeJobProgress(job))
+
+    def _diskCacheKey(self, job: ShapeJob) -> str:
+        return cache_key(job.key, self._plugin_version, self.MESH_CACHE_FORMAT)
+
+    def _readPluginVersion(self) -> str:
+        """The version in plugin.json, so cached meshes from other versions aren't used."""
+        try:
+            with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugin.json"), encoding="utf-8") as plugin_file:
+                return str(json.load(plugin_file)["version"])
+        except (OSError, ValueError, KeyError) as e:
+            log("w", f"Couldn't read the plugin version from plugin.json: {e}")
+            return "unknown"
+
+    def _showShapeJobProgress(self, job: ShapeJob) -> None:
+        if job not in self._shape_jobs:
+            return  # Already finished
+        on_built, _ = self._shape_jobs[job]
+        message = Message(catalog.i18nc("@info:status", "Creating {0}...").format(job.mesh_name),
+                          lifetime = 0, dismissable = False, progress = -1,
+                          title = catalog.i18nc("@info:title", "Calibration Shapes"))
+        message.show()
+        self._shape_jobs[job] = (on_built, message)
+
+    def _onShapeJobDone(self, job: ShapeJob) -> None:
+        """finished is emitted on the worker thread, so hand the job back to the main thread before touching the scene."""
+        CuraApplication.getInstance().callLater(self._onShapeJobFinished, job)
+
+    def _onShapeJobFinished(self, job: ShapeJob) -> None:
+        on_built, message = self._shape_jobs.pop(job, (None, None))
+        if message is not None:
+            message.hide()
+        if on_built is None:
+            return
+        if job.hasError() or job.getResult() is None:
+            log("e", f"Couldn't create {job.mesh_name}: {job.getError()}")
+            if isinstance(job.getError(), ValueError):
+                # The generators' ValueErrors say which sizes don't work together
+                text = catalog.i18nc("@info:status", "Couldn't create {0}: {1}.").format(job.mesh_name, str(job.getError()))
+            else:
+                text = catalog.i18nc("@info:status", "Something went wrong creating {0}.").format(job.mesh_name)
+            Message(text,
+                    title = catalog.i18nc("@info:title", "Calibration Shapes"),
+                    message_type = Message.MessageType.ERROR).show()
+            return
+        if job.key[1][0] != self._meshOptions():
+            # The settings changed while it was being built, so it won't be asked for again
+            self._finishShape(job, job.getResult(), on_built)
+            return
+        self._shared_mesh_data[job.key] = job.getResult()
+        if job.key[0] in self.PRIMITIVE_BUILDS:
+            self._primitive_mesh_data[job.key] = job.getResult()
+            if len(self._primitive_mesh_data) > self.PRIMITIVE_CACHE_SIZE:
+                self._primitive_mesh_data.popitem(last=False)
+        self._finishShape(job, job.getResult(), on_built)
+
+    def _finishShape(self, job: ShapeJob, mesh_data: MeshData, on_built: Callable[[MeshData], None]) -> None:
+        """Calls on_built with the MeshData for job, timing it as part of the job's shape."""
+        job.timing.triangles = mesh_data.getFaceCount()
+        with shape_timings.recording(job.timing):
+            on_built(mesh_data)
+        shape_timings.finish(job.timing)
 
-        indices = mesh_data.getIndices()
-        if indices is None:
-            # some file formats (eg 3mf) don't supply indices, but have unique vertices per face
-            indices = numpy.arange(mesh_data.getVertexCount()).reshape(-1, 3)
+    @pyqtSlot(str)
+    def start_preview(self, kind: str) -> None:
+        """Shows a preview of the shape from one of the dialogs, which follows the dialog's values as they're set.
+        Only one shape is previewed at a time. Does nothing unless live preview is turned on."""
+        if not self._live_preview:
+            return
+        self._preview_kind = kind
+        self._schedulePreview()
+
+    @pyqtSlot()
+    def stop_preview(self) -> None:
+        """Takes the preview out of the scene and forgets about any preview being built."""
+        self._preview_kind = None
+        self._preview_timer.stop()
+        self._cancelPreviewJob()
+        self._preview_mesh = None
+        if self._preview_node is not None:
+            node = self._preview_node
+            self._preview_node = None
+            node.setParent(None)
+            self._controller.getScene().sceneChanged.emit(node)
+
+    def _schedulePreview(self) -> None:
+        """Updates the preview once there haven't been any changes for PREVIEW_DELAY_MS."""
+        if self._preview_kind is not None:
+            self._preview_timer.start()
+
+    def _cancelPreviewJob(self) -> None:
+        """Drops the preview job. If it's still waiting for a thread it's taken off the queue,
+        otherwise it's left to finish and its result is ignored."""
+        if self._preview_job is not None:
+            JobQueue.getInstance().remove(self._preview_job)
+            self._preview_job = None
+
+    def _startPreviewJob(self) -> None:
+        if self._preview_kind is None:
+            return
+        mesh_name, build, build_args = self._customShape(self._preview_kind)
+        job = self._shapeJob(mesh_name, build, build_args)
+        if self._preview_mesh is not None and self._preview_mesh[0] == job.key:
+            return  # Already showing this
+        self._cancelPreviewJob()
+        self._preview_job = job
+        job.finished.connect(self._onPreviewJobDone)
+        job.start()
+
+    def _onPreviewJobDone(self, job: ShapeJob) -> None:
+        CuraApplication.getInstance().callLater(self._onPreviewJobFinished, job)
+
+    def _onPreviewJobFinished(self, job: ShapeJob) -> None:
+        """Puts the new preview in the scene, replacing the old one's MeshData so it's still one node."""
+        if job is not self._preview_job or self._preview_kind is None:
+            return  # A newer preview has been started, or previewing has stopped
+        self._preview_job = None
+        if job.hasError() or job.getResult() is None:
+            log("w", f"Couldn't preview {job.mesh_name}: {job.getError()}")
+            return
+        mesh_data = job.getResult()
+        self._preview_mesh = (job.key, mesh_data)
+        scene = self._controller.getScene()
+        if self._preview_node is None:
+            self._preview_node = self._createShapeNode(job.mesh_name, mesh_data, sliceable=False)
+            self._preview_node.setParent(scene.getRoot())
+        else:
+            self._preview_node.setMeshData(mesh_data)
+            self._preview_node.setName(job.mesh_name)
+        scene.sceneChanged.emit(self._preview_node)
+
+    def _reportSharedMeshData(self, mesh_name: str, mesh_data: MeshData, duplicates: int) -> None:
+        """Logs how much memory was saved by duplicates extra nodes sharing mesh_data instead of having their own."""
+        node_bytes = sum(array.nbytes for array in (mesh_data.getVertices(), mesh_data.getNormals(), mesh_data.getIndices())
+                         if array is not None)
+        self._shared_mesh_bytes_saved += node_bytes * duplicates
+        log("d", f"{mesh_name} shares its mesh: saved {node_bytes / 1024:.0f} KiB per duplicate node, "
+            f"{self._shared_mesh_bytes_saved / 1024:.0f} KiB in total this session")
 
-        return trimesh.base.Trimesh(vertices=mesh_data.getVertices(), faces=indices)
-    
-    
-    def _toMeshData(self, tri_node: trimesh.base.Trimesh) -> MeshData:
-        # Rotate the part to laydown on the build plate
-        # Modification from 5@xes
-        tri_node.apply_transform(trimesh.transformations.rotation_matrix(math.radians(90), [-1, 0, 0]))
-        tri_faces = tri_node.faces
-        tri_vertices = tri_node.vertices
-        # Following Source code from  fieldOfView
-        # https://github.com/fieldOfView/Cura-SimpleShapes/blob/bac9133a2ddfbf1ca6a3c27aca1cfdd26e847221/SimpleShapes.py#L45
-        indices = []
-        vertices = []
-
-        index_count = 0
-        face_count = 0
-        for tri_face in tri_faces:
-            face = []
-            for tri_index in tri_face:
-                vertices.append(tri_vertices[tri_index])
-                face.append(index_count)
-                index_count += 1
-            indices.append(face)
-            face_count += 1
-
-        vertices = numpy.asarray(vertices, dtype=numpy.float32)
-        indices = numpy.asarray(indices, dtype=numpy.int32)
-        normals = calculateNormalsFromIndexedVertices(vertices, indices, face_count)
-
-        mesh_data = MeshData(vertices=vertices, indices=indices, normals=normals)
-
-        return mesh_data
-        
     # Initial Source code from  fieldOfView
     # https://github.com/fieldOfView/Cura-SimpleShapes/blob/bac9133a2ddfbf1ca6a3c27aca1cfdd26e847221/SimpleShapes.py#L70
     def _addShape(self, mesh_name, mesh_data: MeshData, extruder_position = 0) -> None:
@@ -1259,19 +1806,58 @@ class CalibrationShapesReborn(QObject, Extension):
         if not global_stack:
             return
 
+        with shape_timings.stage("scene"):
+            node = self._createShapeNode(mesh_name, mesh_data, extruder_position)
+
+            scene = self._controller.getScene()
+            scene_op = AddSceneNodeOperation(node, scene.getRoot())
+            scene_op.push()
+
+            scene.sceneChanged.emit(node)
+
+    def _addShapeGrid(self, mesh_name, mesh_data: MeshData, count: int, spacing: float, extruder_position = 0) -> None:
+        """Adds count nodes sharing mesh_data, laid out in a roughly square grid centred on the build plate
+        with spacing mm between them. They go in as one operation so they're undone together."""
+        application = CuraApplication.getInstance()
+        global_stack = application.getGlobalContainerStack()
+        if not global_stack:
+            return
+
+        extents = mesh_data.getExtents()
+        pitch_x = extents.width + spacing
+        pitch_z = extents.depth + spacing
+        columns = math.ceil(math.sqrt(count))
+        rows = math.ceil(count / columns)
+
+        with shape_timings.stage("scene"):
+            scene = self._controller.getScene()
+            grouped_op = GroupedOperation()
+            nodes = []
+            for index in range(count):
+                row, column = divmod(index, columns)
+                node = self._createShapeNode(mesh_name, mesh_data, extruder_position)
+                node.setPosition(Vector((column - (columns - 1) / 2) * pitch_x, 0, (row - (rows - 1) / 2) * pitch_z))
+                grouped_op.addOperation(AddSceneNodeOperation(node, scene.getRoot()))
+                nodes.append(node)
+            grouped_op.push()
+            if count > 1:
+                self._reportSharedMeshData(mesh_name, mesh_data, count - 1)
+
+            scene.sceneChanged.emit(nodes[-1])
+
+    def _createShapeNode(self, mesh_name, mesh_data: MeshData, extruder_position = 0, sliceable: bool = True) -> CuraSceneNode:
+        """Makes a sliceable node for mesh_data on the active build plate, set to the right extruder.
+        Nodes which aren't sliceable can't be selected either, which is what previews want."""
+        application = CuraApplication.getInstance()
         node = CuraSceneNode()
 
         node.setMeshData(mesh_data)
-        node.setSelectable(True)
+        node.setSelectable(sliceable)
         if len(mesh_name)==0:
             node.setName("TestPart" + str(id(mesh_data)))
         else:
             node.setName(str(mesh_name))
 
-        scene = self._controller.getScene()
-        scene_op = AddSceneNodeOperation(node, scene.getRoot())
-        scene_op.push()
-
         extruder_stack = application.getExtruderManager().getActiveExtruderStacks() 
 
         extruder_number=len(extruder_stack)
@@ -1289,6 +1875,7 @@ class CalibrationShapesReborn(QObject, Extension):
         active_build_plate = application.getMultiBuildPlateModel().activeBuildPlate
         node.addDecorator(BuildPlateDecorator(active_build_plate))
 
-        node.addDecorator(SliceableObjectDecorator())
+        if sliceable:
+            node.addDecorator(SliceableObjectDecorator())
 
-        application.getController().getScene().sceneChanged.emit(node)
\ No newline at end of file
+        return node
@@ -0,0 +1,174 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Keeps generated meshes on disk so the same shape doesn't have to be generated again next session.
+
+Every entry is one file, named after a hash of whatever identifies the mesh:
+    8 bytes     magic (b"CSRMESH1")
+    8 bytes     little endian uint32 vertex count and face count
+    data        float32 vertices (count x 3), float32 normals (count x 3) and int32 faces (count x 3),
+                one after the other. Meshes that aren't indexed have no faces.
+
+Everything is a multiple of 4 bytes, so loading an entry is just memory mapping the file.
+The directory is capped at a size, and the least recently used entries are deleted to stay under it.
+Only needs numpy.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy
+
+CACHE_MAGIC = b"CSRMESH1"
+_HEADER_SIZE = len(CACHE_MAGIC) + 8
+_SUFFIX = ".mesh"
+
+
+def cache_key(*parts) -> str:
+    """Hash of parts (which need a repr that doesn't change between sessions) to name an entry with."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+
+class MeshDiskCache:
+    """A directory of cached meshes. Safe to use from several threads at once.
+
+    The directory is only looked at the first time it's needed. How recently an entry was used
+    is kept in its modification time, so it lasts from one session to the next."""
+
+    def __init__(self, directory: str, max_bytes: int = 128 * 1024 * 1024) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._entries = None  # type: Optional[OrderedDict]  # key -> size in bytes, least recently used first
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[numpy.ndarray, numpy.ndarray, Optional[numpy.ndarray]]]:
+        """Returns read-only memory mapped (vertices, normals, faces) for key, or None if it isn't cached.
+        faces is None if the mesh isn't indexed."""
+        with self._lock:
+            self._scan()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        path = self._path(key)
+        try:
+            arrays = self._read(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            arrays = None
+        with self._lock:
+            if arrays is None:
+                self._forget(key)
+                self.misses += 1
+            else:
+                self.hits += 1
+        return arrays
+
+    def put(self, key: str, vertices: numpy.ndarray, normals: numpy.ndarray, faces: Optional[numpy.ndarray]) -> None:
+        """Writes an entry for key, deleting the least recently used ones to make room."""
+        vertices = numpy.ascontiguousarray(vertices, dtype="<f4").reshape(-1, 3)
+        normals = numpy.ascontiguousarray(normals, dtype="<f4").reshape(-1, 3)
+        faces = numpy.ascontiguousarray(faces if faces is not None else (), dtype="<i4").reshape(-1, 3)
+        if len(normals) != len(vertices) or len(vertices) == 0:
+            raise ValueError("Need one normal per vertex")
+        size = _HEADER_SIZE + vertices.nbytes + normals.nbytes + faces.nbytes
+        if size > self._max_bytes:
+            return
+        path = self._path(key)
+        # Written under another name first, so nothing ever sees half a file
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(temporary_path, "wb") as cache_file:
+                cache_file.write(CACHE_MAGIC)
+                cache_file.write(struct.pack("<II", len(vertices), len(faces)))
+                cache_file.write(vertices.tobytes())
+                cache_file.write(normals.tobytes())
+                cache_file.write(faces.tobytes())
+            os.replace(temporary_path, path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._scan()
+            self._forget(key, delete=False)
+            self._entries[key] = size
+            self._current_bytes += size
+            while self._current_bytes > self._max_bytes and len(self._entries) > 1:
+                self._forget(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Deletes every entry. Ones still in use by a mesh (on systems that won't delete open files) stay until next time."""
+        with self._lock:
+            self._scan()
+            for key in list(self._entries):
+                self._forget(key)
+
+    def size(self) -> int:
+        """Bytes used by all the entries."""
+        with self._lock:
+            self._scan()
+            return self._current_bytes
+
+    def stats(self) -> str:
+        with self._lock:
+            entries = len(self._entries) if self._entries is not None else 0
+            return f"{self.hits} hits, {self.misses} misses, {entries} meshes, {self._current_bytes / 1024:.0f} KiB"
+
+    def _scan(self) -> None:
+        """Finds what's already in the directory the first time it's needed."""
+        if self._entries is not None:
+            return
+        found = []
+        try:
+            with os.scandir(self._directory) as directory:
+                for entry in directory:
+                    if entry.name.endswith(_SUFFIX) and entry.is_file():
+                        status = entry.stat()
+                        found.append((status.st_mtime_ns, entry.name[:-len(_SUFFIX)], status.st_size))
+        except OSError:
+            pass
+        found.sort()
+        self._entries = OrderedDict((key, size) for _, key, size in found)
+        self._current_bytes = sum(self._entries.values())
+
+    def _forget(self, key: str, delete: bool = True) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._current_bytes -= size
+        if delete:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    @staticmethod
+    def _read(path: str) -> Tuple[numpy.ndarray, numpy.ndarray, Optional[numpy.ndarray]]:
+        with open(path, "rb") as cache_file:
+            header = cache_file.read(_HEADER_SIZE)
+        if len(header) != _HEADER_SIZE or header[:len(CACHE_MAGIC)] != CACHE_MAGIC:
+            raise ValueError(f"{path} isn't a cached mesh")
+        vertex_count, face_count = struct.unpack("<II", header[len(CACHE_MAGIC):])
+        if os.path.getsize(path) != _HEADER_SIZE + (vertex_count * 2 + face_count) * 12:
+            raise ValueError(f"{path} is the wrong size")
+        if vertex_count == 0:
+            raise ValueError(f"{path} is empty")
+        data = numpy.memmap(path, dtype=numpy.uint8, mode="r", offset=_HEADER_SIZE)
+        vertex_bytes = vertex_count * 12
+        vertices = data[:vertex_bytes].view("<f4").reshape(-1, 3)
+        normals = data[vertex_bytes:vertex_bytes * 2].view("<f4").reshape(-1, 3)
+        faces = data[vertex_bytes * 2:].view("<i4").reshape(-1, 3) if face_count else None
+        return vertices, normals, faces
@@ -0,0 +1,88 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Turns a soup of triangles into an indexed mesh with shared vertices.
+
+Corners in the same place are welded into one vertex unless the faces meeting there
+are at a hard edge, in which case each side keeps its own vertex and normal.
+Only needs numpy.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy
+
+# Positions are rounded to this (mm) when deciding whether corners are in the same place
+WELD_PRECISION = 1e-4
+# Normals which round to the same multiple of this are treated as the same
+_NORMAL_PRECISION = 1e-4
+
+
+def weld_triangles(triangles: numpy.ndarray, face_normals: Optional[numpy.ndarray] = None,
+                   smooth_angle: float = 30.0) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Welds an (n, 3, 3) array of triangle corners into (vertices, normals, indices).
+
+    Faces meeting at a corner at less than smooth_angle degrees share a vertex there whose normal is
+    the area weighted average of theirs, so curved surfaces are smooth. Across sharper edges the normals
+    are kept apart. face_normals are used if given, otherwise they're worked out from the winding.
+    Returns float32 vertices and normals and int32 indices of shape (n, 3).
+    """
+    face_count = len(triangles)
+    corners = numpy.asarray(triangles, dtype=numpy.float32).reshape(-1, 3)
+    edges_cross = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]).astype(numpy.float64)
+    areas = numpy.linalg.norm(edges_cross, axis=1)
+    if face_normals is None:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            face_normals = numpy.where(areas[:, None] > 0, edges_cross / areas[:, None], 0.0)
+    face_normals = numpy.asarray(face_normals, dtype=numpy.float64)
+
+    # Group the corners by position
+    position_keys = numpy.round(corners / WELD_PRECISION).astype(numpy.int64)
+    _, position_ids = numpy.unique(position_keys, axis=0, return_inverse=True)
+    position_ids = position_ids.reshape(-1)
+    corner_faces = numpy.arange(face_count * 3) // 3
+
+    # Every pair of corners (first, second) at the same position, including each corner with itself
+    order = numpy.argsort(position_ids, kind="stable")
+    group_sizes = numpy.bincount(position_ids)
+    group_starts = numpy.cumsum(group_sizes) - group_sizes
+    pair_counts = group_sizes[position_ids]
+    first = numpy.repeat(numpy.arange(face_count * 3), pair_counts)
+    offsets = numpy.arange(len(first)) - numpy.repeat(numpy.cumsum(pair_counts) - pair_counts, pair_counts)
+    second = order[group_starts[position_ids[first]] + offsets]
+
+    # Each corner's normal is the average of the faces around it that it isn't at a hard edge with
+    first_normals = face_normals[corner_faces[first]]
+    second_normals = face_normals[corner_faces[second]]
+    smooth = numpy.einsum("ij,ij->i", first_normals, second_normals) >= math.cos(math.radians(smooth_angle)) - 1e-9
+    weighted = second_normals[smooth] * areas[corner_faces[second[smooth]], None]
+    normals = numpy.stack([numpy.bincount(first[smooth], weights=weighted[:, axis], minlength=face_count * 3)
+                           for axis in range(3)], axis=1)
+    lengths = numpy.linalg.norm(normals, axis=1)
+    flat = lengths < 1e-12  # Only slivers with no area around, so fall back to the face's own normal
+    normals[flat] = face_normals[corner_faces[flat]]
+    lengths[flat] = 1.0
+    normals /= lengths[:, None]
+
+    # Corners in the same place with the same normal become one vertex
+    normal_keys = numpy.round(normals / _NORMAL_PRECISION).astype(numpy.int64)
+    keys = numpy.column_stack((position_ids, normal_keys))
+    _, first_corners, indices = numpy.unique(keys, axis=0, return_index=True, return_inverse=True)
+    vertices = corners[first_corners]
+    vertex_normals = normals[first_corners].astype(numpy.float32)
+    return vertices, vertex_normals, indices.reshape(-1, 3).astype(numpy.int32)
+
+
+def weld_corners(triangles: numpy.ndarray, corner_normals: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Welds an (n, 3, 3) array of triangle corners which already have their own (n, 3, 3) normals.
+
+    Corners in the same place with the same normal become one vertex, so it's up to the normals
+    which edges are smooth. Returns the same as weld_triangles.
+    """
+    corners = numpy.asarray(triangles, dtype=numpy.float32).reshape(-1, 3)
+    normals = numpy.asarray(corner_normals, dtype=numpy.float32).reshape(-1, 3)
+    keys = numpy.column_stack((numpy.round(corners / WELD_PRECISION).astype(numpy.int64),
+                               numpy.round(normals / _NORMAL_PRECISION).astype(numpy.int64)))
+    _, first_corners, indices = numpy.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return corners[first_corners], normals[first_corners], indices.reshape(-1, 3).astype(numpy.int32)
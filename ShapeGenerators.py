@@ -0,0 +1,736 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Vectorised mesh generators for the parametric shapes.
+
+These only need numpy, so they can be used without Cura running.
+Each generator returns (vertices, indices, face_normals): float32 vertices of shape (n, 3)
+in Z-up model coordinates, int32 triangle indices of shape (m, 3) and float32 unit face
+normals of shape (m, 3), worked out exactly rather than from the triangles' winding.
+Round ones can instead give every corner of every face its own normal, shape (m, 3, 3),
+so their curved walls shade smoothly.
+"""
+
+import math
+from typing import Tuple
+
+import numpy
+
+# Limits on how finely round shapes are divided up
+MIN_SEGMENTS = 12
+MAX_SEGMENTS = 360
+MAX_SPHERE_SUBDIVISIONS = 5
+
+# Angle subtended by an edge of an icosahedron, which each icosphere subdivision halves
+_ICOSAHEDRON_EDGE_ANGLE = 2 * math.atan(2 / (1 + math.sqrt(5)))
+
+
+def segments_for_radius(radius: float, tolerance: float) -> int:
+    """How many straight segments a circle of radius needs so none of them strays more than tolerance from the arc.
+
+    A chord spanning angle a sits radius * (1 - cos(a / 2)) inside the arc at its middle,
+    so the largest angle allowed is 2 * acos(1 - tolerance / radius).
+    """
+    if radius <= tolerance:
+        return MIN_SEGMENTS
+    segments = math.ceil(math.pi / math.acos(1 - tolerance / radius))
+    return min(max(segments, MIN_SEGMENTS), MAX_SEGMENTS)
+
+
+def sphere_subdivisions(radius: float, tolerance: float) -> int:
+    """How many times an icosphere of radius needs subdividing for its edges to stay within tolerance of the surface."""
+    if radius <= tolerance:
+        return 1
+    max_angle = 2 * math.acos(1 - tolerance / radius)
+    subdivisions = math.ceil(math.log2(_ICOSAHEDRON_EDGE_ANGLE / max_angle))
+    return min(max(subdivisions, 1), MAX_SPHERE_SUBDIVISIONS)
+
+
+def stepped_values(first: float, last: float, step: float, max_count: int) -> Tuple[float, ...]:
+    """Every step from first up to last (or as near as the steps get to it), at most max_count of them."""
+    step = max(step, 0.1)
+    count = int(math.floor((last - first) / step + 1e-6)) + 1
+    count = min(max(count, 1), max_count)
+    return tuple(round(first + step * index, 3) for index in range(count))
+
+
+# Vertex k of a box is the corner on the +X side if bit 0 of k is set, +Y for bit 1 and the top for bit 2.
+_BOX_CORNERS = numpy.array([(k & 1, k >> 1 & 1, k >> 2 & 1) for k in range(8)], dtype=numpy.float32)
+_BOX_FACES = numpy.array([
+    (0, 2, 3), (0, 3, 1),  # Bottom
+    (4, 5, 7), (4, 7, 6),  # Top
+    (0, 1, 5), (0, 5, 4),  # Front (-Y)
+    (2, 6, 7), (2, 7, 3),  # Back (+Y)
+    (0, 4, 6), (0, 6, 2),  # Left (-X)
+    (1, 3, 7), (1, 7, 5),  # Right (+X)
+], dtype=numpy.int32)
+_BOX_NORMALS = numpy.repeat(numpy.array([(0, 0, -1), (0, 0, 1), (0, -1, 0), (0, 1, 0), (-1, 0, 0), (1, 0, 0)],
+                                        dtype=numpy.float32), 2, axis=0)
+
+
+def box(width: float, depth: float, height: float) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """A width x depth x height box standing on Z=0, centred on the Z axis."""
+    return boxes(numpy.array([(-width / 2, -depth / 2, 0)]), numpy.array([(width / 2, depth / 2, height)]))
+
+
+def boxes(lower: numpy.ndarray, upper: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Any number of axis aligned boxes at once, each from its lower (n, 3) corner to its upper one."""
+    lower = numpy.asarray(lower, dtype=numpy.float32).reshape(-1, 3)
+    upper = numpy.asarray(upper, dtype=numpy.float32).reshape(-1, 3)
+    vertices = lower[:, None, :] + _BOX_CORNERS[None, :, :] * (upper - lower)[:, None, :]
+    indices = _BOX_FACES[None, :, :] + 8 * numpy.arange(len(lower), dtype=numpy.int32)[:, None, None]
+    face_normals = numpy.tile(_BOX_NORMALS, (len(lower), 1))
+    return vertices.reshape(-1, 3), indices.reshape(-1, 3), face_normals
+
+
+def cylinder(radius: float, height: float, segments: int,
+             smooth: bool = False) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """A cylinder standing on Z=0, centred on the Z axis.
+
+    The vertices are the bottom ring, the top ring and then the centres of the bottom and top.
+    With smooth on, the wall gets the normals of a true cylinder at each corner (see smooth_corners).
+    """
+    directions = _ring_directions(segments)
+    vertices = numpy.empty((segments * 2 + 2, 3), dtype=numpy.float32)
+    vertices[:segments * 2, :2] = numpy.tile(directions * radius, (2, 1))
+    vertices[:segments * 2, 2] = numpy.repeat((0, height), segments)
+    vertices[-2] = (0, 0, 0)
+    vertices[-1] = (0, 0, height)
+
+    i = numpy.arange(segments)
+    j = (i + 1) % segments
+    bottom, top = 0, segments
+    bottom_centre = numpy.full(segments, segments * 2)
+    top_centre = bottom_centre + 1
+    faces = numpy.stack([
+        # Wall
+        (bottom + i, bottom + j, top + j), (bottom + i, top + j, top + i),
+        # Bottom and top, fanned out from their centres
+        (bottom_centre, bottom + j, bottom + i), (top_centre, top + i, top + j),
+    ])  # (triangle in segment, corner, segment)
+    indices = numpy.ascontiguousarray(faces.transpose(2, 0, 1).reshape(-1, 3), dtype=numpy.int32)
+
+    outward = _segment_normals(segments)
+    up = numpy.zeros((segments, 3), dtype=numpy.float32)
+    up[:, 2] = 1
+    face_normals = numpy.stack((outward, outward, -up, up), axis=1).reshape(-1, 3)
+    if smooth:
+        vertex_normals = numpy.zeros_like(vertices)
+        vertex_normals[:segments * 2, :2] = numpy.tile(directions, (2, 1))
+        walls = numpy.tile((True, True, False, False), segments)
+        return vertices, indices, smooth_corners(indices, face_normals, vertex_normals, walls)
+    return vertices, indices, face_normals
+
+
+def check_tube(outer_radius: float, inner_radius: float) -> None:
+    """Raises the ValueError tube() would for these sizes, without making it."""
+    if not 0 < inner_radius < outer_radius:
+        raise ValueError(f"A tube's inside ({inner_radius * 2}) has to be smaller than its outside ({outer_radius * 2})")
+
+
+def tube(outer_radius: float, inner_radius: float, height: float, segments: int,
+         smooth: bool = False) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """An open tube standing on Z=0, centred on the Z axis. Laid out like tubes()."""
+    check_tube(outer_radius, inner_radius)
+    return tubes(numpy.zeros((1, 2)), (outer_radius,), (inner_radius,), height, (segments,), smooth)
+
+
+def cone(radius: float, height: float, segments: int,
+         smooth: bool = False) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """A cone with its base on Z=0 and its tip height above the origin.
+
+    The vertices are the base's ring, the tip and the centre of the base.
+    With smooth on the sides get the normals of a true cone at each corner, except at the tip,
+    where there isn't one and each face keeps its own.
+    """
+    directions = _ring_directions(segments)
+    vertices = numpy.zeros((segments + 2, 3), dtype=numpy.float32)
+    vertices[:segments, :2] = directions * radius
+    vertices[segments] = (0, 0, height)
+
+    i = numpy.arange(segments)
+    j = (i + 1) % segments
+    tip = numpy.full(segments, segments)
+    base_centre = tip + 1
+    faces = numpy.stack([(i, j, tip), (base_centre, j, i)])  # (triangle in segment, corner, segment)
+    indices = numpy.ascontiguousarray(faces.transpose(2, 0, 1).reshape(-1, 3), dtype=numpy.int32)
+
+    # A side leans in by the same amount all the way round. Its flat face is closer to the axis
+    # at the middle of its edge than the corners are, which makes it lean in a little more.
+    slant = numpy.zeros((segments, 3), dtype=numpy.float64)
+    slant[:, :2] = _segment_normals(segments)[:, :2] * height
+    slant[:, 2] = radius * math.cos(math.pi / segments)
+    slant /= numpy.linalg.norm(slant, axis=1)[:, None]
+    down = numpy.zeros((segments, 3), dtype=numpy.float64)
+    down[:, 2] = -1
+    face_normals = numpy.stack((slant, down), axis=1).reshape(-1, 3).astype(numpy.float32)
+    if smooth:
+        vertex_normals = numpy.zeros_like(vertices)
+        vertex_normals[:segments, :2] = directions * height
+        vertex_normals[:segments, 2] = radius
+        vertex_normals[:segments] /= numpy.linalg.norm(vertex_normals[:segments], axis=1)[:, None]
+        sides = numpy.tile((True, False), segments)
+        corner_normals = smooth_corners(indices, face_normals, vertex_normals, sides)
+        corner_normals[sides, 2] = face_normals[sides]  # The tip
+        return vertices, indices, corner_normals
+    return vertices, indices, face_normals
+
+
+def smooth_corners(indices: numpy.ndarray, face_normals: numpy.ndarray, vertex_normals: numpy.ndarray,
+                   smooth_faces: numpy.ndarray) -> numpy.ndarray:
+    """(m, 3, 3) corner normals which are vertex_normals on the faces where smooth_faces is True,
+    so curved walls shade smoothly, and the face's own normal everywhere else."""
+    corner_normals = numpy.repeat(face_normals[:, None, :], 3, axis=1)
+    corner_normals[smooth_faces] = vertex_normals[indices[smooth_faces]]
+    return corner_normals
+
+
+def _ring_directions(segments: int) -> numpy.ndarray:
+    """(segments, 2) unit vectors evenly spaced around a circle, starting along +X."""
+    angles = (2.0 * numpy.pi * numpy.arange(segments)) / segments
+    return numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=1)
+
+
+def _segment_normals(segments: int) -> numpy.ndarray:
+    """(segments, 3) horizontal unit normals pointing out from the middle of each segment of a ring
+    laid out like _ring_directions, which is the way a flat wall across that segment faces."""
+    middles = (2.0 * numpy.pi * (numpy.arange(segments) + 0.5)) / segments
+    normals = numpy.zeros((segments, 3), dtype=numpy.float32)
+    normals[:, 0] = numpy.cos(middles)
+    normals[:, 1] = numpy.sin(middles)
+    return normals
+
+
+def _check_cap(height: float, cap_thickness: float) -> None:
+    if not 0 < cap_thickness < height:
+        raise ValueError(f"A cap {cap_thickness} thick doesn't fit on something {height} high")
+
+
+def check_capped_tube(outer_diameter: float, inner_diameter: float, height: float, cap_thickness: float) -> None:
+    """Raises the ValueError capped_tube() would for these sizes, without making it."""
+    if not 0 < inner_diameter < outer_diameter:
+        raise ValueError(f"A tube's inside ({inner_diameter}) has to be smaller than its outside ({outer_diameter})")
+    _check_cap(height, cap_thickness)
+
+
+def capped_tube(outer_diameter: float, inner_diameter: float, height: float, cap_thickness: float,
+                segments: int = 96) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """A tube standing on Z=0 which is closed at the top by a cap cap_thickness thick.
+
+    Every segment has five ring vertices: outer bottom, outer top of the wall, inner bottom,
+    inner top of the wall (which is also the edge of the cap's underside) and outer top of the cap.
+    They're followed by the centre of the cap's top and the centre of its underside.
+    Returns (vertices, indices, face_normals).
+    """
+    check_capped_tube(outer_diameter, inner_diameter, height, cap_thickness)
+    outer_radius = outer_diameter / 2.0
+    inner_radius = inner_diameter / 2.0
+    cap_height = height - cap_thickness  # Where the cap starts
+
+    angles = (2.0 * numpy.pi * numpy.arange(segments)) / segments
+    cos_a = numpy.cos(angles)
+    sin_a = numpy.sin(angles)
+
+    rings = numpy.empty((segments, 5, 3), dtype=numpy.float64)
+    rings[:, (0, 1, 4), 0] = (outer_radius * cos_a)[:, None]
+    rings[:, (0, 1, 4), 1] = (outer_radius * sin_a)[:, None]
+    rings[:, (2, 3), 0] = (inner_radius * cos_a)[:, None]
+    rings[:, (2, 3), 1] = (inner_radius * sin_a)[:, None]
+    rings[:, :, 2] = (0, cap_height, 0, cap_height, height)
+
+    vertices = numpy.empty((segments * 5 + 2, 3), dtype=numpy.float32)
+    vertices[:-2] = rings.reshape(-1, 3)
+    vertices[-2] = (0, 0, height)  # Centre of the cap
+    vertices[-1] = (0, 0, cap_height)  # Centre of the cap's underside
+
+    # Index of ring vertex k in this segment (v) and the next one (n)
+    this_segment = numpy.arange(segments)[:, None] * 5
+    next_segment = ((numpy.arange(segments) + 1) % segments)[:, None] * 5
+    v = this_segment + numpy.arange(5)
+    n = next_segment + numpy.arange(5)
+    center_cap = numpy.full(segments, segments * 5)
+    center_cap_base = numpy.full(segments, segments * 5 + 1)
+
+    faces = numpy.stack([
+        # Outer wall
+        (v[:, 0], n[:, 1], v[:, 1]), (v[:, 0], n[:, 0], n[:, 1]),
+        # Inner wall
+        (n[:, 2], v[:, 3], n[:, 3]), (n[:, 2], v[:, 2], v[:, 3]),
+        # Top cap side
+        (v[:, 1], n[:, 4], v[:, 4]), (v[:, 1], n[:, 1], n[:, 4]),
+        # Bottom rim
+        (v[:, 2], n[:, 0], v[:, 0]), (v[:, 2], n[:, 2], n[:, 0]),
+        # Top cap outer (triangulated to center)
+        (v[:, 4], n[:, 4], center_cap),
+        # Bottom cap base (triangulated to center base)
+        (n[:, 3], v[:, 3], center_cap_base),
+    ])  # (triangle in segment, corner, segment)
+    indices = numpy.ascontiguousarray(faces.transpose(2, 0, 1).reshape(-1, 3), dtype=numpy.int32)
+
+    # The walls face straight out (or in) from the middle of each segment's arc, everything else up or down
+    middles = angles + numpy.pi / segments
+    outward = numpy.zeros((segments, 3), dtype=numpy.float32)
+    outward[:, 0] = numpy.cos(middles)
+    outward[:, 1] = numpy.sin(middles)
+    up = numpy.zeros((segments, 3), dtype=numpy.float32)
+    up[:, 2] = 1
+    face_normals = numpy.stack((outward, outward, -outward, -outward, outward, outward, -up, -up, up, -up),
+                               axis=1).reshape(-1, 3)
+
+    return vertices, indices, face_normals
+
+
+def rectangle(width: float, depth: float) -> numpy.ndarray:
+    """A width x depth rectangle centred on the origin, counter-clockwise."""
+    return numpy.array([(-width / 2, -depth / 2), (width / 2, -depth / 2),
+                        (width / 2, depth / 2), (-width / 2, depth / 2)])
+
+
+def right_triangle(base: float, height: float) -> numpy.ndarray:
+    """A right-angled triangle centred on its bounding box, with the right angle at the bottom right."""
+    return numpy.array([(0, 0), (base, 0), (base, height)]) - (base / 2, height / 2)
+
+
+def regular_polygon(sides: int, circumradius: float, rotation: float = 0.0) -> numpy.ndarray:
+    """A regular polygon centred on the origin, with its first corner at angle rotation (radians)."""
+    angles = rotation + 2.0 * numpy.pi * numpy.arange(sides) / sides
+    return circumradius * numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=1)
+
+
+def star_polygon(points: int, outer_radius: float, inner_radius: float) -> numpy.ndarray:
+    """A star centred on the origin with its first tip pointing along +Y."""
+    radii = numpy.tile((outer_radius, inner_radius), points)
+    angles = numpy.pi / 2 + numpy.pi * numpy.arange(points * 2) / points
+    return radii[:, None] * numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=1)
+
+
+def signed_area(polygon: numpy.ndarray) -> float:
+    """Shoelace area of a polygon. Positive when it's counter-clockwise."""
+    x, y = polygon[:, 0], polygon[:, 1]
+    return 0.5 * float(numpy.dot(x, numpy.roll(y, -1)) - numpy.dot(numpy.roll(x, -1), y))
+
+
+def is_convex(polygon: numpy.ndarray) -> bool:
+    """Whether a counter-clockwise polygon is convex (collinear corners are allowed)."""
+    edges = numpy.roll(polygon, -1, axis=0) - polygon
+    next_edges = numpy.roll(edges, -1, axis=0)
+    turns = edges[:, 0] * next_edges[:, 1] - edges[:, 1] * next_edges[:, 0]
+    return bool(numpy.all(turns >= -1e-9))
+
+
+def offset_polygon(polygon: numpy.ndarray, distance: float) -> numpy.ndarray:
+    """Moves every edge of a counter-clockwise polygon inwards by distance.
+
+    Each corner becomes the intersection of the two offset edges that meet there. With
+    unit inward normals a and b of the edges before and after it, that's corner + distance * (a + b) / (1 + a.b),
+    which works for every corner at once. Raises ValueError if the offset is so big the walls would cross.
+    """
+    edges = numpy.roll(polygon, -1, axis=0) - polygon
+    lengths = numpy.linalg.norm(edges, axis=1)
+    if numpy.any(lengths < 1e-9):
+        raise ValueError("Polygon has a zero length edge")
+    # Inward ('left') normal of each edge going counter-clockwise
+    normals = numpy.stack((-edges[:, 1], edges[:, 0]), axis=1) / lengths[:, None]
+    normals_before = numpy.roll(normals, 1, axis=0)
+    cosines = numpy.einsum("ij,ij->i", normals_before, normals)
+    if numpy.any(cosines < -1 + 1e-9):
+        raise ValueError("Polygon doubles back on itself")
+    inner = polygon + distance * (normals_before + normals) / (1.0 + cosines)[:, None]
+
+    # If an edge has been shrunk past nothing it ends up pointing backwards
+    inner_edges = numpy.roll(inner, -1, axis=0) - inner
+    if numpy.any(numpy.einsum("ij,ij->i", inner_edges, edges) <= 0):
+        raise ValueError(f"Walls {distance} thick don't fit inside this shape")
+    return inner
+
+
+def _prism_walls(outline: numpy.ndarray, wall_width: float, height: float,
+                 cap_thickness: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """The outline counter-clockwise and the inside of its walls, for capped_prism()."""
+    if wall_width <= 0:
+        raise ValueError(f"Walls have to be thicker than 0, not {wall_width}")
+    _check_cap(height, cap_thickness)
+    outline = numpy.asarray(outline, dtype=numpy.float64)
+    if signed_area(outline) < 0:
+        outline = outline[::-1]
+    return outline, offset_polygon(outline, wall_width)
+
+
+def check_capped_prism(outline: numpy.ndarray, wall_width: float, height: float, cap_thickness: float) -> None:
+    """Raises the ValueError capped_prism() would for these sizes, without making it.
+    Only the corners of the outline are offset, so it's cheap whatever the prism's size."""
+    _prism_walls(outline, wall_width, height, cap_thickness)
+
+
+def capped_prism(outline: numpy.ndarray, wall_width: float, height: float,
+                 cap_thickness: float) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """A hollow prism standing on Z=0 with walls wall_width thick, closed at the top by a cap.
+
+    outline is an (n, 2) array of the outside corners in either winding. It has to be a simple
+    polygon, and if it isn't convex the caps are fanned out from the average of its corners,
+    so every corner (inside and out) needs to be visible from there. Stars and the like are fine.
+
+    The vertices are four rings of n: outer bottom, outer top, inner bottom and inner top
+    (the underside of the cap), followed by the centres of the caps if they needed them.
+    Every face is wound counter-clockwise seen from outside the solid. Returns (vertices, indices, face_normals).
+    """
+    outline, inner = _prism_walls(outline, wall_width, height, cap_thickness)
+    sides = len(outline)
+    cap_height = height - cap_thickness  # Where the cap starts
+    convex = is_convex(outline)
+
+    rings = numpy.empty((4, sides, 3), dtype=numpy.float64)
+    rings[(0, 1), :, :2] = outline
+    rings[(2, 3), :, :2] = inner
+    rings[:, :, 2] = numpy.array((0, height, 0, cap_height))[:, None]
+    if convex:
+        vertices = rings.reshape(-1, 3).astype(numpy.float32)
+    else:
+        centre = outline.mean(axis=0)
+        vertices = numpy.empty((sides * 4 + 2, 3), dtype=numpy.float32)
+        vertices[:-2] = rings.reshape(-1, 3)
+        vertices[-2] = (centre[0], centre[1], height)
+        vertices[-1] = (centre[0], centre[1], cap_height)
+
+    i = numpy.arange(sides)
+    j = (i + 1) % sides
+    outer_bottom, outer_top, inner_bottom, inner_top = (ring * sides for ring in range(4))
+    sides_faces = numpy.stack([
+        # Outer walls
+        (outer_bottom + i, outer_bottom + j, outer_top + j), (outer_bottom + i, outer_top + j, outer_top + i),
+        # Inner walls, reversed so they face into the hollow
+        (inner_bottom + j, inner_bottom + i, inner_top + i), (inner_bottom + j, inner_top + i, inner_top + j),
+        # Bottom rim between the inner and outer walls
+        (inner_bottom + i, inner_bottom + j, outer_bottom + j), (inner_bottom + i, outer_bottom + j, outer_bottom + i),
+    ])  # (triangle in side, corner, side)
+    sides_faces = sides_faces.transpose(2, 0, 1).reshape(-1, 3)
+
+    if convex:
+        # Fan out from the first corner
+        k = numpy.arange(1, sides - 1)
+        first = numpy.zeros_like(k)
+        cap_top = numpy.stack((outer_top + first, outer_top + k, outer_top + k + 1), axis=1)
+        cap_underside = numpy.stack((inner_top + first, inner_top + k + 1, inner_top + k), axis=1)
+    else:
+        # Fan out from the centre
+        top_centre = numpy.full(sides, sides * 4)
+        cap_top = numpy.stack((top_centre, outer_top + i, outer_top + j), axis=1)
+        cap_underside = numpy.stack((top_centre + 1, inner_top + j, inner_top + i), axis=1)
+
+    indices = numpy.concatenate((sides_faces, cap_top, cap_underside)).astype(numpy.int32)
+
+    # Each side's walls face straight out (or in) from its edge, the rim and caps up or down
+    edges = outline[j] - outline
+    outward = numpy.zeros((sides, 3), dtype=numpy.float32)
+    outward[:, :2] = numpy.stack((edges[:, 1], -edges[:, 0]), axis=1) / numpy.linalg.norm(edges, axis=1)[:, None]
+    down = numpy.zeros((sides, 3), dtype=numpy.float32)
+    down[:, 2] = -1
+    sides_normals = numpy.stack((outward, outward, -outward, -outward, down, down), axis=1).reshape(-1, 3)
+    cap_normals = numpy.zeros((len(cap_top) + len(cap_underside), 3), dtype=numpy.float32)
+    cap_normals[:len(cap_top), 2] = 1
+    cap_normals[len(cap_top):, 2] = -1
+    face_normals = numpy.concatenate((sides_normals, cap_normals))
+    return vertices, indices, face_normals
+
+
+def ring_layout(radii: numpy.ndarray, overlap: float) -> numpy.ndarray:
+    """Centres for circles of radii placed in order around a loop, each overlapping the next by overlap.
+
+    The loop's radius R is whatever makes the angles between neighbours, 2 * asin(chord / 2R), add up
+    to a full turn. If even the smallest loop that fits the biggest gap leaves some of the turn over,
+    it all goes between the last circle and the first. The first circle is on the +X axis.
+    """
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+    if len(radii) == 1:
+        return numpy.zeros((1, 2))
+    chords = radii + numpy.roll(radii, -1) - overlap
+    loop_radius = chords.max() / 2
+    if 2 * numpy.arcsin(chords / (2 * loop_radius)).sum() > 2 * numpy.pi:
+        low, high = loop_radius, chords.sum()
+        for _ in range(60):
+            loop_radius = (low + high) / 2
+            if 2 * numpy.arcsin(chords / (2 * loop_radius)).sum() > 2 * numpy.pi:
+                low = loop_radius
+            else:
+                high = loop_radius
+        loop_radius = high
+    steps = 2 * numpy.arcsin(numpy.minimum(chords / (2 * loop_radius), 1.0))
+    angles = numpy.concatenate(((0.0,), numpy.cumsum(steps[:-1])))
+    return loop_radius * numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=1)
+
+
+def grid_layout(sizes: numpy.ndarray, spacing: float) -> numpy.ndarray:
+    """Centres for items of (n, 2) sizes in a grid, in order along the rows from the back (+Y) row forwards.
+
+    Each column is as wide as its widest item and each row as deep as its deepest, with spacing between them.
+    The number of columns is whichever keeps the longer side of the grid shortest. The grid is centred on the origin.
+    """
+    sizes = numpy.asarray(sizes, dtype=numpy.float64).reshape(-1, 2)
+    count = len(sizes)
+    best = None
+    for columns in range(1, count + 1):
+        rows = -(-count // columns)
+        cells = numpy.zeros((rows * columns, 2))
+        cells[:count] = sizes
+        cells = cells.reshape(rows, columns, 2)
+        widths = cells[:, :, 0].max(axis=0)
+        depths = cells[:, :, 1].max(axis=1)
+        longest = max(widths.sum() + spacing * (columns - 1), depths.sum() + spacing * (rows - 1))
+        if best is None or longest < best[0] - 1e-9:
+            best = (longest, columns, widths, depths)
+    _, columns, widths, depths = best
+    x = numpy.cumsum(widths + spacing) - spacing - widths / 2
+    y = -(numpy.cumsum(depths + spacing) - spacing - depths / 2)
+    x -= (x[0] - widths[0] / 2 + x[-1] + widths[-1] / 2) / 2
+    y -= (y[0] + depths[0] / 2 + y[-1] - depths[-1] / 2) / 2
+    index = numpy.arange(count)
+    return numpy.stack((x[index % columns], y[index // columns]), axis=1)
+
+
+# Segments of a seven segment digit from the top clockwise, then the middle one
+_SEVEN_SEGMENT_DIGITS = {
+    "0": "abcdef", "1": "bc", "2": "abdeg", "3": "abcdg", "4": "bcfg",
+    "5": "acdfg", "6": "acdefg", "7": "abc", "8": "abcdefg", "9": "abcdfg", "-": "g",
+}
+
+
+def seven_segment(text: str, digit_height: float, stroke: float) -> Tuple[numpy.ndarray, float]:
+    """Rectangles (n, 4 of x0, y0, x1, y1) which spell text in seven segment digits, reading along +X
+    from the origin with +Y up, and how wide it is. Only digits, "-" and "." can be written.
+    The segments only touch, so they're all separate boxes for the slicer to join."""
+    width = digit_height / 2
+    middle = digit_height / 2
+    segments = {
+        "a": (stroke, digit_height - stroke, width - stroke, digit_height),
+        "b": (width - stroke, middle, width, digit_height),
+        "c": (width - stroke, 0, width, middle),
+        "d": (stroke, 0, width - stroke, stroke),
+        "e": (0, 0, stroke, middle),
+        "f": (0, middle, stroke, digit_height),
+        "g": (stroke, middle - stroke / 2, width - stroke, middle + stroke / 2),
+    }
+    rectangles = []
+    x = 0.0
+    for character in text:
+        if character == ".":
+            rectangles.append((x, 0, x + stroke, stroke))
+            x += stroke * 2
+            continue
+        if character not in _SEVEN_SEGMENT_DIGITS:
+            raise ValueError(f"Can't write {character!r} in seven segment digits")
+        rectangles.extend((x + x0, y0, x + x1, y1) for x0, y0, x1, y1 in
+                          (segments[segment] for segment in _SEVEN_SEGMENT_DIGITS[character]))
+        x += width + stroke
+    return numpy.array(rectangles, dtype=numpy.float64).reshape(-1, 4), max(x - stroke, 0.0)
+
+
+def tubes(centres: numpy.ndarray, outer_radii: numpy.ndarray, inner_radii: numpy.ndarray, height: float,
+          segments: numpy.ndarray, smooth: bool = False) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Open tubes standing on Z=0, all generated at once. Each one is a closed shell of its own.
+
+    Tube t is centred on centres[t] and divided into segments[t] segments. The vertices are four blocks,
+    one entry per segment of every tube: outer bottom, outer top, inner bottom and inner top.
+    Every face is wound counter-clockwise seen from outside the solid. Returns (vertices, indices, face_normals).
+    With smooth on, the walls get the normals of true tubes at each corner (see smooth_corners).
+    """
+    segments = numpy.asarray(segments, dtype=numpy.int64)
+    total = int(segments.sum())
+    starts = numpy.cumsum(segments) - segments
+    tube = numpy.repeat(numpy.arange(len(segments)), segments)  # Which tube each segment belongs to
+    local = numpy.arange(total) - starts[tube]
+    angles = 2.0 * numpy.pi * local / segments[tube]
+    directions = numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=1)
+    centres = numpy.asarray(centres, dtype=numpy.float64)[tube]
+
+    rings = numpy.empty((4, total, 3), dtype=numpy.float64)
+    rings[(0, 1), :, :2] = centres + directions * numpy.asarray(outer_radii, dtype=numpy.float64)[tube, None]
+    rings[(2, 3), :, :2] = centres + directions * numpy.asarray(inner_radii, dtype=numpy.float64)[tube, None]
+    rings[:, :, 2] = numpy.array((0, height, 0, height))[:, None]
+    vertices = rings.reshape(-1, 3).astype(numpy.float32)
+
+    i = numpy.arange(total)
+    j = starts[tube] + (local + 1) % segments[tube]
+    outer_bottom, outer_top, inner_bottom, inner_top = (ring * total for ring in range(4))
+    faces = numpy.stack([
+        # Outer walls
+        (outer_bottom + i, outer_bottom + j, outer_top + j), (outer_bottom + i, outer_top + j, outer_top + i),
+        # Inner walls, reversed so they face into the hole
+        (inner_bottom + j, inner_bottom + i, inner_top + i), (inner_bottom + j, inner_top + i, inner_top + j),
+        # Top and bottom rims
+        (outer_top + i, outer_top + j, inner_top + j), (outer_top + i, inner_top + j, inner_top + i),
+        (inner_bottom + i, inner_bottom + j, outer_bottom + j), (inner_bottom + i, outer_bottom + j, outer_bottom + i),
+    ])  # (triangle in segment, corner, segment)
+    indices = numpy.ascontiguousarray(faces.transpose(2, 0, 1).reshape(-1, 3), dtype=numpy.int32)
+
+    # A wall segment faces straight out from the middle of its arc, the rims face straight up or down
+    middles = angles + numpy.pi / segments[tube]
+    outward = numpy.zeros((total, 3), dtype=numpy.float32)
+    outward[:, 0] = numpy.cos(middles)
+    outward[:, 1] = numpy.sin(middles)
+    up = numpy.zeros((total, 3), dtype=numpy.float32)
+    up[:, 2] = 1
+    face_normals = numpy.stack((outward, outward, -outward, -outward, up, up, -up, -up), axis=1).reshape(-1, 3)
+    if smooth:
+        vertex_normals = numpy.zeros((4, total, 3), dtype=numpy.float32)
+        vertex_normals[(0, 1), :, :2] = directions
+        vertex_normals[(2, 3), :, :2] = -directions
+        walls = numpy.tile((True, True, True, True, False, False, False, False), total)
+        return vertices, indices, smooth_corners(indices, face_normals, vertex_normals.reshape(-1, 3), walls)
+    return vertices, indices, face_normals
+
+
+def _zip_loops(outer_angles: numpy.ndarray, inner_angles: numpy.ndarray) -> numpy.ndarray:
+    """Triangles filling the ring between two loops of points around the same centre, as (n, 3) indices into
+    the outer loop's points followed by the inner loop's. Both loops go counter-clockwise, the outer one
+    starting from its smallest angle. Each step moves along whichever loop's next point comes first,
+    so every triangle is an edge of one loop and a point on the other. They're wound counter-clockwise."""
+    outer_count, inner_count = len(outer_angles), len(inner_angles)
+    inner_keys = (inner_angles - outer_angles[0]) % (2 * numpy.pi)
+    inner_order = (numpy.argmin(inner_keys) + numpy.arange(inner_count)) % inner_count
+    # The angle of the point each step moves to, finishing back where each loop started
+    outer_steps = numpy.append(outer_angles[1:] - outer_angles[0], 2 * numpy.pi)
+    inner_steps = numpy.append(inner_keys[inner_order[1:]], inner_keys[inner_order[0]] + 2 * numpy.pi)
+    moves_outer = numpy.repeat((True, False), (outer_count, inner_count))
+    moves_outer = moves_outer[numpy.argsort(numpy.concatenate((outer_steps, inner_steps)), kind="stable")]
+    i = numpy.cumsum(moves_outer) - moves_outer  # How far along each loop is before the step
+    j = numpy.cumsum(~moves_outer) - ~moves_outer
+    here = outer_count + inner_order[j % inner_count]
+    return numpy.where(moves_outer[:, None],
+                       numpy.stack((i % outer_count, (i + 1) % outer_count, here), axis=1),
+                       numpy.stack((i % outer_count, outer_count + inner_order[(j + 1) % inner_count], here), axis=1))
+
+
+def hole_test(hole_diameters: numpy.ndarray, wall_width: float, height: float,
+              segments: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """The hole test from models/HoleTest.scad: a tube around each hole, arranged in a loop in order of size.
+
+    The SCAD file puts its 15 tubes on a 24 mm circle, the i-th i * i * 1.2 degrees round. That only closes
+    the loop for those sizes, so it isn't copied. The tubes are placed by ring_layout instead, each
+    overlapping the next by half a wall on whatever circle that takes. That's what the quadratic spacing
+    was getting at: for the standard holes it comes out on a 24.0 mm circle with 0.65 mm overlaps, where the
+    SCAD file's run from 0.58 to 0.84 mm. Where two overlap, each keeps its own side of the straight
+    line between the points where their outsides cross, so it all comes out as one closed plate with holes
+    in and no faces inside it. segments is how many segments each tube is divided into. The part is
+    centred on the origin. Returns (vertices, indices, face_normals) like tubes().
+    """
+    inner_radii = numpy.asarray(hole_diameters, dtype=numpy.float64) / 2
+    outer_radii = inner_radii + wall_width
+    segments = numpy.asarray(segments, dtype=numpy.int64)
+    centres = ring_layout(outer_radii, wall_width / 2)
+    lower = (centres - outer_radii[:, None]).min(axis=0)
+    upper = (centres + outer_radii[:, None]).max(axis=0)
+    centres -= (lower + upper) / 2
+    count = len(inner_radii)
+    if count == 1:
+        return tubes(centres, outer_radii, inner_radii, height, segments)
+
+    # Each tube overlaps the next, and the last one the first unless the leftover turn went between them
+    pairs = [(t, t + 1) for t in range(count - 1)]
+    if count > 2 and numpy.linalg.norm(centres[0] - centres[-1]) < outer_radii[0] + outer_radii[-1]:
+        pairs.append((count - 1, 0))
+    overlapping = numpy.linalg.norm(centres[:, None] - centres, axis=2) < outer_radii[:, None] + outer_radii
+    overlapping[numpy.diag_indices(count)] = False
+    for a, b in pairs:
+        overlapping[a, b] = overlapping[b, a] = False
+    if overlapping.any():
+        raise ValueError("Those holes are too different in size to fit around a loop")
+
+    # Where all three tubes of a loop of three overlap, the lines between each pair meet inside all of them
+    meeting = None
+    if len(pairs) == 3:
+        constants = (centres[1:] ** 2).sum(axis=1) - (centres[0] ** 2).sum() - outer_radii[1:] ** 2 + outer_radii[0] ** 2
+        corner = numpy.linalg.solve(2 * (centres[1:] - centres[0]), constants)
+        if numpy.linalg.norm(corner - centres[0]) < outer_radii[0]:
+            meeting = corner
+    points = [numpy.zeros((0, 2))] if meeting is None else [meeting[None]]  # 2D points in blocks, the lines' first
+    point_count = len(points[0])
+
+    # The line across each overlap, in enough pieces that neither tube takes bigger steps along it than round its arc
+    steps = 2 * numpy.pi / segments
+    cuts = [[] for _ in range(count)]  # Per tube: (direction of the line, half the angle it cuts off, its point ids)
+    for a, b in pairs:
+        offset = centres[b] - centres[a]
+        distance = numpy.linalg.norm(offset)
+        along = offset / distance
+        across = numpy.array((-along[1], along[0]))
+        reach = (distance ** 2 + outer_radii[a] ** 2 - outer_radii[b] ** 2) / (2 * distance)
+        if reach <= inner_radii[a] or distance - reach <= inner_radii[b]:
+            raise ValueError("The walls are too thin for the holes")
+        middle = centres[a] + reach * along
+        half_length = math.sqrt(outer_radii[a] ** 2 - reach ** 2)
+        spans = (math.acos(reach / outer_radii[a]), math.acos((distance - reach) / outer_radii[b]))
+        pieces = max(1, math.ceil(2 * spans[0] / steps[a]), math.ceil(2 * spans[1] / steps[b]))
+        if meeting is None:
+            ends = numpy.linspace(-half_length, half_length, pieces + 1)
+            ids = numpy.arange(point_count, point_count + pieces + 1)
+        else:
+            # Only the end outside the third tube is just between these two, up to where the lines meet
+            third = 3 - a - b
+            meets_at = (meeting - middle) @ across
+            outside_end = -half_length if numpy.linalg.norm(middle - half_length * across - centres[third]) > \
+                outer_radii[third] else half_length
+            pieces = max(1, math.ceil(pieces * abs(outside_end - meets_at) / (2 * half_length)))
+            ends = numpy.linspace(outside_end, meets_at, pieces + 1)[:-1]
+            ids = numpy.append(numpy.arange(point_count, point_count + pieces), 0)
+        points.append(middle + ends[:, None] * across)
+        point_count += len(ends)
+        direction = math.atan2(along[1], along[0])
+        cuts[a].append((direction, spans[0], ids))
+        cuts[b].append((direction + numpy.pi, spans[1], ids))
+    lines = numpy.concatenate(points)
+
+    caps, walls = [], []
+    for t in range(count):
+        angles = steps[t] * numpy.arange(segments[t])
+        directions = numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=1)
+        # The arc leaves out the corners cut off by the lines, and any too near their ends
+        keep = numpy.ones(segments[t], dtype=bool)
+        for direction, span, _ in cuts[t]:
+            keep &= numpy.abs((angles - direction + numpy.pi) % (2 * numpy.pi) - numpy.pi) > span + steps[t] / 4
+        arc = centres[t] + outer_radii[t] * directions[keep]
+        hole = centres[t] + inner_radii[t] * directions
+        points.extend((arc, hole))
+        arc_ids = numpy.arange(point_count, point_count + len(arc))
+        hole_ids = numpy.arange(point_count + len(arc), point_count + len(arc) + len(hole))
+        point_count += len(arc) + len(hole)
+
+        # Round the outline in order of angle, with a bit for each line a point is on (where two lines meet, both)
+        outline = numpy.concatenate([arc_ids] + [ids for _, _, ids in cuts[t]])
+        on_lines = numpy.concatenate([numpy.zeros(len(arc), dtype=numpy.int64)] +
+                                     [numpy.full(len(ids), 1 << cut) for cut, (_, _, ids) in enumerate(cuts[t])])
+        offsets = numpy.concatenate([arc] + [lines[ids] for _, _, ids in cuts[t]]) - centres[t]
+        outline, first, inverse = numpy.unique(outline, return_index=True, return_inverse=True)
+        lines_at = numpy.zeros(len(outline), dtype=numpy.int64)
+        numpy.bitwise_or.at(lines_at, inverse.reshape(-1), on_lines)
+        outline_angles = numpy.arctan2(offsets[first, 1], offsets[first, 0]) % (2 * numpy.pi)
+        order = numpy.argsort(outline_angles, kind="stable")
+        outline, lines_at, outline_angles = outline[order], lines_at[order], outline_angles[order]
+        caps.append(numpy.concatenate((outline, hole_ids))[_zip_loops(outline_angles, angles)])
+
+        # Walls stand on every edge of the outline except along the lines, and on the hole's edges backwards
+        following = numpy.roll(numpy.arange(len(outline)), -1)
+        walled = (lines_at & lines_at[following]) == 0
+        walls.append(numpy.stack((outline[walled], outline[following][walled]), axis=1))
+        walls.append(numpy.stack((numpy.roll(hole_ids, -1), hole_ids), axis=1))
+
+    flat = numpy.concatenate(points)
+    vertices = numpy.zeros((2, point_count, 3), dtype=numpy.float64)
+    vertices[:, :, :2] = flat
+    vertices[1, :, 2] = height
+    vertices = vertices.reshape(-1, 3).astype(numpy.float32)
+
+    # Each wall edge (start, end) is two triangles facing out to its right, the caps face up or down
+    edges = numpy.concatenate(walls)
+    start, end = edges[:, 0], edges[:, 1]
+    wall_faces = numpy.stack(((start, end, end + point_count), (start, end + point_count, start + point_count)))
+    wall_faces = wall_faces.transpose(2, 0, 1).reshape(-1, 3)
+    runs = flat[end] - flat[start]
+    outward = numpy.zeros((len(edges), 3), dtype=numpy.float32)
+    outward[:, :2] = numpy.stack((runs[:, 1], -runs[:, 0]), axis=1) / numpy.linalg.norm(runs, axis=1)[:, None]
+    top = numpy.concatenate(caps)
+    indices = numpy.concatenate((wall_faces, top + point_count, top[:, ::-1])).astype(numpy.int32)
+    cap_normals = numpy.zeros((len(top) * 2, 3), dtype=numpy.float32)
+    cap_normals[:len(top), 2] = 1
+    cap_normals[len(top):, 2] = -1
+    face_normals = numpy.concatenate((numpy.repeat(outward, 2, axis=0), cap_normals))
+    return vertices, indices, face_normals
@@ -0,0 +1,40 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Zero-copy reader for binary STL files.
+
+A binary STL is an 80 byte header, a little endian uint32 triangle count, then one
+50 byte record per triangle: a float32 facet normal, three float32 corners and a
+uint16 attribute. That's simple enough to memory map and read in place.
+"""
+
+import os
+from typing import Optional, Tuple
+
+import numpy
+
+STL_HEADER_SIZE = 80
+
+STL_RECORD = numpy.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+
+def read_binary_stl(path: str) -> Optional[Tuple[numpy.ndarray, numpy.ndarray]]:
+    """Memory maps a binary STL file.
+
+    Returns read-only strided views of the triangle corners (shape (n, 3, 3)) and the
+    facet normals (shape (n, 3)) straight out of the file, or None if it isn't a binary STL.
+    Nothing is read from disk until the views are used.
+    """
+    file_size = os.path.getsize(path)
+    if file_size < STL_HEADER_SIZE + 4:
+        return None
+    triangle_count = int(numpy.fromfile(path, dtype="<u4", count=1, offset=STL_HEADER_SIZE)[0])
+    # ASCII files can start with anything, so the size has to match the count exactly.
+    if file_size != STL_HEADER_SIZE + 4 + triangle_count * STL_RECORD.itemsize or triangle_count == 0:
+        return None
+    records = numpy.memmap(path, dtype=STL_RECORD, mode="r", offset=STL_HEADER_SIZE + 4, shape=(triangle_count,))
+    return records["vertices"], records["normal"]
@@ -0,0 +1,204 @@
+// Calibration Shapes Reborn by Slashee the Cow
+// Copyright 2025
+
+import QtQuick 6.0
+import QtQuick.Controls 6.0
+import QtQuick.Layouts 6.0
+
+import UM 1.6 as UM
+import Cura 1.7 as Cura
+
+UM.Dialog {
+
+    id: addMultiple
+
+    function validateInt(test, minimum = 0, maximum = Number.MAX_SAFE_INTEGER){
+        if (test === ""){return false}
+        let intTest = parseInt(test)
+        if (isNaN(intTest)){return false}
+        if (intTest < minimum || intTest > maximum){return false}
+        return true
+    }
+
+    function validateFloat(test, minimum = 0.0){
+        if (test === ""){return false}
+        test = test.replace(",",".") // Use "correct" decimal separator
+        let floatTest = parseFloat(test)
+        if (isNaN(floatTest)){return false}
+        if (floatTest < minimum){return false}
+        return true
+    }
+
+    property var default_field_background: UM.Theme.getColor("detail_background")
+    property var error_field_background: UM.Theme.getColor("setting_validation_error_background")
+
+    function getBackgroundColour(valid){
+        return valid ? default_field_background : error_field_background
+    }
+    
+    function validateInputs(){
+        let message = ""
+        let countValid = true
+        let spacingValid = true
+        if (!validateInt(copyCount, 1, 100)){
+            countValid = false;
+            message += catalog.i18nc("@error:count_invalid", "Number of copies must be a whole number from 1 to 100.<br>");
+        }
+
+        if (!validateFloat(copySpacing, 0)){
+            spacingValid = false;
+            message += catalog.i18nc("@error:spacing_invalid", "Spacing must be 0 or higher.<br>");
+        }
+      
+        // Global property which controls "OK" button and ability to accept dialog with enter key
+        inputsValid = (countValid && spacingValid)
+        // Global property which displays error message (duh)
+        error_message = message
+
+        // Set background for each box
+        countField.background.color = getBackgroundColour(countValid)
+        spacingField.background.color = getBackgroundColour(spacingValid)
+    }
+
+    property variant catalog: UM.I18nCatalog {name: "calibrationshapesreborn" }
+    property string copyCount: "0"
+    property string copySpacing: "0"
+
+    property bool inputsValid: false
+    property string error_message: ""
+
+    Component.onCompleted: {
+        shapeSelector.currentIndex = manager.batch_shape_index
+        copyCount = String(manager.batch_count)
+        copySpacing = String(manager.batch_spacing)
+        Qt.callLater(validateInputs)
+    }
+
+    title: catalog.i18nc("@window_title", "Add Multiple Shapes")
+    buttonSpacing: UM.Theme.getSize("default_margin").width
+    
+    minimumWidth: Math.max((mainLayout.Layout.minimumWidth + 3 * UM.Theme.getSize("default_margin").width),
+        (okButton.width + cancelButton.width + 4 * UM.Theme.getSize("default_margin").width))
+    maximumWidth: minimumWidth
+    width: minimumWidth
+    minimumHeight: mainLayout.Layout.minimumHeight + (2 * UM.Theme.getSize("default_margin").height) + okButton.height + UM.Theme.getSize("default_lining").height + 20
+    maximumHeight: minimumHeight
+    height: minimumHeight
+
+    ColumnLayout {
+        id: mainLayout
+        anchors.fill: parent
+
+        GridLayout {
+            id: settingsControls
+            Layout.fillWidth: true
+            Layout.alignment: Qt.AlignTop
+
+            columns: 2
+            columnSpacing: UM.Theme.getSize("default_margin").width
+            rowSpacing: UM.Theme.getSize("default_margin").height
+
+            UM.Label{
+                id: shapeLabel
+                text: catalog.i18nc("add_multiple:shape", "Shape")
+            }
+
+            ComboBox{
+                id: shapeSelector
+                Layout.minimumWidth: 200
+                model: manager.batch_shape_names
+            }
+
+            UM.Label{
+                id: countLabel
+                text: catalog.i18nc("add_multiple:count", "Copies")
+            }
+
+            UM.TextFieldWithUnit{
+                id: countField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: ""
+                text: copyCount
+                validator: IntValidator {
+                    bottom: 1
+                    top: 100
+                }
+                onTextChanged: {
+                    copyCount = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: spacingLabel
+                text: catalog.i18nc("add_multiple:spacing", "Spacing")
+            }
+
+            UM.TextFieldWithUnit{
+                id: spacingField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: copySpacing
+                validator: DoubleValidator {
+                    bottom: 0
+                    decimals: 1
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    copySpacing = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+        }
+        UM.Label{
+            Layout.fillWidth: true
+            id: hint_text
+            text: catalog.i18nc("add_multiple:hint", "Custom and bridging shapes use the sizes<br>last entered in their own dialogs.")
+            wrapMode: TextInput.Wrap
+        }
+        UM.Label{
+            Layout.fillWidth: true
+            id: error_text
+            text: addMultiple.error_message
+            color: UM.Theme.getColor("error")
+            wrapMode: TextInput.Wrap
+        }
+    }
+    // Buttons
+    rightButtons: [
+        Cura.SecondaryButton{
+            id: cancelButton
+            text: catalog.i18nc("add_multiple_cancel", "Cancel")
+
+            onClicked:{
+                addMultiple.reject()
+            }
+        },
+        Cura.PrimaryButton{
+            id:okButton
+            text: catalog.i18nc("add_multiple_ok", "OK")
+            enabled: addMultiple.inputsValid
+
+            onClicked: {
+                addMultiple.accept()
+            }
+        }
+    ]
+
+    onAccepted: {
+        if(!inputsValid){
+            manager.logMessage("onAccepted{} triggered while inputsValid is false")
+            return
+        }
+
+        manager.batch_shape_index = shapeSelector.currentIndex
+        manager.batch_count = parseInt(copyCount)
+        manager.batch_spacing = parseFloat(copySpacing.replace(",", "."))
+        manager.save_settings()
+
+        manager.make_multiple_shapes()
+        addMultiple.close()
+    }
+}
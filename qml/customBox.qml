@@ -60,6 +60,7 @@ UM.Dialog {
         inputsValid = (widthValid && depthValid && heightValid)
         // Global property which displays error message (duh)
         error_message = message
+        updatePreview()
 
         // Set background for each box
         totalWidth.background.color = getBackgroundColour(widthValid)
@@ -77,6 +78,43 @@ UM.Dialog {
     property bool inputsValid: false
     property string error_message: ""
 
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.custom_box_width = parseFloat(boxWidth)
+        manager.custom_box_depth = parseFloat(boxDepth)
+        manager.custom_box_height = parseFloat(boxHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("custom_box")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "custom_box_width": manager.custom_box_width,
+                "custom_box_depth": manager.custom_box_depth,
+                "custom_box_height": manager.custom_box_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
     Component.onCompleted: {
         boxWidth = String(manager.custom_box_width)
         boxDepth = String(manager.custom_box_depth)
@@ -182,6 +220,15 @@ UM.Dialog {
             color: UM.Theme.getColor("error")
             wrapMode: TextInput.Wrap
         }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
     }
     // Buttons
     rightButtons: [
@@ -210,9 +257,8 @@ UM.Dialog {
             return
         }
 
-        manager.custom_box_width = parseFloat(boxWidth)
-        manager.custom_box_depth = parseFloat(boxDepth)
-        manager.custom_box_height = parseFloat(boxHeight)
+        committed = true
+        applyValues()
 
         manager.make_custom_box()
         customBox.close()
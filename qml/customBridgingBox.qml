@@ -107,6 +107,7 @@ UM.Dialog {
         inputsValid = (widthValid && depthValid && heightValid && wallValid && roofValid)
         // Global property which displays error message (duh)
         error_message = message
+        updatePreview()
 
         // Set background for each box
         totalWidth.background.color = getBackgroundColour(widthValid)
@@ -128,6 +129,47 @@ UM.Dialog {
     property bool inputsValid: false
     property string error_message: ""
 
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.bridging_box_width = parseInt(boxWidth)
+        manager.bridging_box_depth = parseInt(boxDepth)
+        manager.bridging_box_height = parseInt(boxHeight)
+        manager.bridging_box_wall_width = parseFloat(boxWallWidth)
+        manager.bridging_box_roof_height = parseFloat(boxRoofHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("bridging_box")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "bridging_box_width": manager.bridging_box_width,
+                "bridging_box_depth": manager.bridging_box_depth,
+                "bridging_box_height": manager.bridging_box_height,
+                "bridging_box_wall_width": manager.bridging_box_wall_width,
+                "bridging_box_roof_height": manager.bridging_box_roof_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
     Component.onCompleted: {
         //default_field_background = totalWidth.background.color
         boxWidth = String(manager.bridging_box_width)
@@ -274,6 +316,15 @@ UM.Dialog {
             color: UM.Theme.getColor("error")
             wrapMode: TextInput.Wrap
         }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
     }
     // Buttons
     rightButtons: [
@@ -302,11 +353,8 @@ UM.Dialog {
             return
         }
 
-        manager.bridging_box_width = parseInt(boxWidth)
-        manager.bridging_box_depth = parseInt(boxDepth)
-        manager.bridging_box_height = parseInt(boxHeight)
-        manager.bridging_box_wall_width = parseFloat(boxWallWidth)
-        manager.bridging_box_roof_height = parseFloat(boxRoofHeight)
+        committed = true
+        applyValues()
 
         manager.make_custom_bridging_box()
         customBridgingBox.close()
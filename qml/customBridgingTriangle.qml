@@ -107,6 +107,7 @@ UM.Dialog {
         inputsValid = (widthValid && depthValid && heightValid && wallValid && roofValid)
         // Global property which displays error message (duh)
         error_message = message
+        updatePreview()
 
         // Set background for each box
         baseWidth.background.color = getBackgroundColour(widthValid)
@@ -128,6 +129,47 @@ UM.Dialog {
     property bool inputsValid: false
     property string error_message: ""
 
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.bridging_triangle_base_width = parseInt(triangleWidth)
+        manager.bridging_triangle_base_depth = parseInt(triangleDepth)
+        manager.bridging_triangle_height = parseInt(triangleHeight)
+        manager.bridging_triangle_wall_width = parseFloat(triangleWallWidth)
+        manager.bridging_triangle_roof_height = parseFloat(triangleRoofHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("bridging_triangle")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "bridging_triangle_base_width": manager.bridging_triangle_base_width,
+                "bridging_triangle_base_depth": manager.bridging_triangle_base_depth,
+                "bridging_triangle_height": manager.bridging_triangle_height,
+                "bridging_triangle_wall_width": manager.bridging_triangle_wall_width,
+                "bridging_triangle_roof_height": manager.bridging_triangle_roof_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
     Component.onCompleted: {
         triangleWidth = String(manager.bridging_triangle_base_width)
         triangleDepth = String(manager.bridging_triangle_base_depth)
@@ -266,6 +308,15 @@ UM.Dialog {
                 }
             }
         }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
 
     }
     // Buttons
@@ -295,11 +346,8 @@ UM.Dialog {
             return
         }
 
-        manager.bridging_triangle_base_width = parseInt(triangleWidth)
-        manager.bridging_triangle_base_depth = parseInt(triangleDepth)
-        manager.bridging_triangle_height = parseInt(triangleHeight)
-        manager.bridging_triangle_wall_width = parseFloat(triangleWallWidth)
-        manager.bridging_triangle_roof_height = parseFloat(triangleRoofHeight)
+        committed = true
+        applyValues()
 
         manager.make_custom_bridging_triangle()
         customBridgingTriangle.close()
@@ -91,6 +91,7 @@ UM.Dialog {
         inputsValid = (outerDiameterValid && innerDiameterValid && heightValid && roofValid)
         // Global property which displays error message (duh)
         error_message = message
+        updatePreview()
 
         // Set background for each box
         outerDiameter.background.color = getBackgroundColour(outerDiameterValid)
@@ -110,6 +111,45 @@ UM.Dialog {
     property bool inputsValid: false
     property string error_message: ""
 
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.bridging_tube_outer_diameter = parseFloat(tubeOuterDiameter)
+        manager.bridging_tube_inner_diameter = parseFloat(tubeInnerDiameter)
+        manager.bridging_tube_height = parseInt(tubeHeight)
+        manager.bridging_tube_roof_height = parseFloat(tubeRoofHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("bridging_tube")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "bridging_tube_outer_diameter": manager.bridging_tube_outer_diameter,
+                "bridging_tube_inner_diameter": manager.bridging_tube_inner_diameter,
+                "bridging_tube_height": manager.bridging_tube_height,
+                "bridging_tube_roof_height": manager.bridging_tube_roof_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
     Component.onCompleted: {
         tubeOuterDiameter = String(manager.bridging_tube_outer_diameter)
         tubeInnerDiameter = String(manager.bridging_tube_inner_diameter)
@@ -236,6 +276,15 @@ UM.Dialog {
             color: UM.Theme.getColor("error")
             wrapMode: TextInput.Wrap
         }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
     }
     // Buttons
     rightButtons: [
@@ -264,10 +313,8 @@ UM.Dialog {
             return
         }
 
-        manager.bridging_tube_outer_diameter = parseFloat(tubeOuterDiameter)
-        manager.bridging_tube_inner_diameter = parseFloat(tubeInnerDiameter)
-        manager.bridging_tube_height = parseInt(tubeHeight)
-        manager.bridging_tube_roof_height = parseFloat(tubeRoofHeight)
+        committed = true
+        applyValues()
 
         manager.make_custom_bridging_tube()
         customBridgingTube.close()
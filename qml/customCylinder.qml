@@ -54,6 +54,7 @@ UM.Dialog {
         inputsValid = (diameterValid && heightValid)
         // Global property which displays error message (duh)
         error_message = message
+        updatePreview()
 
         // Set background for each box
         diameterField.background.color = getBackgroundColour(diameterValid)
@@ -69,6 +70,41 @@ UM.Dialog {
     property bool inputsValid: false
     property string error_message: ""
 
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.custom_cylinder_diameter = parseFloat(cylinderDiameter)
+        manager.custom_cylinder_height = parseFloat(cylinderHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("custom_cylinder")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "custom_cylinder_diameter": manager.custom_cylinder_diameter,
+                "custom_cylinder_height": manager.custom_cylinder_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
     Component.onCompleted: {
         cylinderDiameter = String(manager.custom_cylinder_diameter)
         cylinderHeight = String(manager.custom_cylinder_height)
@@ -151,6 +187,15 @@ UM.Dialog {
             color: UM.Theme.getColor("error")
             wrapMode: TextInput.Wrap
         }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
     }
     // Buttons
     rightButtons: [
@@ -179,8 +224,8 @@ UM.Dialog {
             return
         }
 
-        manager.custom_cylinder_diameter = parseFloat(cylinderDiameter)
-        manager.custom_cylinder_height = parseFloat(cylinderHeight)
+        committed = true
+        applyValues()
 
         manager.make_custom_cylinder()
         customCylinder.close()
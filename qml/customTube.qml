@@ -74,6 +74,7 @@ UM.Dialog {
         inputsValid = (outerDiameterValid && innerDiameterValid && heightValid)
         // Global property which displays error message (duh)
         error_message = message
+        updatePreview()
 
         // Set background for each box
         outerDiameter.background.color = getBackgroundColour(outerDiameterValid)
@@ -91,6 +92,43 @@ UM.Dialog {
     property bool inputsValid: false
     property string error_message: ""
 
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.custom_tube_outer_diameter = parseFloat(tubeOuterDiameter)
+        manager.custom_tube_inner_diameter = parseFloat(tubeInnerDiameter)
+        manager.custom_tube_height = parseFloat(tubeHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("custom_tube")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "custom_tube_outer_diameter": manager.custom_tube_outer_diameter,
+                "custom_tube_inner_diameter": manager.custom_tube_inner_diameter,
+                "custom_tube_height": manager.custom_tube_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
     Component.onCompleted: {
         tubeOuterDiameter = String(manager.custom_tube_outer_diameter)
         tubeInnerDiameter = String(manager.custom_tube_inner_diameter)
@@ -196,6 +234,15 @@ UM.Dialog {
             color: UM.Theme.getColor("error")
             wrapMode: TextInput.Wrap
         }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
     }
     // Buttons
     rightButtons: [
@@ -224,9 +271,8 @@ UM.Dialog {
             return
         }
 
-        manager.custom_tube_outer_diameter = parseFloat(tubeOuterDiameter)
-        manager.custom_tube_inner_diameter = parseFloat(tubeInnerDiameter)
-        manager.custom_tube_height = parseFloat(tubeHeight)
+        committed = true
+        applyValues()
 
         manager.make_custom_tube()
         customTube.close()
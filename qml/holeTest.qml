@@ -0,0 +1,349 @@
+// Calibration Shapes Reborn by Slashee the Cow
+// Copyright 2025
+
+import QtQuick 6.0
+import QtQuick.Controls 6.0
+import QtQuick.Layouts 6.0
+
+import UM 1.6 as UM
+import Cura 1.7 as Cura
+
+UM.Dialog {
+
+    id: holeTest
+
+    function validateFloat(test, minimum = 0.0){
+        if (test === ""){return false}
+        test = test.replace(",",".") // Use "correct" decimal separator
+        let floatTest = parseFloat(test)
+        if (isNaN(floatTest)){return false}
+        if (floatTest < minimum){return false}
+        return true
+    }
+
+    function toFloat(text){
+        return parseFloat(text.replace(",", "."))
+    }
+
+    property var default_field_background: UM.Theme.getColor("detail_background")
+    property var error_field_background: UM.Theme.getColor("setting_validation_error_background")
+
+    function getBackgroundColour(valid){
+        return valid ? default_field_background : error_field_background
+    }
+
+    // Keep in step with CalibrationShapesReborn.HOLE_TEST_MAX_HOLES
+    property int maxHoles: 40
+
+    function validateInputs(){
+        let message = ""
+        let minDiameterValid = true
+        let maxDiameterValid = true
+        let stepValid = true
+        let wallWidthValid = true
+        let heightValid = true
+        if (!validateFloat(holeMinDiameter, 0.1)){
+            minDiameterValid = false;
+            message += catalog.i18nc("@error:min_diameter_invalid", "Smallest hole must be 0.1 or higher.<br>");
+        }
+
+        if (!validateFloat(holeMaxDiameter, 0.1)){
+            maxDiameterValid = false;
+            message += catalog.i18nc("@error:max_diameter_invalid", "Largest hole must be 0.1 or higher.<br>");
+        }
+
+        if (!validateFloat(holeStep, 0.1)){
+            stepValid = false;
+            message += catalog.i18nc("@error:step_invalid", "Step must be 0.1 or higher.<br>");
+        }
+
+        if (!validateFloat(holeWallWidth, 0.1)){
+            wallWidthValid = false;
+            message += catalog.i18nc("@error:wall_width_invalid", "Wall width must be 0.1 or higher.<br>");
+        }
+
+        if (!validateFloat(holeHeight, 0.1)){
+            heightValid = false;
+            message += catalog.i18nc("@error:height_invalid", "Height must be 0.1 or higher.<br>");
+        }
+
+        // Test fields for inter-dependencies
+        if (minDiameterValid && maxDiameterValid){
+            if (toFloat(holeMaxDiameter) < toFloat(holeMinDiameter)){
+                message += catalog.i18nc("@error:diameter_order", "Largest hole can't be smaller than the smallest hole.<br>");
+                minDiameterValid = false
+                maxDiameterValid = false
+            } else if (stepValid){
+                let holes = Math.floor((toFloat(holeMaxDiameter) - toFloat(holeMinDiameter)) / toFloat(holeStep) + 1e-6) + 1
+                if (holes > maxHoles){
+                    message += catalog.i18nc("@error:too_many_holes", "That makes {0} holes. The most there can be is {1}.<br>").arg(holes).arg(maxHoles);
+                    stepValid = false
+                }
+            }
+        }
+
+        // Global property which controls "OK" button and ability to accept dialog with enter key
+        inputsValid = (minDiameterValid && maxDiameterValid && stepValid && wallWidthValid && heightValid)
+        // Global property which displays error message (duh)
+        error_message = message
+        updatePreview()
+
+        // Set background for each box
+        minDiameterField.background.color = getBackgroundColour(minDiameterValid)
+        maxDiameterField.background.color = getBackgroundColour(maxDiameterValid)
+        stepField.background.color = getBackgroundColour(stepValid)
+        wallWidthField.background.color = getBackgroundColour(wallWidthValid)
+        heightField.background.color = getBackgroundColour(heightValid)
+    }
+
+    property variant catalog: UM.I18nCatalog {name: "calibrationshapesreborn" }
+    property string holeMinDiameter: "0"
+    property string holeMaxDiameter: "0"
+    property string holeStep: "0"
+    property string holeWallWidth: "0"
+    property string holeHeight: "0"
+
+    property bool inputsValid: false
+    property string error_message: ""
+
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.hole_test_min_diameter = toFloat(holeMinDiameter)
+        manager.hole_test_max_diameter = toFloat(holeMaxDiameter)
+        manager.hole_test_step = toFloat(holeStep)
+        manager.hole_test_wall_width = toFloat(holeWallWidth)
+        manager.hole_test_height = toFloat(holeHeight)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("hole_test")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "hole_test_min_diameter": manager.hole_test_min_diameter,
+                "hole_test_max_diameter": manager.hole_test_max_diameter,
+                "hole_test_step": manager.hole_test_step,
+                "hole_test_wall_width": manager.hole_test_wall_width,
+                "hole_test_height": manager.hole_test_height
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
+    Component.onCompleted: {
+        holeMinDiameter = String(manager.hole_test_min_diameter)
+        holeMaxDiameter = String(manager.hole_test_max_diameter)
+        holeStep = String(manager.hole_test_step)
+        holeWallWidth = String(manager.hole_test_wall_width)
+        holeHeight = String(manager.hole_test_height)
+        Qt.callLater(validateInputs)
+    }
+
+    title: catalog.i18nc("@window_title", "Custom Hole Test")
+    buttonSpacing: UM.Theme.getSize("default_margin").width
+
+    minimumWidth: Math.max((mainLayout.Layout.minimumWidth + 3 * UM.Theme.getSize("default_margin").width),
+        (okButton.width + cancelButton.width + 4 * UM.Theme.getSize("default_margin").width))
+    maximumWidth: minimumWidth
+    width: minimumWidth
+    minimumHeight: mainLayout.Layout.minimumHeight + (2 * UM.Theme.getSize("default_margin").height) + okButton.height + UM.Theme.getSize("default_lining").height + 20
+    maximumHeight: minimumHeight
+    height: minimumHeight
+
+    ColumnLayout {
+        id: mainLayout
+        anchors.fill: parent
+
+        GridLayout {
+            id: settingsControls
+            Layout.fillWidth: true
+            Layout.alignment: Qt.AlignTop
+
+            columns: 2
+            columnSpacing: UM.Theme.getSize("default_margin").width
+            rowSpacing: UM.Theme.getSize("default_margin").height
+
+            UM.Label{
+                id: minDiameterLabel
+                text: catalog.i18nc("hole_test:min_diameter", "Smallest Hole")
+            }
+
+            UM.TextFieldWithUnit{
+                id: minDiameterField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: holeMinDiameter
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    holeMinDiameter = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: maxDiameterLabel
+                text: catalog.i18nc("hole_test:max_diameter", "Largest Hole")
+            }
+
+            UM.TextFieldWithUnit{
+                id: maxDiameterField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: holeMaxDiameter
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    holeMaxDiameter = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: stepLabel
+                text: catalog.i18nc("hole_test:step", "Step")
+            }
+
+            UM.TextFieldWithUnit{
+                id: stepField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: holeStep
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    holeStep = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: wallWidthLabel
+                text: catalog.i18nc("hole_test:wall_width", "Wall Width")
+            }
+
+            UM.TextFieldWithUnit{
+                id: wallWidthField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: holeWallWidth
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    holeWallWidth = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: heightLabel
+                text: catalog.i18nc("hole_test:height", "Height")
+            }
+
+            UM.TextFieldWithUnit{
+                id: heightField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: holeHeight
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 1
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    holeHeight = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+        }
+        UM.Label{
+            Layout.fillWidth: true
+            id: hint_text
+            text: catalog.i18nc("hole_test:hint", "There's a hole every step from the smallest size to the largest.")
+            wrapMode: TextInput.Wrap
+        }
+        UM.Label{
+            Layout.fillWidth: true
+            id: error_text
+            text: holeTest.error_message
+            color: UM.Theme.getColor("error")
+            wrapMode: TextInput.Wrap
+        }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
+    }
+    // Buttons
+    rightButtons: [
+        Cura.SecondaryButton{
+            id: cancelButton
+            text: catalog.i18nc("hole_test_cancel", "Cancel")
+
+            onClicked:{
+                holeTest.reject()
+            }
+        },
+        Cura.PrimaryButton{
+            id:okButton
+            text: catalog.i18nc("hole_test_ok", "OK")
+            enabled: holeTest.inputsValid
+
+            onClicked: {
+                holeTest.accept()
+            }
+        }
+    ]
+
+    onAccepted: {
+        if(!inputsValid){
+            manager.logMessage("onAccepted{} triggered while inputsValid is false")
+            return
+        }
+
+        committed = true
+        applyValues()
+
+        manager.make_custom_hole_test()
+        holeTest.close()
+    }
+}
@@ -18,11 +18,26 @@ UM.Dialog {
     }
     
     property int shapeSizeValue: 999
+    property int curveQualityValue: 2
+    property bool reducedModelsValue: true
+    property bool indexedMeshesValue: false
+    property bool smoothNormalsValue: true
 
     property variant catalog: UM.I18nCatalog { name: "calibrationshapesreborn" }
 
     Component.onCompleted: {
         shapeSizeValue = manager.ShapeSize
+        curveQualityValue = manager.curve_quality
+        reducedModelsValue = manager.reduced_models
+        indexedMeshesValue = manager.indexed_meshes
+        smoothNormalsValue = manager.smooth_normals
+    }
+
+    // The dialog is kept and shown again, and there'll be new shapes to clear by then
+    onVisibleChanged: {
+        if (visible) {
+            clearCacheButton.cleared = false
+        }
     }
 
     title: catalog.i18nc("@title", "Calibration Shapes Reborn Settings")
@@ -95,6 +110,85 @@ UM.Dialog {
                 }
             }
 
+            RowLayout {
+                spacing: UM.Theme.getSize("default_margin").width
+
+                UM.Label {
+                    text: catalog.i18nc("@label", "Curve quality")
+                }
+
+                ComboBox {
+                    id: curveQualitySelector
+                    Layout.minimumWidth: 150 * screenScaleFactor
+                    model: [
+                        catalog.i18nc("@item:inlistbox", "Fixed (90 sides)"),
+                        catalog.i18nc("@item:inlistbox", "Draft"),
+                        catalog.i18nc("@item:inlistbox", "Normal"),
+                        catalog.i18nc("@item:inlistbox", "Fine")
+                    ]
+                    currentIndex: curveQualityValue
+                    onActivated: (index) => {
+                        curveQualityValue = index
+                    }
+                }
+            }
+
+            UM.Label {
+                Layout.maximumWidth: 250 * screenScaleFactor
+                text: catalog.i18nc("@label", "Round shapes get enough sides to stay within a fraction of your nozzle size of a true curve, so small ones aren't needlessly detailed and big ones aren't blocky.")
+                wrapMode: Text.WordWrap
+                font: UM.Theme.getFont("small")
+            }
+
+            UM.CheckBox {
+                id: reducedModelsCheckBox
+                text: catalog.i18nc("@label", "Use reduced detail test models")
+                checked: reducedModelsValue
+                onClicked: {
+                    reducedModelsValue = checked
+                }
+            }
+
+            UM.CheckBox {
+                id: indexedMeshesCheckBox
+                text: catalog.i18nc("@label", "Share vertices between faces (uses less memory)")
+                checked: indexedMeshesValue
+                onClicked: {
+                    indexedMeshesValue = checked
+                }
+            }
+
+            UM.CheckBox {
+                id: smoothNormalsCheckBox
+                text: catalog.i18nc("@label", "Smooth shading on round shapes")
+                checked: smoothNormalsValue
+                onClicked: {
+                    smoothNormalsValue = checked
+                }
+            }
+
+            RowLayout {
+                spacing: UM.Theme.getSize("default_margin").width
+
+                Cura.SecondaryButton {
+                    id: clearCacheButton
+                    property bool cleared: false
+                    text: cleared ? catalog.i18nc("@action:button", "Cached shapes cleared") : catalog.i18nc("@action:button", "Clear cached shapes")
+                    enabled: !cleared
+                    onClicked: {
+                        manager.clear_mesh_cache()
+                        cleared = true
+                    }
+                }
+            }
+
+            UM.Label {
+                Layout.maximumWidth: 250 * screenScaleFactor
+                text: catalog.i18nc("@label", "Shapes are kept in Cura's cache folder so they don't have to be made again next time. Clearing them takes effect straight away.")
+                wrapMode: Text.WordWrap
+                font: UM.Theme.getFont("small")
+            }
+
             // Add any other shape-related settings here
         }
         //}
@@ -144,6 +238,10 @@ UM.Dialog {
     onAccepted: {
         if (validInput){
             manager.SetShapeSize(shapeSizeValue)
+            manager.curve_quality = curveQualityValue
+            manager.reduced_models = reducedModelsValue
+            manager.indexed_meshes = indexedMeshesValue
+            manager.smooth_normals = smoothNormalsValue
         } else {
             reject()
         }
@@ -151,5 +249,9 @@ UM.Dialog {
 
     onRejected: {
         shapeSizeTextField.text = manager.ShapeSize.toString()
+        curveQualityValue = manager.curve_quality
+        reducedModelsValue = manager.reduced_models
+        indexedMeshesValue = manager.indexed_meshes
+        smoothNormalsValue = manager.smooth_normals
     }
 }
\ No newline at end of file
@@ -0,0 +1,330 @@
+// Calibration Shapes Reborn by Slashee the Cow
+// Copyright 2025
+
+import QtQuick 6.0
+import QtQuick.Controls 6.0
+import QtQuick.Layouts 6.0
+
+import UM 1.6 as UM
+import Cura 1.7 as Cura
+
+UM.Dialog {
+
+    id: sweep
+
+    function validateFloat(test, minimum = 0.0){
+        if (test === ""){return false}
+        test = test.replace(",",".") // Use "correct" decimal separator
+        let floatTest = parseFloat(test)
+        if (isNaN(floatTest)){return false}
+        if (floatTest < minimum){return false}
+        return true
+    }
+
+    function toFloat(text){
+        return parseFloat(text.replace(",", "."))
+    }
+
+    property var default_field_background: UM.Theme.getColor("detail_background")
+    property var error_field_background: UM.Theme.getColor("setting_validation_error_background")
+
+    function getBackgroundColour(valid){
+        return valid ? default_field_background : error_field_background
+    }
+
+    // Keep in step with CalibrationShapesReborn.SWEEP_MAX_VARIANTS
+    property int maxVariants: 20
+
+    function validateInputs(){
+        let message = ""
+        let startValid = true
+        let endValid = true
+        let stepValid = true
+        if (!validateFloat(sweepStart, 0.1)){
+            startValid = false;
+            message += catalog.i18nc("@error:start_invalid", "First value must be 0.1 or higher.<br>");
+        }
+
+        if (!validateFloat(sweepEnd, 0.1)){
+            endValid = false;
+            message += catalog.i18nc("@error:end_invalid", "Last value must be 0.1 or higher.<br>");
+        }
+
+        if (!validateFloat(sweepStep, 0.1)){
+            stepValid = false;
+            message += catalog.i18nc("@error:step_invalid", "Step must be 0.1 or higher.<br>");
+        }
+
+        // Test fields for inter-dependencies
+        if (startValid && endValid){
+            if (toFloat(sweepEnd) < toFloat(sweepStart)){
+                message += catalog.i18nc("@error:sweep_order", "Last value can't be smaller than the first.<br>");
+                startValid = false
+                endValid = false
+            } else if (stepValid){
+                let variants = Math.floor((toFloat(sweepEnd) - toFloat(sweepStart)) / toFloat(sweepStep) + 1e-6) + 1
+                if (variants > maxVariants){
+                    message += catalog.i18nc("@error:too_many_variants", "That makes {0} shapes. The most there can be is {1}.<br>").arg(variants).arg(maxVariants);
+                    stepValid = false
+                }
+            }
+        }
+
+        // Test the first and last shapes against the other sizes from the shape's own dialog
+        if (startValid && endValid && stepValid){
+            let problem = manager.sweep_problem(shapeSelector.currentIndex, parameterSelector.currentIndex,
+                toFloat(sweepStart), toFloat(sweepEnd), toFloat(sweepStep))
+            if (problem !== ""){
+                message += problem + "<br>"
+                startValid = false
+                endValid = false
+            }
+        }
+
+        // Global property which controls "OK" button and ability to accept dialog with enter key
+        inputsValid = (startValid && endValid && stepValid)
+        // Global property which displays error message (duh)
+        error_message = message
+        updatePreview()
+
+        // Set background for each box
+        startField.background.color = getBackgroundColour(startValid)
+        endField.background.color = getBackgroundColour(endValid)
+        stepField.background.color = getBackgroundColour(stepValid)
+    }
+
+    property variant catalog: UM.I18nCatalog {name: "calibrationshapesreborn" }
+    property string sweepStart: "0"
+    property string sweepEnd: "0"
+    property string sweepStep: "0"
+
+    property bool inputsValid: false
+    property string error_message: ""
+
+    // Live preview. The values are set as they're typed so the preview can follow them,
+    // and put back how they were if the dialog is closed without OK.
+    property var originalValues: ({})
+    property bool committed: false
+
+    function applyValues(){
+        manager.sweep_shape_index = shapeSelector.currentIndex
+        manager.sweep_parameter_index = parameterSelector.currentIndex
+        manager.sweep_start = toFloat(sweepStart)
+        manager.sweep_end = toFloat(sweepEnd)
+        manager.sweep_step = toFloat(sweepStep)
+    }
+
+    function updatePreview(){
+        if (!visible || !manager.live_preview || !inputsValid){return}
+        applyValues()
+        manager.start_preview("sweep")
+    }
+
+    onVisibleChanged: {
+        if (visible){
+            committed = false
+            originalValues = {
+                "sweep_shape_index": manager.sweep_shape_index,
+                "sweep_parameter_index": manager.sweep_parameter_index,
+                "sweep_start": manager.sweep_start,
+                "sweep_end": manager.sweep_end,
+                "sweep_step": manager.sweep_step
+            }
+            Qt.callLater(validateInputs)
+        } else {
+            manager.stop_preview()
+            if (!committed){
+                for (let key in originalValues){
+                    manager[key] = originalValues[key]
+                }
+            }
+            manager.save_settings()
+        }
+    }
+
+    Component.onCompleted: {
+        shapeSelector.currentIndex = manager.sweep_shape_index
+        parameterSelector.model = manager.sweep_parameter_names(shapeSelector.currentIndex)
+        parameterSelector.currentIndex = manager.sweep_parameter_index
+        sweepStart = String(manager.sweep_start)
+        sweepEnd = String(manager.sweep_end)
+        sweepStep = String(manager.sweep_step)
+        Qt.callLater(validateInputs)
+    }
+
+    title: catalog.i18nc("@window_title", "Parameter Sweep")
+    buttonSpacing: UM.Theme.getSize("default_margin").width
+
+    minimumWidth: Math.max((mainLayout.Layout.minimumWidth + 3 * UM.Theme.getSize("default_margin").width),
+        (okButton.width + cancelButton.width + 4 * UM.Theme.getSize("default_margin").width))
+    maximumWidth: minimumWidth
+    width: minimumWidth
+    minimumHeight: mainLayout.Layout.minimumHeight + (2 * UM.Theme.getSize("default_margin").height) + okButton.height + UM.Theme.getSize("default_lining").height + 20
+    maximumHeight: minimumHeight
+    height: minimumHeight
+
+    ColumnLayout {
+        id: mainLayout
+        anchors.fill: parent
+
+        GridLayout {
+            id: settingsControls
+            Layout.fillWidth: true
+            Layout.alignment: Qt.AlignTop
+
+            columns: 2
+            columnSpacing: UM.Theme.getSize("default_margin").width
+            rowSpacing: UM.Theme.getSize("default_margin").height
+
+            UM.Label{
+                id: shapeLabel
+                text: catalog.i18nc("sweep:shape", "Shape")
+            }
+
+            ComboBox{
+                id: shapeSelector
+                Layout.minimumWidth: 200
+                model: manager.sweep_shape_names
+                onActivated: {
+                    parameterSelector.model = manager.sweep_parameter_names(currentIndex)
+                    parameterSelector.currentIndex = 0
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: parameterLabel
+                text: catalog.i18nc("sweep:parameter", "Parameter")
+            }
+
+            ComboBox{
+                id: parameterSelector
+                Layout.minimumWidth: 200
+                onActivated: {
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: startLabel
+                text: catalog.i18nc("sweep:start", "First Value")
+            }
+
+            UM.TextFieldWithUnit{
+                id: startField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: sweepStart
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    sweepStart = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: endLabel
+                text: catalog.i18nc("sweep:end", "Last Value")
+            }
+
+            UM.TextFieldWithUnit{
+                id: endField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: sweepEnd
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    sweepEnd = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+
+            UM.Label{
+                id: stepLabel
+                text: catalog.i18nc("sweep:step", "Step")
+            }
+
+            UM.TextFieldWithUnit{
+                id: stepField
+                Layout.minimumWidth: 75
+                height: UM.Theme.getSize("setting_control").height
+                unit: "mm"
+                text: sweepStep
+                validator: DoubleValidator {
+                    bottom: 0.1
+                    decimals: 2
+                    notation: DoubleValidator.StandardNotation
+                }
+                onTextChanged: {
+                    sweepStep = text
+                    Qt.callLater(validateInputs)
+                }
+            }
+        }
+        UM.Label{
+            Layout.fillWidth: true
+            id: hint_text
+            text: catalog.i18nc("sweep:hint", "Makes the shape at every step, labelled with its value, as one part.<br>The other sizes are the ones last entered in the shape's own dialog.")
+            wrapMode: TextInput.Wrap
+        }
+        UM.Label{
+            Layout.fillWidth: true
+            id: error_text
+            text: sweep.error_message
+            color: UM.Theme.getColor("error")
+            wrapMode: TextInput.Wrap
+        }
+        UM.CheckBox{
+            id: previewCheckBox
+            text: catalog.i18nc("custom_dialog:preview", "Preview on the build plate")
+            checked: manager.live_preview
+            onClicked: {
+                manager.live_preview = checked
+                Qt.callLater(validateInputs)
+            }
+        }
+    }
+    // Buttons
+    rightButtons: [
+        Cura.SecondaryButton{
+            id: cancelButton
+            text: catalog.i18nc("sweep_cancel", "Cancel")
+
+            onClicked:{
+                sweep.reject()
+            }
+        },
+        Cura.PrimaryButton{
+            id:okButton
+            text: catalog.i18nc("sweep_ok", "OK")
+            enabled: sweep.inputsValid
+
+            onClicked: {
+                sweep.accept()
+            }
+        }
+    ]
+
+    onAccepted: {
+        if(!inputsValid){
+            manager.logMessage("onAccepted{} triggered while inputsValid is false")
+            return
+        }
+
+        committed = true
+        applyValues()
+
+        manager.make_custom_sweep()
+        sweep.close()
+    }
+}
@@ -0,0 +1,113 @@
+// Calibration Shapes Reborn by Slashee the Cow
+// Copyright 2025
+
+import QtQuick 6.0
+import QtQuick.Controls 6.0
+import QtQuick.Layouts 6.0
+
+import UM 1.6 as UM
+import Cura 1.7 as Cura
+
+UM.Dialog {
+
+    id: timings
+
+    property variant catalog: UM.I18nCatalog {name: "calibrationshapesreborn" }
+    property var stats: []
+    property var stages: ["load", "build", "convert", "normals", "scene", "total"]
+
+    function refresh(){
+        stats = manager.timing_stats()
+    }
+
+    function formatTime(row, stage){
+        return row[stage + "_p50"].toFixed(1) + " / " + row[stage + "_p95"].toFixed(1)
+    }
+
+    Component.onCompleted: refresh()
+    onVisibleChanged: {
+        if (visible){ refresh() }
+    }
+
+    title: catalog.i18nc("@window_title", "Shape Timings")
+    buttonSpacing: UM.Theme.getSize("default_margin").width
+
+    minimumWidth: Math.max(statsGrid.implicitWidth + 3 * UM.Theme.getSize("default_margin").width, 400 * screenScaleFactor)
+    width: minimumWidth
+    minimumHeight: 300 * screenScaleFactor
+    height: Math.min(statsGrid.implicitHeight + hint_text.implicitHeight + closeButton.height + 5 * UM.Theme.getSize("default_margin").height, 700 * screenScaleFactor)
+
+    ColumnLayout {
+        id: mainLayout
+        anchors.fill: parent
+
+        UM.Label{
+            Layout.fillWidth: true
+            id: hint_text
+            text: stats.length == 0 ?
+                catalog.i18nc("timings:empty", "No shapes have been added yet.") :
+                catalog.i18nc("timings:hint", "Median / 95th percentile in ms of recently added shapes, slowest first.")
+            wrapMode: TextInput.Wrap
+        }
+
+        ScrollView {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            clip: true
+
+            GridLayout {
+                id: statsGrid
+                columns: timings.stages.length + 3
+                columnSpacing: UM.Theme.getSize("default_margin").width
+                rowSpacing: UM.Theme.getSize("default_lining").height
+
+                UM.Label{ text: catalog.i18nc("timings:shape", "Shape"); font: UM.Theme.getFont("default_bold") }
+                UM.Label{ text: catalog.i18nc("timings:count", "Added"); font: UM.Theme.getFont("default_bold") }
+                UM.Label{ text: catalog.i18nc("timings:triangles", "Triangles"); font: UM.Theme.getFont("default_bold") }
+                Repeater{
+                    model: timings.stages
+                    UM.Label{ text: modelData; font: UM.Theme.getFont("default_bold") }
+                }
+
+                Repeater{
+                    model: timings.stats
+                    delegate: Repeater{
+                        property var row: modelData
+                        model: ["shape", "count", "triangles"].concat(timings.stages)
+                        UM.Label{
+                            text: index < 3 ? String(row[modelData]) : timings.formatTime(row, modelData)
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    rightButtons: [
+        Cura.SecondaryButton{
+            id: clearButton
+            text: catalog.i18nc("timings:clear", "Clear")
+
+            onClicked:{
+                manager.clear_timing_stats()
+                timings.refresh()
+            }
+        },
+        Cura.SecondaryButton{
+            id: refreshButton
+            text: catalog.i18nc("timings:refresh", "Refresh")
+
+            onClicked:{
+                timings.refresh()
+            }
+        },
+        Cura.PrimaryButton{
+            id: closeButton
+            text: catalog.i18nc("timings:close", "Close")
+
+            onClicked:{
+                timings.close()
+            }
+        }
+    ]
+}
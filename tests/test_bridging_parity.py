@@ -0,0 +1,262 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Checks the shapes built straight from ShapeGenerators' arrays against the MeshBuilder code they replaced.
+
+The old generate_capped_* methods are reproduced here as they were, building their faces the way
+Uranium's MeshBuilder does, and laid down the way the old _toMeshData did. The plugin's own builders
+have to come out the same size and shape, with the same triangles less the zero-area ones the old
+bridging tube had, all wound to face out (some of the old box's and triangle's weren't).
+_toMeshData is checked against the per-face loop it replaced too.
+Cura isn't needed: the plugin is imported with tools/benchmark.py's stand-ins if it isn't there.
+
+Run with: python -m pytest tests
+"""
+
+import math
+import os
+import sys
+
+import numpy
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+from benchmark import import_plugin  # noqa: E402
+
+plugin_module = import_plugin()
+MeshOptions = plugin_module.MeshOptions
+
+# What the old _toMeshData did to lay a part down: 90 degrees about -X, so (x, y, z) goes to (x, z, -y)
+OLD_LAY_DOWN = numpy.array([[1, 0, 0], [0, 0, 1], [0, -1, 0]], dtype=numpy.float64)
+
+ALL_OPTIONS = (MeshOptions(indexed=False, smooth=False), MeshOptions(indexed=True, smooth=False),
+               MeshOptions(indexed=True, smooth=True))
+
+
+class FaceRecorder:
+    """Just enough of Uranium's MeshBuilder for the old generators, keeping each face's corners."""
+
+    def __init__(self) -> None:
+        self._faces = []
+
+    def addVertex(self, x: float, y: float, z: float) -> None:
+        pass  # Loose vertices aren't in any face
+
+    def addFace(self, v0: tuple, v1: tuple, v2: tuple) -> None:
+        self._faces.append((v0, v1, v2))
+
+    def addQuad(self, v0: tuple, v1: tuple, v2: tuple, v3: tuple) -> None:
+        # Split and wound the same way as MeshBuilder.addQuad
+        self.addFace(v0, v2, v1)
+        self.addFace(v0, v3, v2)
+
+    def build(self) -> numpy.ndarray:
+        return numpy.array(self._faces, dtype=numpy.float64)
+
+
+def old_capped_cuboid(width, depth, wall_width, height, cap_thickness) -> numpy.ndarray:
+    mesh = FaceRecorder()
+    cap_height = height - cap_thickness
+    outer = [(-width / 2, -depth / 2, 0), (width / 2, -depth / 2, 0), (width / 2, depth / 2, 0), (-width / 2, depth / 2, 0),
+             (-width / 2, -depth / 2, height), (width / 2, -depth / 2, height), (width / 2, depth / 2, height),
+             (-width / 2, depth / 2, height)]
+    inner_x, inner_y = width / 2 - wall_width, depth / 2 - wall_width
+    inner = [(-inner_x, -inner_y, 0), (inner_x, -inner_y, 0), (inner_x, inner_y, 0), (-inner_x, inner_y, 0),
+             (-inner_x, -inner_y, cap_height), (inner_x, -inner_y, cap_height), (inner_x, inner_y, cap_height),
+             (-inner_x, inner_y, cap_height)]
+    for i in range(4):
+        mesh.addQuad(outer[i], outer[(i + 1) % 4], outer[(i + 1) % 4 + 4], outer[i + 4])
+        mesh.addQuad(inner[(i + 1) % 4], inner[i], inner[i + 4], inner[(i + 1) % 4 + 4])
+    mesh.addQuad(outer[7], outer[6], outer[5], outer[4])
+    mesh.addQuad(inner[4], inner[5], inner[6], inner[7])
+    for i in range(4):
+        mesh.addQuad(inner[i], inner[(i + 1) % 4], outer[(i + 1) % 4], outer[i])
+    return mesh.build()
+
+
+def old_capped_tube(outer_diameter, inner_diameter, height, cap_thickness, segments=96) -> numpy.ndarray:
+    mesh = FaceRecorder()
+    outer_radius = outer_diameter / 2.0
+    inner_radius = inner_diameter / 2.0
+    cap_height = height - cap_thickness
+    vertices = []
+    for i in range(segments):
+        angle = (2.0 * math.pi * i) / segments
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        vertices.extend(((outer_radius * cos_a, outer_radius * sin_a, 0), (outer_radius * cos_a, outer_radius * sin_a, cap_height),
+                         (inner_radius * cos_a, inner_radius * sin_a, 0), (inner_radius * cos_a, inner_radius * sin_a, cap_height),
+                         (outer_radius * cos_a, outer_radius * sin_a, height), (inner_radius * cos_a, inner_radius * sin_a, cap_height)))
+    center_cap = (0, 0, height)
+    center_cap_base = (0, 0, cap_height)
+    for i in range(segments):
+        next_i = (i + 1) % segments
+        v0, v1, v2, v3, v4, v5 = vertices[i * 6:i * 6 + 6]
+        v0_next, v1_next, v2_next, v3_next, v4_next, v5_next = vertices[next_i * 6:next_i * 6 + 6]
+        mesh.addQuad(v0, v1, v1_next, v0_next)
+        mesh.addQuad(v2_next, v3_next, v3, v2)
+        mesh.addQuad(v1, v4, v4_next, v1_next)
+        mesh.addQuad(v2, v0, v0_next, v2_next)
+        mesh.addFace(v4, v4_next, center_cap)
+        mesh.addQuad(v5, v3, v3_next, v5_next)
+        mesh.addFace(v5_next, v5, center_cap_base)
+    return mesh.build()
+
+
+def old_capped_triangle(base, height, wall_width, total_height, cap_thickness) -> numpy.ndarray:
+    """Also moved by (-base / 2, -height / 2) like make_custom_bridging_triangle did afterwards."""
+    mesh = FaceRecorder()
+    cap_height = total_height - cap_thickness
+    outer_2d = [(0, 0), (base, 0), (base, height)]
+
+    def offset_edge(p0, p1):
+        edge = (p1[0] - p0[0], p1[1] - p0[1])
+        length = math.hypot(*edge)
+        left_normal = (-edge[1] / length, edge[0] / length)
+        return (p0[0] + left_normal[0] * wall_width, p0[1] + left_normal[1] * wall_width), edge
+
+    edges = [offset_edge(outer_2d[i], outer_2d[(i + 1) % 3]) for i in range(3)]
+
+    def inner_vertex(first, second):
+        (anchor1, dir1), (anchor2, dir2) = edges[first], edges[second]
+        denominator = dir1[0] * dir2[1] - dir1[1] * dir2[0]
+        t = ((anchor2[0] - anchor1[0]) * dir2[1] - (anchor2[1] - anchor1[1]) * dir2[0]) / denominator
+        return anchor1[0] + t * dir1[0], anchor1[1] + t * dir1[1]
+
+    (bx, by), (ax, ay), (cx, cy) = outer_2d
+    (bix, biy), (aix, aiy), (cix, ciy) = inner_vertex(2, 0), inner_vertex(0, 1), inner_vertex(1, 2)
+    B, A, C = (bx, by, 0), (ax, ay, 0), (cx, cy, 0)
+    B_top, A_top, C_top = (bx, by, total_height), (ax, ay, total_height), (cx, cy, total_height)
+    B_in, A_in, C_in = (bix, biy, 0), (aix, aiy, 0), (cix, ciy, 0)
+    B_in_top, A_in_top, C_in_top = (bix, biy, cap_height), (aix, aiy, cap_height), (cix, ciy, cap_height)
+    mesh.addQuad(B, A, A_top, B_top)
+    mesh.addQuad(A, C, C_top, A_top)
+    mesh.addQuad(C, B, B_top, C_top)
+    mesh.addQuad(A_in, B_in, B_in_top, A_in_top)
+    mesh.addQuad(C_in, A_in, A_in_top, C_in_top)
+    mesh.addQuad(B_in, C_in, C_in_top, B_in_top)
+    mesh.addFace(B_top, A_top, C_top)
+    mesh.addFace(B_in_top, C_in_top, A_in_top)
+    mesh.addQuad(B_in, A_in, A, B)
+    mesh.addQuad(A_in, C_in, C, A)
+    mesh.addQuad(C_in, B_in, B, C)
+    return mesh.build() - (base / 2, height / 2, 0)
+
+
+def old_to_mesh_data(tri_node) -> tuple:
+    """The old _toMeshData: lay the part down, then give every face its own vertices one at a time."""
+    rotation = numpy.eye(4)
+    rotation[:3, :3] = OLD_LAY_DOWN
+    tri_node.apply_transform(rotation)
+    indices = []
+    vertices = []
+    index_count = 0
+    face_count = 0
+    for tri_face in tri_node.faces:
+        face = []
+        for tri_index in tri_face:
+            vertices.append(tri_node.vertices[tri_index])
+            face.append(index_count)
+            index_count += 1
+        indices.append(face)
+        face_count += 1
+    vertices = numpy.asarray(vertices, dtype=numpy.float32)
+    indices = numpy.asarray(indices, dtype=numpy.int32)
+    normals = plugin_module.calculateNormalsFromIndexedVertices(vertices, indices, face_count)
+    return vertices, indices, normals
+
+
+def triangles_of(mesh_data) -> numpy.ndarray:
+    vertices = numpy.asarray(mesh_data.getVertices(), dtype=numpy.float64)
+    indices = mesh_data.getIndices()
+    return vertices[indices] if indices is not None else vertices.reshape(-1, 3, 3)
+
+
+def outward_volume(triangles: numpy.ndarray) -> float:
+    """Volume of a closed surface whichever way its faces are wound, as some of the old shapes' faces were
+    wound inside out. A face is facing in if a ray from its middle along its normal goes through the surface
+    an odd number of times. The ray is tilted a little so it doesn't go exactly along an edge."""
+    first, second, third = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    cross = numpy.cross(second - first, third - first)
+    directions = cross / numpy.maximum(numpy.linalg.norm(cross, axis=1), 1e-12)[:, None] + (0.0123, 0.0234, 0.0345)
+    # Moller-Trumbore, every ray against every face
+    edge1, edge2 = second - first, third - first
+    p = numpy.cross(directions[:, None], edge2[None])
+    determinants = numpy.einsum("ijk,jk->ij", p, edge1)
+    parallel = numpy.abs(determinants) < 1e-12
+    inverse = 1 / numpy.where(parallel, 1, determinants)
+    s = triangles.mean(axis=1)[:, None] - first[None]
+    u = numpy.einsum("ijk,ijk->ij", s, p) * inverse
+    q = numpy.cross(s, edge1[None])
+    v = numpy.einsum("ik,ijk->ij", directions, q) * inverse
+    distances = numpy.einsum("jk,ijk->ij", edge2, q) * inverse
+    crossings = (~parallel & (u >= 0) & (v >= 0) & (u + v <= 1) & (distances > 1e-9)).sum(axis=1)
+    facing = numpy.where(crossings % 2 == 1, -1, 1)
+    return float((facing * numpy.einsum("ij,ij->i", first, cross)).sum() / 6)
+
+
+def measure(triangles: numpy.ndarray) -> dict:
+    """Bounds, volume and how many triangles have any area."""
+    cross = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    return {
+        "lower": triangles.reshape(-1, 3).min(axis=0),
+        "upper": triangles.reshape(-1, 3).max(axis=0),
+        "volume": outward_volume(triangles),
+        "triangles": int((numpy.linalg.norm(cross, axis=1) > 1e-9).sum()),
+    }
+
+
+@pytest.fixture(scope="module")
+def plugin():
+    return plugin_module.CalibrationShapesReborn()
+
+
+# (builder, its arguments, old generator, its arguments), at the dialogs' defaults and something else
+BRIDGING_CASES = {
+    "box": ("_build_bridging_box", (50, 40, 3, 10, 3), old_capped_cuboid, (50, 40, 3, 10, 3)),
+    "box_thin": ("_build_bridging_box", (12.5, 80, 0.8, 25, 1.2), old_capped_cuboid, (12.5, 80, 0.8, 25, 1.2)),
+    "tube": ("_build_bridging_tube", (30, 26, 10, 2, 96), old_capped_tube, (30, 26, 10, 2, 96)),
+    "tube_coarse": ("_build_bridging_tube", (60, 20, 15, 4.5, 24), old_capped_tube, (60, 20, 15, 4.5, 24)),
+    "triangle": ("_build_bridging_triangle", (50, 50, 3, 10, 1), old_capped_triangle, (50, 50, 3, 10, 1)),
+    "triangle_narrow": ("_build_bridging_triangle", (30, 70, 2, 8, 2), old_capped_triangle, (30, 70, 2, 8, 2)),
+}
+
+
+@pytest.mark.parametrize("options", ALL_OPTIONS, ids=("plain", "indexed", "smooth"))
+@pytest.mark.parametrize("case", BRIDGING_CASES.values(), ids=BRIDGING_CASES.keys())
+def test_bridging_shape_matches_meshbuilder(plugin, case, options) -> None:
+    build_name, build_args, old_generator, old_args = case
+    old = measure(old_generator(*old_args) @ OLD_LAY_DOWN.T)
+    new_triangles = triangles_of(getattr(plugin, build_name)(options, *build_args))
+    new = measure(new_triangles)
+
+    numpy.testing.assert_allclose(new["lower"], old["lower"], atol=1e-4)
+    numpy.testing.assert_allclose(new["upper"], old["upper"], atol=1e-4)
+    assert new["volume"] == pytest.approx(old["volume"], rel=1e-5)
+    assert new["triangles"] == old["triangles"]
+    assert new["triangles"] == len(new_triangles), "No zero-area triangles"
+    cross = numpy.cross(new_triangles[:, 1] - new_triangles[:, 0], new_triangles[:, 2] - new_triangles[:, 0])
+    assert numpy.einsum("ij,ij->", new_triangles[:, 0], cross) / 6 == pytest.approx(new["volume"], rel=1e-5), \
+        "Every face wound to face out"
+
+
+@pytest.mark.parametrize("case", BRIDGING_CASES.values(), ids=BRIDGING_CASES.keys())
+def test_bridging_normals_face_out(plugin, case) -> None:
+    build_name, build_args, _, _ = case
+    mesh_data = getattr(plugin, build_name)(MeshOptions(indexed=False, smooth=False), *build_args)
+    triangles = triangles_of(mesh_data)
+    winding = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    winding /= numpy.linalg.norm(winding, axis=1)[:, None]
+    face_normals = numpy.asarray(mesh_data.getNormals()).reshape(-1, 3, 3)[:, 0]
+    numpy.testing.assert_allclose(face_normals, winding, atol=1e-5)
+
+
+def test_to_mesh_data_matches_per_face_loop(plugin) -> None:
+    trimesh = pytest.importorskip("trimesh")
+    mesh = trimesh.creation.annulus(r_min=5, r_max=10, height=20, sections=90)
+    mesh.apply_translation((3, -4, 10))
+    old_vertices, old_indices, old_normals = old_to_mesh_data(mesh.copy())
+
+    mesh_data = plugin._toMeshData(MeshOptions(indexed=False, smooth=False), mesh)
+    numpy.testing.assert_array_equal(mesh_data.getIndices(), old_indices)
+    numpy.testing.assert_allclose(mesh_data.getVertices(), old_vertices, atol=1e-5)
+    numpy.testing.assert_allclose(mesh_data.getNormals(), old_normals, atol=1e-6)
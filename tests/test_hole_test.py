@@ -0,0 +1,43 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Checks the generated hole test against the layout of the STL it replaced, from models/HoleTest.scad.
+
+Cura isn't needed: the plugin is imported with tools/benchmark.py's stand-ins if it isn't there.
+"""
+
+import os
+import sys
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+from benchmark import import_plugin  # noqa: E402
+
+ShapeGenerators = import_plugin().ShapeGenerators
+
+# HoleTest.scad: for i = 3..17, a tube r = i * 0.5 - 1 inside and i * 0.5 + 0.3 outside, 24 mm out at i * i * 1.2 degrees
+REFERENCE_I = numpy.arange(3, 18)
+REFERENCE_ANGLES = numpy.radians(REFERENCE_I * REFERENCE_I * 1.2)
+REFERENCE_CENTRES = 24 * numpy.stack((numpy.cos(REFERENCE_ANGLES), numpy.sin(REFERENCE_ANGLES)), axis=1)
+REFERENCE_OUTER_RADII = REFERENCE_I * 0.5 + 0.3
+
+
+def footprint(centres: numpy.ndarray, radii: numpy.ndarray) -> numpy.ndarray:
+    return (centres + radii[:, None]).max(axis=0) - (centres - radii[:, None]).min(axis=0)
+
+
+def test_standard_holes_match_reference_layout() -> None:
+    wall_width = 1.3
+    outer_radii = numpy.arange(1, 16) / 2 + wall_width
+    assert numpy.allclose(outer_radii, REFERENCE_OUTER_RADII)
+    centres = ShapeGenerators.ring_layout(outer_radii, wall_width / 2)
+    assert numpy.allclose(numpy.linalg.norm(centres, axis=1), 24, atol=0.1)
+    assert numpy.allclose(footprint(centres, outer_radii), footprint(REFERENCE_CENTRES, REFERENCE_OUTER_RADII), atol=1.5)
+    # Neighbours overlap about as much as the reference's do, and only neighbours do
+    gaps = numpy.linalg.norm(centres[:, None] - centres, axis=2) - (outer_radii[:, None] + outer_radii)
+    neighbours = numpy.roll(numpy.eye(15, dtype=bool), 1, axis=1) | numpy.roll(numpy.eye(15, dtype=bool), -1, axis=1)
+    reference_gaps = numpy.linalg.norm(REFERENCE_CENTRES - numpy.roll(REFERENCE_CENTRES, -1, axis=0), axis=1) \
+        - (REFERENCE_OUTER_RADII + numpy.roll(REFERENCE_OUTER_RADII, -1))
+    assert reference_gaps.min() <= gaps[neighbours].min() and gaps[neighbours].max() <= reference_gaps.max()
+    assert numpy.all(gaps[~neighbours & ~numpy.eye(15, dtype=bool)] > 0)
@@ -0,0 +1,90 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Checks the sweep dialog's test of its first and last shapes against the rest of the shape's sizes.
+
+Cura isn't needed: the plugin is imported with tools/benchmark.py's stand-ins if it isn't there.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+from benchmark import import_plugin  # noqa: E402
+
+plugin_module = import_plugin()
+
+
+@pytest.fixture
+def plugin():
+    return plugin_module.CalibrationShapesReborn()
+
+
+def sweep_indexes(plugin, setting: str) -> tuple:
+    """(shape index, parameter index) in the sweep dialog for the setting it steps."""
+    for shape_index, (_, _, parameters) in enumerate(plugin._sweepShapes()):
+        for parameter_index, (_, parameter) in enumerate(parameters):
+            if parameter == setting:
+                return shape_index, parameter_index
+    raise KeyError(setting)
+
+
+@pytest.mark.parametrize("setting, start, end, step, failing", [
+    ("custom_tube_outer_diameter", 20, 40, 5, 20),  # Smaller than the 25 mm inside to start with
+    ("custom_tube_inner_diameter", 10, 30, 5, 30),  # Reaches the 30 mm outside
+    ("bridging_box_roof_height", 1, 12, 1, 12),  # Taller than the 10 mm box by the end
+    ("bridging_triangle_wall_width", 1, 20, 1, 20),  # Too thick for the triangle by the end
+])
+def test_sweep_problem_names_the_variant(plugin, setting, start, end, step, failing) -> None:
+    shape_index, parameter_index = sweep_indexes(plugin, setting)
+    problem = plugin.sweep_problem(shape_index, parameter_index, start, end, step)
+    # The same reason the shape would fail with when it was made
+    kind, _ = plugin._sweepParameter(shape_index, parameter_index)
+    _, build, build_args = plugin._customShape(kind, {setting: failing})
+    with pytest.raises(ValueError) as error:
+        build(plugin_module.MeshOptions(indexed=False, smooth=False), *build_args)
+    assert problem == f"At {failing}: {error.value}."
+
+
+@pytest.mark.parametrize("setting, start, end, step", [
+    ("custom_tube_outer_diameter", 26, 40, 5),
+    ("bridging_tube_inner_diameter", 10, 28, 2),
+    ("custom_box_width", 10, 100, 10),
+])
+def test_sweep_problem_empty_when_every_variant_fits(plugin, setting, start, end, step) -> None:
+    assert plugin.sweep_problem(*sweep_indexes(plugin, setting), start, end, step) == ""
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("custom_tube_outer_diameter", 20),
+    ("custom_tube_outer_diameter", 40),
+    ("bridging_tube_inner_diameter", 30),
+    ("bridging_tube_roof_height", 0.5),
+    ("bridging_box_wall_width", 8),
+    ("bridging_triangle_wall_width", 20),
+    ("bridging_triangle_height", 1),
+    ("custom_box_width", 10),
+])
+def test_check_matches_building(plugin, setting, value) -> None:
+    kind, _ = plugin._sweepParameter(*sweep_indexes(plugin, setting))
+    _, build, build_args = plugin._customShape(kind, {setting: value})
+    try:
+        build(plugin_module.MeshOptions(indexed=False, smooth=False), *build_args)
+    except ValueError as error:
+        with pytest.raises(ValueError, match=re.escape(str(error))):
+            plugin._checkShape(build, build_args)
+    else:
+        plugin._checkShape(build, build_args)
+
+
+def test_sweep_problem_builds_nothing(plugin, monkeypatch) -> None:
+    def no_building(*args, **kwargs):
+        raise AssertionError("The sweep dialog's check made a mesh")
+    for generator in ("tube", "capped_tube", "capped_prism", "box", "cylinder"):
+        monkeypatch.setattr(plugin_module.ShapeGenerators, generator, no_building)
+    for shape_index, (_, _, parameters) in enumerate(plugin._sweepShapes()):
+        for parameter_index in range(len(parameters)):
+            plugin.sweep_problem(shape_index, parameter_index, 1, 40, 1)
@@ -0,0 +1,36 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Checks normals are moved along with the parts they belong to, however the parts are scaled.
+
+Cura isn't needed: the plugin is imported with tools/benchmark.py's stand-ins if it isn't there.
+"""
+
+import os
+import sys
+
+import numpy
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+from benchmark import import_plugin  # noqa: E402
+
+plugin_module = import_plugin()
+
+NORMALS = numpy.array(((1, 0, 0), (0, 1, 0), (0, 0, 1), (0.6, 0.8, 0), (0, -0.6, 0.8)), dtype=numpy.float32)
+
+
+@pytest.mark.parametrize("scale", [(1, 1, 1), (2, 2, 2), (2, 0.5, 1), (-1, 1, 1), (3, 1, -0.5)])
+def test_matches_inverse_transpose(scale) -> None:
+    matrix = plugin_module.lay_down_matrix(numpy.diag((*scale, 1.0)))
+    expected = NORMALS @ numpy.linalg.inv(matrix[:3, :3])
+    expected /= numpy.linalg.norm(expected, axis=1, keepdims=True)
+    assert numpy.allclose(plugin_module.transform_normals(NORMALS, matrix), expected, atol=1e-6)
+
+
+def test_flattened_part_has_no_inverse() -> None:
+    """Scaled to nothing along X, like the bed level calibration on a bed too small for it used to be."""
+    normals = plugin_module.transform_normals(NORMALS, plugin_module.lay_down_matrix(numpy.diag((0.0, 1.0, 1.0, 1.0))))
+    assert numpy.all(numpy.isfinite(normals))
+    lengths = numpy.linalg.norm(normals, axis=1)
+    assert numpy.allclose(lengths[lengths > 0], 1)
@@ -0,0 +1,613 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Headless benchmark for every shape generator and model loader.
+
+Usage: python tools/benchmark.py [--output benchmark.json] [--repeat 3] [--filter text]
+                                 [--baseline old.json [--slowdown 1.5]]
+   or: python -m pytest tools/benchmark.py [-k text] [--benchmark-json benchmark.json]
+
+Cura isn't needed. If UM, cura or PyQt6 can't be imported, lightweight stand-ins are installed in
+their place: jobs run as soon as they're started, callLater calls straight away and the scene is a list.
+Every _add_*, make_custom_* and _build_bridging_* path and every bundled model is run on a fresh plugin
+(so no caches carry over, including the one on disk) and timed in stages:
+    load     reading models (asset pack, memory mapped STL or trimesh)
+    build    everything not in another stage, such as generating a shape
+    convert  laying the mesh down into MeshData, including welding
+    normals  calculateNormalsFromIndexedVertices
+    scene    creating nodes and adding them to the scene
+Memory mapped models are only read when converted, so that's where their disk time shows up.
+
+Triangle counts, the best wall time of the repeats and peak traced memory go to the JSON file.
+Memory is measured in one more run after the timed ones, since tracing it slows numpy down a lot.
+With --baseline, cases more than --slowdown times slower than in that file are listed and the exit
+status is 1, so it can be used to check for regressions. Needs numpy and trimesh.
+
+Under pytest every case is a test, which passes if it makes some triangles in the best of three runs
+and has a time for every stage, none of them negative. --benchmark-json path (from tools/conftest.py)
+writes the same JSON file as --output. Set BENCHMARK_BASELINE (and BENCHMARK_SLOWDOWN) to check them
+against an earlier JSON file in the same way.
+"""
+
+import argparse
+import functools
+import gc
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGIN_PACKAGE = "CalibrationShapesReborn"
+
+STAGES = ("load", "build", "convert", "normals", "scene")
+# Runs of each case under pytest, the fastest of which is kept
+PYTEST_REPEAT = 3
+# Which plugin methods belong to each stage. Anything else counts as build.
+METHOD_STAGES = {
+    "_load_model": "load",
+    "_load_packed_model": "load",
+    "_toMeshData": "convert",
+    "_indexedToMeshData": "convert",
+    "_trianglesToMeshData": "convert",
+    "_weldedMeshData": "convert",
+    "_addShape": "scene",
+    "_addShapeGrid": "scene",
+}
+FUNCTION_STAGES = {
+    "read_binary_stl": "load",
+    "calculateNormalsFromIndexedVertices": "normals",
+}
+
+
+def _module(name: str, **attributes) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+
+class _Signal:
+    def __init__(self, *args, **kwargs) -> None:
+        self._callbacks = []
+
+    def connect(self, callback: Callable) -> None:
+        self._callbacks.append(callback)
+
+    def emit(self, *args) -> None:
+        for callback in self._callbacks:
+            callback(*args)
+
+
+def install_stand_ins() -> None:
+    """Puts minimal versions of the parts of UM, cura and PyQt6 the plugin uses into sys.modules."""
+
+    # PyQt6
+    def pyqtProperty(type_, fget=None, fset=None, notify=None, constant=False):
+        if fget is None:
+            return lambda getter: property(getter, fset)
+        return property(fget, fset)
+
+    class QTimer:
+        """Never fires by itself. Tests of debounced things call timeout.emit() when they want it to."""
+
+        def __init__(self, *args) -> None:
+            self.timeout = _Signal()
+            self.active = False
+
+        def setSingleShot(self, single_shot: bool) -> None:
+            pass
+
+        def setInterval(self, msec: int) -> None:
+            pass
+
+        def start(self) -> None:
+            self.active = True
+
+        def stop(self) -> None:
+            self.active = False
+
+        @staticmethod
+        def singleShot(msec: int, callback: Callable) -> None:
+            pass  # Jobs finish before they'd need a progress message
+
+    _module("PyQt6")
+    _module("PyQt6.QtCore", QObject=type("QObject", (), {"__init__": lambda self, *args, **kwargs: None}),
+            QTimer=QTimer, pyqtProperty=pyqtProperty, pyqtSignal=lambda *args, **kwargs: _Signal(),
+            pyqtSlot=lambda *args, **kwargs: (lambda function: function))
+
+    # UM
+    class Extension:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def setMenuName(self, name: str) -> None:
+            pass
+
+        def addMenuItem(self, name: str, callback: Callable) -> None:
+            pass
+
+    class Job:
+        def __init__(self) -> None:
+            self.finished = _Signal()
+            self._result = None
+            self._error = None
+
+        def setResult(self, result) -> None:
+            self._result = result
+
+        def getResult(self):
+            return self._result
+
+        def hasError(self) -> bool:
+            return self._error is not None
+
+        def getError(self):
+            return self._error
+
+        def start(self) -> None:
+            try:
+                self.run()
+            except Exception as error:  # Same as Uranium: the error is kept on the job
+                self._error = error
+            self.finished.emit(self)
+
+    class Vector:
+        def __init__(self, x: float = 0, y: float = 0, z: float = 0) -> None:
+            self.x, self.y, self.z = x, y, z
+
+    class AxisAlignedBox:
+        def __init__(self, minimum: numpy.ndarray, maximum: numpy.ndarray) -> None:
+            self.width, self.height, self.depth = (maximum - minimum).tolist()
+
+    class MeshData:
+        def __init__(self, vertices=None, normals=None, indices=None, **kwargs) -> None:
+            self._vertices, self._normals, self._indices = vertices, normals, indices
+
+        def getVertices(self):
+            return self._vertices
+
+        def getNormals(self):
+            return self._normals
+
+        def getIndices(self):
+            return self._indices
+
+        def getVertexCount(self) -> int:
+            return 0 if self._vertices is None else len(self._vertices)
+
+        def getFaceCount(self) -> int:
+            return len(self._indices) if self._indices is not None else self.getVertexCount() // 3
+
+        def getExtents(self, matrix=None) -> AxisAlignedBox:
+            return AxisAlignedBox(self._vertices.min(axis=0), self._vertices.max(axis=0))
+
+    def calculateNormalsFromIndexedVertices(vertices, indices, face_count):
+        """Same maths as Uranium's: each face's normal on each of its corners."""
+        corners = vertices[indices[:face_count]]
+        normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = numpy.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1
+        normals = (normals / lengths[:, None]).astype(numpy.float32)
+        result = numpy.zeros(vertices.shape, dtype=numpy.float32)
+        for corner in range(3):
+            result[indices[:face_count, corner]] = normals
+        return result
+
+    class Message:
+        class MessageType:
+            ERROR = 3
+
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def show(self) -> None:
+            pass
+
+        def hide(self) -> None:
+            pass
+
+    class SceneNode:
+        def __init__(self, *args, **kwargs) -> None:
+            self.mesh_data = None
+            self.decorators = []
+            self._parent = None
+
+        def setParent(self, parent) -> None:
+            if self._parent is not None:
+                self._parent.children.remove(self)
+            self._parent = parent
+            if parent is not None:
+                parent.children.append(self)
+
+        def getParent(self):
+            return self._parent
+
+        def setMeshData(self, mesh_data) -> None:
+            self.mesh_data = mesh_data
+
+        def getMeshData(self):
+            return self.mesh_data
+
+        def setSelectable(self, selectable: bool) -> None:
+            pass
+
+        def setName(self, name: str) -> None:
+            self.name = name
+
+        def setPosition(self, position) -> None:
+            self.position = position
+
+        def callDecoration(self, *args) -> None:
+            pass
+
+        def addDecorator(self, decorator) -> None:
+            self.decorators.append(decorator)
+
+    class AddSceneNodeOperation:
+        def __init__(self, node, parent) -> None:
+            self._node, self._parent = node, parent
+
+        def push(self) -> None:
+            self._parent.children.append(self._node)
+
+        def redo(self) -> None:
+            self.push()
+
+    class GroupedOperation:
+        def __init__(self) -> None:
+            self._operations = []
+
+        def addOperation(self, operation) -> None:
+            self._operations.append(operation)
+
+        def push(self) -> None:
+            for operation in self._operations:
+                operation.redo()
+
+    class i18nCatalog:
+        def __init__(self, name: str = "") -> None:
+            pass
+
+        def hasTranslationLoaded(self) -> bool:
+            return False
+
+        def i18nc(self, context: str, text: str, *args) -> str:
+            return text.format(*args) if args else text
+
+    class Resources:
+        Preferences = 0
+
+        @staticmethod
+        def addSearchPath(path: str) -> None:
+            pass
+
+        @staticmethod
+        def getCacheStoragePath() -> str:
+            return os.path.join(os.path.expanduser("~"), ".cache", "calibration_shapes_benchmark")
+
+        @staticmethod
+        def getStoragePath(*args) -> str:
+            return Resources.getCacheStoragePath()
+
+    placeholder = type("Placeholder", (), {"__init__": lambda self, *args, **kwargs: None})
+    _module("UM")
+    _module("UM.Application", Application=placeholder)
+    _module("UM.Extension", Extension=Extension)
+    _module("UM.i18n", i18nCatalog=i18nCatalog)
+    _module("UM.Job", Job=Job)
+    job_queue = types.SimpleNamespace(remove=lambda job: None)
+    _module("UM.JobQueue", JobQueue=type("JobQueue", (), {"getInstance": staticmethod(lambda: job_queue)}))
+    _module("UM.Logger", Logger=type("Logger", (), {"log": staticmethod(lambda level, message, *args: None)}))
+    _module("UM.Math")
+    _module("UM.Math.Vector", Vector=Vector)
+    _module("UM.Mesh")
+    _module("UM.Mesh.MeshData", MeshData=MeshData, calculateNormalsFromIndexedVertices=calculateNormalsFromIndexedVertices)
+    _module("UM.Message", Message=Message)
+    _module("UM.Operations")
+    _module("UM.Operations.AddSceneNodeOperation", AddSceneNodeOperation=AddSceneNodeOperation)
+    _module("UM.Operations.GroupedOperation", GroupedOperation=GroupedOperation)
+    _module("UM.Operations.RemoveSceneNodeOperation", RemoveSceneNodeOperation=placeholder)
+    _module("UM.Operations.SetTransformOperation", SetTransformOperation=placeholder)
+    _module("UM.Resources", Resources=Resources)
+    _module("UM.Scene")
+    _module("UM.Scene.SceneNode", SceneNode=SceneNode)
+    _module("UM.Scene.SceneNodeSettings", SceneNodeSettings=placeholder)
+    _module("UM.Scene.Selection", Selection=placeholder)
+    _module("UM.Settings")
+    _module("UM.Settings.SettingInstance", SettingInstance=placeholder)
+
+    # cura
+    class Preferences:
+        def __init__(self) -> None:
+            self._values = {}
+
+        def addPreference(self, key: str, default) -> None:
+            self._values.setdefault(key, default)
+
+        def getValue(self, key: str):
+            return self._values.get(key)
+
+        def setValue(self, key: str, value) -> None:
+            self._values[key] = value
+
+        def resetPreference(self, key: str) -> None:
+            pass
+
+    class Stack:
+        def __init__(self, stack_id: str) -> None:
+            self._id = stack_id
+
+        def getId(self) -> str:
+            return self._id
+
+        def getProperty(self, key: str, property_name: str):
+            return {"machine_width": 220, "machine_depth": 220, "machine_nozzle_size": 0.4}.get(key)
+
+    class Scene:
+        def __init__(self) -> None:
+            self.children = []
+            self.sceneChanged = _Signal()
+
+        def getRoot(self) -> "Scene":
+            return self
+
+    class CuraApplication:
+        _instance = None
+
+        def __init__(self) -> None:
+            self._preferences = Preferences()
+            self._scene = Scene()
+            self._global_stack = Stack("machine")
+            self._extruders = [Stack("extruder_0"), Stack("extruder_1")]
+            self.applicationShuttingDown = _Signal()
+
+        @classmethod
+        def getInstance(cls) -> "CuraApplication":
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+        def getPreferences(self) -> Preferences:
+            return self._preferences
+
+        def getController(self):
+            return types.SimpleNamespace(getScene=lambda: self._scene)
+
+        def getGlobalContainerStack(self) -> Stack:
+            return self._global_stack
+
+        def getExtruderManager(self):
+            return types.SimpleNamespace(getActiveExtruderStacks=lambda: self._extruders)
+
+        def getMachineManager(self):
+            return types.SimpleNamespace(activeMachine=self._global_stack, defaultExtruderPosition="0")
+
+        def getMultiBuildPlateModel(self):
+            return types.SimpleNamespace(activeBuildPlate=0)
+
+        def callLater(self, callback: Callable, *args) -> None:
+            callback(*args)
+
+        def createQmlComponent(self, *args):
+            return None
+
+    _module("cura")
+    _module("cura.CuraApplication", CuraApplication=CuraApplication)
+    _module("cura.Scene")
+    _module("cura.Scene.CuraSceneNode", CuraSceneNode=SceneNode)
+    _module("cura.Scene.BuildPlateDecorator", BuildPlateDecorator=placeholder)
+    _module("cura.Scene.SliceableObjectDecorator", SliceableObjectDecorator=placeholder)
+
+
+def import_plugin() -> types.ModuleType:
+    """Imports the plugin's main module, using stand-ins for Cura if it isn't there.
+    Once it's imported the same module is returned every time."""
+    main_module = sys.modules.get(f"{PLUGIN_PACKAGE}.CalibrationShapesReborn")
+    if main_module is not None:
+        return main_module
+    try:
+        for module_name in ("UM.Application", "cura.CuraApplication", "PyQt6.QtCore"):
+            importlib.import_module(module_name)
+    except ImportError:
+        install_stand_ins()
+    spec = importlib.util.spec_from_file_location(PLUGIN_PACKAGE, os.path.join(PLUGIN_DIR, "__init__.py"),
+                                                  submodule_search_locations=[PLUGIN_DIR])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[PLUGIN_PACKAGE] = package
+    spec.loader.exec_module(package)
+    return sys.modules[f"{PLUGIN_PACKAGE}.CalibrationShapesReborn"]
+
+
+class StageTimer:
+    """Adds up the time spent in each stage. Time in a stage nested inside another only counts for the inner one."""
+
+    def __init__(self) -> None:
+        self.totals = defaultdict(float)  # type: Dict[str, float]
+        self._nested = []  # type: List[float]
+
+    def wrap(self, stage: str, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            self._nested.append(0.0)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.totals[stage] += elapsed - self._nested.pop()
+                if self._nested:
+                    self._nested[-1] += elapsed
+        return timed
+
+
+def find_cases(plugin_module: types.ModuleType) -> List[Tuple[str, Callable]]:
+    """(name, function taking a fresh plugin) for everything worth timing."""
+    plugin_class = plugin_module.CalibrationShapesReborn
+    cases = []
+    for name in sorted(dir(plugin_class)):
+        if name.startswith("_add_") or name.startswith("make_custom_"):
+            cases.append((name, lambda plugin, name=name: getattr(plugin, name)()))
+    # The bridging shapes' builders on their own, without adding them to the scene
+    cases.append(("_build_bridging_box", lambda plugin: plugin._build_bridging_box(
+        plugin._meshOptions(), *plugin._customShape("bridging_box")[2])))
+    cases.append(("_build_bridging_tube", lambda plugin: plugin._build_bridging_tube(
+        plugin._meshOptions(), *plugin._customShape("bridging_tube")[2])))
+    cases.append(("_build_bridging_triangle", lambda plugin: plugin._build_bridging_triangle(
+        plugin._meshOptions(), *plugin._customShape("bridging_triangle")[2])))
+
+    models_dir = os.path.join(PLUGIN_DIR, "models")
+    model_files = sorted(filename for filename in os.listdir(models_dir) if filename.lower().endswith(".stl"))
+    reduced_dir = os.path.join(models_dir, plugin_module.REDUCED_MODELS_DIR)
+    if os.path.isdir(reduced_dir):
+        model_files += sorted(f"{plugin_module.REDUCED_MODELS_DIR}/{filename}" for filename in os.listdir(reduced_dir)
+                              if filename.lower().endswith(".stl"))
+    for filename in model_files:
+        cases.append((f"load {filename}", lambda plugin, filename=filename:
+                      plugin._load_model_mesh_data(plugin._meshOptions(), filename)))
+    return cases
+
+
+def run_case(plugin_module: types.ModuleType, run: Callable, trace_memory: bool = False) -> Dict:
+    """Runs one case on a fresh plugin with its stages timed.
+    Tracing memory slows down allocating a lot, so the times from a run with trace_memory on shouldn't be used."""
+    timer = StageTimer()
+    originals = {name: getattr(plugin_module, name) for name in FUNCTION_STAGES}
+    for name, stage in FUNCTION_STAGES.items():
+        setattr(plugin_module, name, timer.wrap(stage, originals[name]))
+    cache_dir = tempfile.TemporaryDirectory(prefix="calibration_shapes_benchmark_")
+    try:
+        plugin = plugin_module.CalibrationShapesReborn()
+        # An empty cache of its own, so every run builds its shapes and never touches Cura's
+        plugin._mesh_disk_cache = plugin_module.MeshDiskCache(cache_dir.name, plugin.DISK_CACHE_MAX_BYTES)
+        for name, stage in METHOD_STAGES.items():
+            setattr(plugin, name, timer.wrap(stage, getattr(plugin, name)))
+        scene = plugin_module.CuraApplication.getInstance().getController().getScene()
+        scene.children.clear()
+        gc.collect()
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        result = run(plugin)
+        wall = time.perf_counter() - start
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        for name, function in originals.items():
+            setattr(plugin_module, name, function)
+        cache_dir.cleanup()
+
+    meshes = [node.getMeshData() for node in scene.children]
+    if not meshes and result is not None:
+        meshes = [result]
+    stages = {stage: timer.totals.get(stage, 0.0) for stage in STAGES if stage != "build"}
+    stages["build"] = max(wall - sum(stages.values()), 0.0)
+    return {
+        "wall_ms": wall * 1000,
+        "stages_ms": {stage: stages[stage] * 1000 for stage in STAGES},
+        "triangles": sum(mesh.getFaceCount() for mesh in meshes),
+        "nodes": len(scene.children),
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+def measure_case(plugin_module: types.ModuleType, run: Callable, repeat: int, trace_memory: bool = True) -> Dict:
+    """The fastest of repeat runs of a case, with the peak memory of one more run if trace_memory is on."""
+    best = min((run_case(plugin_module, run) for _ in range(max(repeat, 1))), key=lambda result: result["wall_ms"])
+    if trace_memory:
+        best["peak_memory_kib"] = run_case(plugin_module, run, trace_memory=True)["peak_memory_kib"]
+    return best
+
+
+def write_report(path: str, results: Dict[str, Dict], repeat: int) -> None:
+    """Writes the results of each case to path as JSON, along with what they were run on."""
+    with open(path, "w") as output_file:
+        json.dump({
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "cases": results,
+        }, output_file, indent=2)
+
+
+def pytest_generate_tests(metafunc) -> None:
+    """Makes every case a test of its own, so python -m pytest tools/benchmark.py runs them all."""
+    if "case" in metafunc.fixturenames:
+        cases = find_cases(import_plugin())
+        metafunc.parametrize("case", cases, ids=[name for name, _ in cases])
+
+
+def test_case(case: Tuple[str, Callable], benchmark_results: Optional[Dict[str, Dict]]) -> None:
+    """Each case has to make some triangles and account for its time in every stage. If BENCHMARK_BASELINE
+    is set to the JSON file from an earlier run, it also can't be more than BENCHMARK_SLOWDOWN (default 1.5)
+    times slower than it was then. The result goes in benchmark_results if there's a report to write."""
+    name, run = case
+    plugin_module = import_plugin()
+    result = measure_case(plugin_module, run, PYTEST_REPEAT, trace_memory=benchmark_results is not None)
+    assert result["triangles"] > 0, f"{name} didn't make anything"
+    assert set(result["stages_ms"]) == set(STAGES), f"{name} has times for {sorted(result['stages_ms'])}"
+    negative = {stage: ms for stage, ms in result["stages_ms"].items() if ms < 0}
+    assert not negative, f"{name} spent negative time in {negative}"
+    if benchmark_results is not None:
+        benchmark_results[name] = result
+
+    baseline_path = os.environ.get("BENCHMARK_BASELINE")
+    if baseline_path:
+        with open(baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)["cases"].get(name)
+        slowdown = float(os.environ.get("BENCHMARK_SLOWDOWN", 1.5))
+        if baseline is not None:
+            assert result["wall_ms"] <= baseline["wall_ms"] * slowdown, \
+                f"{name} took {result['wall_ms']:.2f} ms, up from {baseline['wall_ms']:.2f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark.json", help="where to write the results")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest is kept")
+    parser.add_argument("--filter", default="", help="only run cases with this in their name")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--slowdown", type=float, default=1.5, help="how much slower than the baseline is a regression")
+    args = parser.parse_args()
+
+    plugin_module = import_plugin()
+    results = {}
+    print(f"{'case':62s} {'tris':>7s} {'wall ms':>8s} " + " ".join(f"{stage:>7s}" for stage in STAGES) + f" {'peak KiB':>9s}")
+    for name, run in find_cases(plugin_module):
+        if args.filter not in name:
+            continue
+        best = measure_case(plugin_module, run, args.repeat)
+        results[name] = best
+        print(f"{name:62s} {best['triangles']:7d} {best['wall_ms']:8.2f} "
+              + " ".join(f"{best['stages_ms'][stage]:7.2f}" for stage in STAGES) + f" {best['peak_memory_kib']:9.0f}")
+
+    write_report(args.output, results, args.repeat)
+    print(f"Wrote {len(results)} cases to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["cases"]
+        regressions = [(name, baseline[name]["wall_ms"], result["wall_ms"]) for name, result in results.items()
+                       if name in baseline and result["wall_ms"] > baseline[name]["wall_ms"] * args.slowdown]
+        for name, before, after in regressions:
+            print(f"Slower: {name} {before:.2f} ms -> {after:.2f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
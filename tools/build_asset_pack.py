@@ -0,0 +1,52 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Build step which packs every STL in models/ into a single pack file.
+Reduced models from tools/decimate_models.py are packed too, if it's been run first.
+
+Usage: python tools/build_asset_pack.py [--remove-packed] [output_path]
+Needs numpy and trimesh. The plugin falls back to the raw STL files for anything not in the pack.
+--remove-packed deletes the STL files that made it into the pack afterwards, so a release package
+doesn't carry every model twice. Don't use it on a checkout, as the STLs are what the pack is made from.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PLUGIN_DIR)
+
+from AssetPack import PACK_FILENAME, REDUCED_MODELS_DIR, build_pack  # noqa: E402
+
+
+def main() -> None:
+    models_dir = os.path.join(PLUGIN_DIR, "models")
+    parser = argparse.ArgumentParser(description="Packs the bundled models into one file.")
+    parser.add_argument("output_path", nargs="?", default=os.path.join(models_dir, PACK_FILENAME))
+    parser.add_argument("--remove-packed", action="store_true", help="delete the STL files that were packed")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    triangle_counts = build_pack(models_dir, args.output_path)
+    elapsed = time.perf_counter() - start
+
+    stl_bytes = sum(os.path.getsize(os.path.join(models_dir, *filename.split("/"))) for filename in triangle_counts)
+    pack_bytes = os.path.getsize(args.output_path)
+    for filename, triangles in triangle_counts.items():
+        print(f"{filename:60s} {triangles:8d} triangles")
+    print(f"Packed {len(triangle_counts)} models in {elapsed:.2f} s: "
+          f"{stl_bytes / 1024:.0f} KiB of STL -> {pack_bytes / 1024:.0f} KiB at {args.output_path}")
+
+    if args.remove_packed:
+        for filename in triangle_counts:
+            os.remove(os.path.join(models_dir, *filename.split("/")))
+        reduced_dir = os.path.join(models_dir, REDUCED_MODELS_DIR)
+        if os.path.isdir(reduced_dir) and not os.listdir(reduced_dir):
+            os.rmdir(reduced_dir)
+        print(f"Removed {len(triangle_counts)} packed STL files ({stl_bytes / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""pytest options for python -m pytest tools/benchmark.py. They have to be here, as pytest
+only takes options from conftest files and plugins."""
+
+from typing import Dict, Optional
+
+import pytest
+
+from benchmark import PYTEST_REPEAT, write_report
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption("--benchmark-json", metavar="PATH",
+                     help="write every case's timings to PATH, in the same form as tools/benchmark.py --output")
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request) -> Optional[Dict[str, Dict]]:
+    """{case name: result} to be written to --benchmark-json once every case has run, or None without it."""
+    path = request.config.getoption("benchmark_json")
+    if path is None:
+        yield None
+        return
+    results = {}
+    yield results
+    write_report(path, results, PYTEST_REPEAT)
@@ -0,0 +1,282 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Build step which makes reduced detail versions of the bundled models.
+
+Usage: python tools/decimate_models.py [--tolerance 0.005] [--report report.json] [model.stl ...]
+
+Several models came out of OpenSCAD with far more facets than a slicer can use ($fn=150 and the like).
+Each one is decimated by collapsing edges for as long as every vertex stays within the tolerance (mm)
+of the planes of all the original faces it has absorbed, and written to models/reduced/ as a binary STL
+if that saves at least MIN_REDUCTION of its triangles. The deviation of every original vertex from the
+reduced surface is then measured to make sure.
+
+Needs numpy and trimesh. Run it before tools/build_asset_pack.py so the reduced models get packed too.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PLUGIN_DIR)
+
+from AssetPack import REDUCED_MODELS_DIR  # noqa: E402
+from StlReader import read_binary_stl  # noqa: E402
+
+DEFAULT_TOLERANCE = 0.005
+# Models which don't lose at least this fraction of their triangles aren't worth a second copy
+MIN_REDUCTION = 0.1
+# Faces around a collapse can't turn further than this, so the surface can't fold over
+MIN_NORMAL_DOT = 0.2
+
+
+def decimate(vertices: numpy.ndarray, faces: numpy.ndarray, tolerance: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Collapses edges of a mesh with welded vertices while the error stays within tolerance.
+
+    Every collapse moves a vertex u onto its neighbour v (a half edge collapse, so no new positions
+    are made up). Each vertex remembers the original faces and vertices it has taken over. A collapse
+    is only allowed while v is within tolerance of the planes of all those faces, and all those
+    vertices are within tolerance of the faces around v afterwards. The second test stops corners
+    sliding along creases, which the planes alone can't see.
+    Vertices on open edges are never moved. Returns the new (vertices, faces).
+    """
+    vertices = numpy.asarray(vertices, dtype=numpy.float64)
+    faces = numpy.array(faces, dtype=numpy.int64)
+    vertex_count = len(vertices)
+
+    corners = vertices[faces]
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = numpy.linalg.norm(normals, axis=1)
+    planes = numpy.zeros((len(faces), 4))
+    valid = lengths > 1e-12  # Slivers with no area don't define a plane
+    planes[valid, :3] = normals[valid] / lengths[valid, None]
+    planes[valid, 3] = -numpy.einsum("ij,ij->i", planes[valid, :3], corners[valid, 0])
+    vertex_faces: List[Set[int]] = [set() for _ in range(vertex_count)]
+    for face, corner_vertices in enumerate(faces.tolist()):
+        for vertex in corner_vertices:
+            vertex_faces[vertex].add(face)
+    # Original faces whose planes each vertex has to stay close to, and original vertices that have to stay close to it
+    vertex_planes: List[Set[int]] = [set(faces_around) for faces_around in vertex_faces]
+    vertex_points: List[Set[int]] = [{vertex} for vertex in range(vertex_count)]
+
+    # Edges used by one face are on the boundary of an open mesh
+    edges = numpy.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    unique_edges, edge_uses = numpy.unique(edges, axis=0, return_counts=True)
+    locked = numpy.zeros(vertex_count, dtype=bool)
+    locked[unique_edges[edge_uses != 2].reshape(-1)] = True
+
+    face_alive = numpy.ones(len(faces), dtype=bool)
+    vertex_alive = numpy.ones(vertex_count, dtype=bool)
+    version = numpy.zeros(vertex_count, dtype=numpy.int64)
+    homogeneous = numpy.hstack((vertices, numpy.ones((vertex_count, 1))))
+
+    def neighbours(vertex: int) -> Set[int]:
+        found = set()
+        for face in vertex_faces[vertex]:
+            found.update(faces[face].tolist())
+        found.discard(vertex)
+        return found
+
+    heap = []  # (cost, u, v, version of u, version of v)
+
+    def push(u: int, v: int) -> None:
+        if locked[u]:
+            return
+        cost = float(numpy.abs(planes[list(vertex_planes[u] | vertex_planes[v])] @ homogeneous[v]).max())
+        if cost <= tolerance:
+            heapq.heappush(heap, (cost, u, v, int(version[u]), int(version[v])))
+
+    for u, v in unique_edges[edge_uses == 2].tolist():
+        push(u, v)
+        push(v, u)
+
+    def can_collapse(u: int, v: int) -> bool:
+        shared_faces = [face for face in vertex_faces[u] if v in faces[face]]
+        if len(shared_faces) != 2:
+            return False
+        # Link condition: only the two vertices opposite the edge can be shared, otherwise it pinches
+        if len(neighbours(u) & neighbours(v)) != 2:
+            return False
+        fan = [vertices[faces[face]] for face in vertex_faces[v] if face not in shared_faces]
+        for face in vertex_faces[u]:
+            if face in shared_faces:
+                continue
+            old_corners = vertices[faces[face]]
+            new_corners = old_corners.copy()
+            new_corners[faces[face] == u] = vertices[v]
+            old_normal = numpy.cross(old_corners[1] - old_corners[0], old_corners[2] - old_corners[0])
+            new_normal = numpy.cross(new_corners[1] - new_corners[0], new_corners[2] - new_corners[0])
+            new_length = numpy.linalg.norm(new_normal)
+            old_length = numpy.linalg.norm(old_normal)
+            if new_length < 1e-12:
+                return False
+            if old_length > 1e-12 and numpy.dot(old_normal, new_normal) < MIN_NORMAL_DOT * old_length * new_length:
+                return False
+            fan.append(new_corners)
+        points = vertices[list(vertex_points[u] | vertex_points[v])]
+        return bool(point_triangle_distances(points, numpy.array(fan)).max() <= tolerance)
+
+    while heap:
+        cost, u, v, u_version, v_version = heapq.heappop(heap)
+        if not (vertex_alive[u] and vertex_alive[v]) or version[u] != u_version or version[v] != v_version:
+            continue  # Stale
+        if not can_collapse(u, v):
+            continue
+
+        for face in list(vertex_faces[u]):
+            corner_vertices = faces[face]
+            if v in corner_vertices:
+                face_alive[face] = False
+                for vertex in corner_vertices.tolist():
+                    vertex_faces[vertex].discard(face)
+            else:
+                corner_vertices[corner_vertices == u] = v
+                vertex_faces[v].add(face)
+        vertex_faces[u] = set()
+        vertex_alive[u] = False
+        vertex_planes[v] |= vertex_planes[u]
+        vertex_planes[u] = set()
+        vertex_points[v] |= vertex_points[u]
+        vertex_points[u] = set()
+
+        version[v] += 1
+        for neighbour in neighbours(v):
+            version[neighbour] += 1
+        for neighbour in neighbours(v):
+            push(v, neighbour)
+            push(neighbour, v)
+            # Edges of the neighbours are no longer in the heap with their current version
+            for other in neighbours(neighbour):
+                if other != v:
+                    push(neighbour, other)
+                    push(other, neighbour)
+
+    faces = faces[face_alive]
+    used, faces = numpy.unique(faces, return_inverse=True)
+    return vertices[used], faces.reshape(-1, 3)
+
+
+def point_triangle_distances(points: numpy.ndarray, triangles: numpy.ndarray, chunk_size: int = 256) -> numpy.ndarray:
+    """Distance from each point to the closest of the triangles (n, 3, 3), by brute force.
+    Follows the closest point on triangle regions from Ericson's Real-Time Collision Detection."""
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, ac = b - a, c - a
+    result = numpy.empty(len(points))
+    for start in range(0, len(points), chunk_size):
+        p = points[start:start + chunk_size, None, :]
+        ap, bp, cp = p - a, p - b, p - c
+        d1 = numpy.einsum("ijk,jk->ij", ap, ab)
+        d2 = numpy.einsum("ijk,jk->ij", ap, ac)
+        d3 = numpy.einsum("ijk,jk->ij", bp, ab)
+        d4 = numpy.einsum("ijk,jk->ij", bp, ac)
+        d5 = numpy.einsum("ijk,jk->ij", cp, ab)
+        d6 = numpy.einsum("ijk,jk->ij", cp, ac)
+        va = d3 * d6 - d5 * d4
+        vb = d5 * d2 - d1 * d6
+        vc = d1 * d4 - d3 * d2
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            # Inside the face
+            denominator = va + vb + vc
+            v = vb / denominator
+            w = vc / denominator
+            closest = a + v[..., None] * ab + w[..., None] * ac
+            # Edges
+            edge_bc = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+            t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+            closest = numpy.where(edge_bc[..., None], b + t[..., None] * (c - b), closest)
+            edge_ac = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+            t = d2 / (d2 - d6)
+            closest = numpy.where(edge_ac[..., None], a + t[..., None] * ac, closest)
+            edge_ab = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+            t = d1 / (d1 - d3)
+            closest = numpy.where(edge_ab[..., None], a + t[..., None] * ab, closest)
+        # Corners
+        closest = numpy.where(((d6 >= 0) & (d5 <= d6))[..., None], c, closest)
+        closest = numpy.where(((d3 >= 0) & (d4 <= d3))[..., None], b, closest)
+        closest = numpy.where(((d1 <= 0) & (d2 <= 0))[..., None], a, closest)
+
+        distances = numpy.linalg.norm(p - closest, axis=2)
+        result[start:start + chunk_size] = numpy.nanmin(distances, axis=1)
+    return result
+
+
+def insert_time(path: str, repeats: int = 5) -> Optional[float]:
+    """Best time in ms to read a binary STL and lay it down the way the plugin does, or None if it isn't binary."""
+    if read_binary_stl(path) is None:
+        return None
+    lay_down = numpy.array([[1, 0, 0], [0, 0, 1], [0, -1, 0]], dtype=numpy.float32)
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        triangles, normals = read_binary_stl(path)
+        numpy.matmul(triangles, lay_down.T, dtype=numpy.float32).reshape(-1, 3)
+        numpy.repeat(numpy.matmul(normals, lay_down.T, dtype=numpy.float32), 3, axis=0)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    import trimesh
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="largest allowed deviation in mm")
+    parser.add_argument("--report", help="also write the report to this JSON file")
+    parser.add_argument("models", nargs="*", help="STL files in models/ to reduce (default: all of them)")
+    args = parser.parse_args()
+
+    models_dir = os.path.join(PLUGIN_DIR, "models")
+    output_dir = os.path.join(models_dir, REDUCED_MODELS_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    filenames = args.models or sorted(filename for filename in os.listdir(models_dir) if filename.lower().endswith(".stl"))
+
+    report: Dict = {"tolerance_mm": args.tolerance, "models": {}}
+    print(f"{'model':56s} {'triangles':>17s} {'KiB':>13s} {'insert ms':>13s} {'max dev mm':>10s}")
+    for filename in filenames:
+        source_path = os.path.join(models_dir, filename)
+        output_path = os.path.join(output_dir, filename)
+        start = time.perf_counter()
+        mesh = trimesh.load(source_path)
+        vertices, faces = decimate(mesh.vertices, mesh.faces, args.tolerance)
+        elapsed = time.perf_counter() - start
+
+        reduction = 1 - len(faces) / len(mesh.faces)
+        if reduction < MIN_REDUCTION:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            print(f"{filename:56s} {len(mesh.faces):8d} (kept, only {reduction:.0%} smaller)")
+            report["models"][filename] = {"triangles": len(mesh.faces), "reduced": False}
+            continue
+
+        reduced = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        reduced.export(output_path, file_type="stl")
+        deviation = float(point_triangle_distances(mesh.vertices, reduced.triangles).max())
+        before_bytes, after_bytes = os.path.getsize(source_path), os.path.getsize(output_path)
+        before_ms, after_ms = insert_time(source_path), insert_time(output_path)
+        before_text = "ascii" if before_ms is None else f"{before_ms:5.2f}"
+        print(f"{filename:56s} {len(mesh.faces):8d} -> {len(faces):6d} {before_bytes / 1024:5.0f} -> {after_bytes / 1024:4.0f} "
+              f"{before_text} -> {after_ms:4.2f} {deviation:10.5f}")
+        report["models"][filename] = {
+            "reduced": True,
+            "triangles": [len(mesh.faces), len(faces)],
+            "bytes": [before_bytes, after_bytes],
+            "insert_ms": [before_ms, after_ms],
+            "max_deviation_mm": deviation,
+            "decimation_s": elapsed,
+            "watertight": [bool(mesh.is_watertight), bool(reduced.is_watertight)],
+        }
+
+    if args.report:
+        with open(args.report, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# Calibration Shapes Reborn by Slashee the Cow
+# Copyright 2025
+
+"""Makes calibration shapes from a manifest without Cura, for slicing them from the command line.
+
+Usage: python tools/generate_shapes.py manifest.json|manifest.toml [--output dir] [--format stl|3mf] [--jobs N]
+
+The manifest lists the shapes to make and where to put them. In TOML:
+    output = "calibration"      # Directory for the files, relative to the manifest (default: next to it)
+    format = "stl"              # "stl" (binary) or "3mf"
+    curve_tolerance = 0.01      # How far round shapes' facets can be from a true curve in mm
+
+    [[shapes]]
+    shape = "bridging_tube"
+    name = "bridging_tube_30"   # File name without the extension (default: the shape and its number)
+    outer_diameter = 30
+    inner_diameter = 26
+    height = 10
+    roof_height = 2
+
+JSON is the same thing as an object with a "shapes" list. The shapes and their parameters are in SHAPES,
+and are made by the same generators as in Cura. "model" is any file in models/, from the asset pack if it's
+in there. Everything is in millimetres, Z up, with the bottom on Z = 0.
+
+Shapes are made in parallel on a process pool. The time each took and the throughput of the whole run
+in shapes per second are printed at the end. Needs numpy, and trimesh for spheres and ASCII models.
+TOML manifests need Python 3.11 or newer.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PLUGIN_DIR)
+
+import ShapeGenerators  # noqa: E402
+from AssetPack import PACK_FILENAME, REDUCED_MODELS_DIR, AssetPack  # noqa: E402
+from StlReader import STL_HEADER_SIZE, STL_RECORD, read_binary_stl  # noqa: E402
+
+# Same as Normal curve quality with a 0.4 mm nozzle
+DEFAULT_CURVE_TOLERANCE = 0.4 / 40
+# Same as CalibrationShapesReborn.HOLE_TEST_MAX_HOLES
+HOLE_TEST_MAX_HOLES = 40
+
+# Shape -> the parameters it needs
+SHAPES = {
+    "box": ("width", "depth", "height"),
+    "cylinder": ("diameter", "height"),
+    "tube": ("outer_diameter", "inner_diameter", "height"),
+    "cone": ("diameter", "height"),
+    "sphere": ("diameter",),
+    "bridging_box": ("width", "depth", "wall_width", "height", "roof_height"),
+    "bridging_tube": ("outer_diameter", "inner_diameter", "height", "roof_height"),
+    "bridging_triangle": ("width", "depth", "wall_width", "height", "roof_height"),
+    "bridging_hexagon": ("outer_diameter", "inner_diameter", "height", "roof_height"),
+    "bridging_star": ("outer_diameter", "inner_diameter", "height", "roof_height"),
+    "hole_test": ("min_diameter", "max_diameter", "step", "wall_width", "height"),
+    "bed_level": ("machine_width", "machine_depth"),
+    "model": ("file",),
+}
+
+Mesh = Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]  # (vertices, faces, face normals)
+
+
+def read_manifest(path: str) -> Dict:
+    if path.lower().endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as manifest_file:
+            manifest = tomllib.load(manifest_file)
+    else:
+        with open(path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    if not isinstance(manifest.get("shapes"), list) or not manifest["shapes"]:
+        raise ValueError(f"{path} doesn't have a list of shapes")
+    for index, shape in enumerate(manifest["shapes"]):
+        kind = shape.get("shape")
+        if kind not in SHAPES:
+            raise ValueError(f"Shape {index + 1} in {path} is {kind!r}, which isn't one of {', '.join(SHAPES)}")
+        missing = [name for name in SHAPES[kind] if name not in shape]
+        if missing:
+            raise ValueError(f"Shape {index + 1} in {path} ({kind}) needs {', '.join(missing)}")
+    return manifest
+
+
+def generate(shape: Dict, curve_tolerance: float) -> Mesh:
+    """Makes one shape from the manifest, as Z-up (vertices, faces, face normals)."""
+    kind = shape["shape"]
+
+    def sections(radius: float) -> int:
+        return ShapeGenerators.segments_for_radius(radius, curve_tolerance)
+
+    if kind == "box":
+        return ShapeGenerators.box(shape["width"], shape["depth"], shape["height"])
+    if kind == "cylinder":
+        return ShapeGenerators.cylinder(shape["diameter"] / 2, shape["height"], sections(shape["diameter"] / 2))
+    if kind == "tube":
+        return ShapeGenerators.tube(shape["outer_diameter"] / 2, shape["inner_diameter"] / 2, shape["height"],
+                                    sections(shape["outer_diameter"] / 2))
+    if kind == "cone":
+        return ShapeGenerators.cone(shape["diameter"] / 2, shape["height"], sections(shape["diameter"] / 2))
+    if kind == "sphere":
+        import trimesh
+        radius = shape["diameter"] / 2
+        icosphere = trimesh.creation.icosphere(subdivisions=ShapeGenerators.sphere_subdivisions(radius, curve_tolerance),
+                                               radius=radius)
+        vertices = icosphere.vertices + (0, 0, radius)
+        return vertices.astype(numpy.float32), icosphere.faces.astype(numpy.int32), icosphere.face_normals.astype(numpy.float32)
+    if kind == "bridging_box":
+        return ShapeGenerators.capped_prism(ShapeGenerators.rectangle(shape["width"], shape["depth"]),
+                                            shape["wall_width"], shape["height"], shape["roof_height"])
+    if kind == "bridging_tube":
+        return ShapeGenerators.capped_tube(shape["outer_diameter"], shape["inner_diameter"], shape["height"],
+                                           shape["roof_height"], sections(shape["outer_diameter"] / 2))
+    if kind == "bridging_triangle":
+        return ShapeGenerators.capped_prism(ShapeGenerators.right_triangle(shape["width"], shape["depth"]),
+                                            shape["wall_width"], shape["height"], shape["roof_height"])
+    if kind in ("bridging_hexagon", "bridging_star"):
+        if kind == "bridging_star":
+            outline = ShapeGenerators.star_polygon(5, shape["outer_diameter"] / 2, shape["outer_diameter"] / 4)
+        else:
+            outline = ShapeGenerators.regular_polygon(6, shape["outer_diameter"] / 2)
+        wall_width = (shape["outer_diameter"] - shape["inner_diameter"]) / 2
+        return ShapeGenerators.capped_prism(outline, wall_width, shape["height"], shape["roof_height"])
+    if kind == "hole_test":
+        diameters = ShapeGenerators.stepped_values(shape["min_diameter"], shape["max_diameter"], shape["step"],
+                                                   HOLE_TEST_MAX_HOLES)
+        segments = [sections(diameter / 2 + shape["wall_width"]) for diameter in diameters]
+        return ShapeGenerators.hole_test(numpy.array(diameters), shape["wall_width"], shape["height"], numpy.array(segments))
+    if kind == "bed_level":
+        # Scaled to the bed the same way as in _add_bed_level_calibration
+        width, depth = shape["machine_width"], shape["machine_depth"]
+        if width / depth > 1.15 or depth / width > 1.15:
+            factors = (round(width / 100, 1), round(depth / 100, 1), 1.0)
+        else:
+            factors = (int(width / 100), int(depth / 100), 1.0)
+        vertices, faces, face_normals = load_model("ParametricBedLevel.stl")
+        face_normals = face_normals / numpy.asarray(factors)
+        face_normals /= numpy.linalg.norm(face_normals, axis=1, keepdims=True)
+        return vertices * numpy.asarray(factors, dtype=numpy.float32), faces, face_normals.astype(numpy.float32)
+    return load_model(shape["file"])
+
+
+_asset_pack: Optional[AssetPack] = None
+
+
+def load_model(filename: str) -> Mesh:
+    """One of the bundled models, from the asset pack if it's packed. filename can be in models/reduced too."""
+    global _asset_pack
+    if _asset_pack is None:
+        _asset_pack = AssetPack(os.path.join(PLUGIN_DIR, "models", PACK_FILENAME))
+    packed = _asset_pack.get(filename)
+    if packed is not None:
+        return packed
+    path = os.path.join(PLUGIN_DIR, "models", filename)
+    if not os.path.isfile(path):
+        raise ValueError(f"There's no model called {filename} in models/ or models/{REDUCED_MODELS_DIR}/")
+    stl = read_binary_stl(path)
+    if stl is not None:
+        triangles, facet_normals = stl
+        # Some exporters write zeros instead of normals, in which case they come from the winding
+        if not numpy.allclose(numpy.einsum("ij,ij->i", facet_normals, facet_normals), 1.0, atol=1e-3):
+            facet_normals = None
+        vertices = numpy.asarray(triangles, dtype=numpy.float32).reshape(-1, 3)
+        faces = numpy.arange(len(vertices), dtype=numpy.int32).reshape(-1, 3)
+        if facet_normals is None:
+            facet_normals = winding_normals(vertices, faces)
+        return vertices, faces, numpy.asarray(facet_normals, dtype=numpy.float32)
+    import trimesh
+    mesh = trimesh.load(path)
+    return mesh.vertices.astype(numpy.float32), mesh.faces.astype(numpy.int32), mesh.face_normals.astype(numpy.float32)
+
+
+def winding_normals(vertices: numpy.ndarray, faces: numpy.ndarray) -> numpy.ndarray:
+    corners = vertices[faces].astype(numpy.float64)
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+    lengths[lengths == 0] = 1.0
+    return (normals / lengths).astype(numpy.float32)
+
+
+def write_stl(path: str, vertices: numpy.ndarray, faces: numpy.ndarray, face_normals: numpy.ndarray) -> None:
+    records = numpy.zeros(len(faces), dtype=STL_RECORD)
+    records["normal"] = face_normals
+    records["vertices"] = vertices[faces]
+    with open(path, "wb") as stl_file:
+        stl_file.write(b"Calibration Shapes Reborn".ljust(STL_HEADER_SIZE, b" "))
+        stl_file.write(numpy.uint32(len(faces)).astype("<u4").tobytes())
+        stl_file.write(records.tobytes())
+
+
+_3MF_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>"""
+
+_3MF_RELATIONSHIPS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>"""
+
+
+def write_3mf(path: str, vertices: numpy.ndarray, faces: numpy.ndarray, face_normals: numpy.ndarray) -> None:
+    """3MF has no normals, only the winding, which the generators already get right.
+    Corners in the same place become one vertex, since slicers expect the mesh to be closed."""
+    vertices, merged = numpy.unique(vertices, axis=0, return_inverse=True)
+    faces = merged.reshape(-1)[faces]
+    vertex_lines = "\n".join(f'<vertex x="{x:.6g}" y="{y:.6g}" z="{z:.6g}"/>' for x, y, z in vertices.tolist())
+    triangle_lines = "\n".join(f'<triangle v1="{a}" v2="{b}" v3="{c}"/>' for a, b, c in faces.tolist())
+    model = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">\n'
+             '<resources>\n<object id="1" type="model">\n<mesh>\n'
+             f'<vertices>\n{vertex_lines}\n</vertices>\n<triangles>\n{triangle_lines}\n</triangles>\n'
+             '</mesh>\n</object>\n</resources>\n<build>\n<item objectid="1"/>\n</build>\n</model>\n')
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _3MF_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _3MF_RELATIONSHIPS)
+        archive.writestr("3D/3dmodel.model", model)
+
+
+WRITERS = {"stl": write_stl, "3mf": write_3mf}
+
+
+def make_shape(shape: Dict, path: str, file_format: str, curve_tolerance: float) -> Tuple[int, float]:
+    """Makes one shape and writes it to path. Runs in a worker process. Returns (triangles, seconds)."""
+    start = time.perf_counter()
+    vertices, faces, face_normals = generate(shape, curve_tolerance)
+    WRITERS[file_format](path, numpy.asarray(vertices, dtype=numpy.float32), numpy.asarray(faces, dtype=numpy.int32),
+                         numpy.asarray(face_normals, dtype=numpy.float32))
+    return len(faces), time.perf_counter() - start
+
+
+def output_names(shapes: List[Dict]) -> List[str]:
+    names = []
+    for index, shape in enumerate(shapes):
+        name = str(shape.get("name") or f"{shape['shape']}_{index + 1}")
+        if name in names:
+            raise ValueError(f"More than one shape is called {name}")
+        names.append(name)
+    return names
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", help="JSON or TOML file listing the shapes")
+    parser.add_argument("--output", help="directory for the files (overrides the manifest)")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="file format (overrides the manifest)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    try:
+        manifest = read_manifest(args.manifest)
+        names = output_names(manifest["shapes"])
+    except (OSError, ValueError) as e:
+        print(f"Couldn't read {args.manifest}: {e}", file=sys.stderr)
+        return 2
+    file_format = (args.format or manifest.get("format", "stl")).lower()
+    if file_format not in WRITERS:
+        print(f"Unknown format {file_format}, it can be {' or '.join(sorted(WRITERS))}", file=sys.stderr)
+        return 2
+    output_dir = os.path.normpath(args.output or os.path.join(os.path.dirname(os.path.abspath(args.manifest)),
+                                                              manifest.get("output", ".")))
+    os.makedirs(output_dir, exist_ok=True)
+    curve_tolerance = float(manifest.get("curve_tolerance", DEFAULT_CURVE_TOLERANCE))
+
+    failures = 0
+    total_triangles = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {}
+        for shape, name in zip(manifest["shapes"], names):
+            path = os.path.join(output_dir, f"{name}.{file_format}")
+            futures[pool.submit(make_shape, shape, path, file_format, curve_tolerance)] = (name, path)
+        for future in as_completed(futures):
+            name, path = futures[future]
+            try:
+                triangles, seconds = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"{name:40s} failed: {e}", file=sys.stderr)
+                continue
+            total_triangles += triangles
+            print(f"{name:40s} {triangles:8d} triangles {seconds * 1000:8.1f} ms  {path}")
+    elapsed = time.perf_counter() - start
+
+    made = len(names) - failures
+    print(f"Made {made} of {len(names)} shapes ({total_triangles} triangles) in {elapsed:.2f} s: "
+          f"{made / elapsed:.1f} shapes/s, {total_triangles / elapsed / 1000:.0f}k triangles/s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())